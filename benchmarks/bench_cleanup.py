@@ -0,0 +1,53 @@
+"""Compare cleanup with the three regular expressions it replaced."""
+
+import re
+from typing import List
+
+from common import best_of
+from synthetic import synthetic_page
+
+from intradel_my_container.functions import cleanup, make_soup
+
+ROWS: int = 10_000
+
+
+def regex_cleanup(string: str) -> str:
+    """
+    The former cleanup, with three re.sub calls.
+
+    Parameters:
+    ----------
+    string : str
+        The input string to be cleaned up.
+
+    Returns:
+    -------
+    str
+        The cleaned up string.
+    """
+
+    to_return: str = re.sub("\t+|\n+|\r+", " ", string.strip())
+    to_return = re.sub(r"\s+", " ", to_return.strip())
+    to_return = re.sub(" , ", ", ", to_return.strip())
+    return to_return
+
+
+def main() -> None:
+    """
+    Print the time of both versions over every 'td' and 'p' text of a synthetic page.
+    """
+
+    soup = make_soup(synthetic_page(ROWS))
+    cells: List[str] = [tag.text for tag in soup.find_all(["td", "p"])]
+    assert [cleanup(cell) for cell in cells] == [regex_cleanup(cell) for cell in cells]
+
+    before: float = best_of(lambda: [regex_cleanup(cell) for cell in cells], 1, 5)
+    after: float = best_of(lambda: [cleanup(cell) for cell in cells], 1, 5)
+    print(
+        f"{len(cells)} cells   re.sub {before * 1000:7.1f} ms"
+        f"   cleanup {after * 1000:7.1f} ms   {before / after:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
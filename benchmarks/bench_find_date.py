@@ -0,0 +1,65 @@
+"""Compare find_date with the regular expression and strptime it replaced."""
+
+import random
+import re
+from datetime import datetime, timedelta
+from typing import List
+
+from common import best_of
+
+from intradel_my_container.functions import find_date
+
+CELLS: int = 100_000
+
+
+def strptime_find_date(string: str) -> datetime:
+    """
+    The former find_date, always searching the date and calling strptime.
+
+    Parameters:
+    ----------
+    string : str
+        The input string where the date is to be found.
+
+    Returns:
+    -------
+    datetime
+        A datetime object representing the extracted date.
+    """
+
+    search = re.search(r"(\d\d-\d\d-\d\d\d\d)", string)
+    if search is None:
+        return datetime.strptime("01-01-1970", "%d-%m-%Y")
+    return datetime.strptime(search.group(1), "%d-%m-%Y")
+
+
+def main() -> None:
+    """
+    Print the time per call of both versions, on table cells and on sentences.
+    """
+
+    generator = random.Random(0)
+    first_day = datetime(1994, 1, 1)
+    # About one pickup a week for thirty years, in both bins.
+    cells: List[str] = [
+        (first_day + timedelta(days=generator.randrange(30 * 365))).strftime("%d-%m-%Y")
+        for _ in range(CELLS)
+    ]
+    sentences: List[str] = [f"Depuis le {cell}" for cell in cells]
+
+    for name, strings in [("table cells", cells), ("sentences", sentences)]:
+        assert [find_date(string) for string in strings] == [
+            strptime_find_date(string) for string in strings
+        ]
+        before: float = best_of(
+            lambda: [strptime_find_date(string) for string in strings], 1, 3
+        )
+        after: float = best_of(lambda: [find_date(string) for string in strings], 1, 3)
+        print(
+            f"{name:<12} strptime {before / CELLS * 1e9:7.0f} ns"
+            f"   find_date {after / CELLS * 1e9:7.0f} ns   {before / after:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
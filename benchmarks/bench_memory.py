@@ -0,0 +1,129 @@
+"""Measure the memory taken by each record, with and without slots."""
+
+import gc
+import tracemalloc
+from dataclasses import make_dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Type
+
+from intradel_my_container import Dropout, Material, Pickup, PickupSeries
+
+RECORDS: int = 100_000
+FIRST_ORDINAL: int = datetime(1994, 1, 1).toordinal()
+RAW_MATERIALS: str = "Bois (0.10 m³), Encombrants (0.15 m³), DSM (Autre) (1.00 pièce)"
+
+# The same records, keeping their attributes in a __dict__.
+DictPickup = make_dataclass("DictPickup", [("date", datetime), ("kilograms", float)])
+DictMaterial = make_dataclass(
+    "DictMaterial", [("name", str), ("quantity", float), ("unit", str)]
+)
+
+
+class DictDropout(Dropout):
+    """
+    Dropout keeping its attributes in a __dict__.
+    """
+
+
+def bytes_per_record(create: Callable[[int], Any]) -> float:
+    """
+    Measure the memory allocated per record.
+
+    Parameters:
+    ----------
+    create : Callable[[int], Any]
+        Creates the record of an index.
+
+    Returns:
+    -------
+    float
+        The allocated bytes per record.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    records: List[Any] = [create(index) for index in range(RECORDS)]
+    allocated: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return allocated / RECORDS
+
+
+def raw_materials() -> str:
+    """
+    Copy the raw string of materials, as the parser creates one per row.
+
+    Returns:
+    -------
+    str
+        A new string equal to RAW_MATERIALS.
+    """
+
+    return RAW_MATERIALS.encode().decode()
+
+
+def parsed_dropout(index: int, dropout_class: Type[Dropout] = Dropout) -> Dropout:
+    dropout = dropout_class(
+        datetime.fromordinal(FIRST_ORDINAL + index), "HUY", raw_materials()
+    )
+    dropout.materials  # pylint: disable=pointless-statement
+    return dropout
+
+
+def dropped_dropout(index: int) -> Dropout:
+    dropout = parsed_dropout(index)
+    dropout.drop_raw_materials()
+    return dropout
+
+
+def main() -> None:
+    """
+    Print the bytes per record of each representation.
+    """
+
+    def date(index: int) -> datetime:
+        return datetime.fromordinal(FIRST_ORDINAL + index)
+
+    comparisons = {
+        "Pickup": (
+            lambda index: DictPickup(date(index), 72.8 + index),
+            lambda index: Pickup(date(index), 72.8 + index),
+        ),
+        "Material": (
+            lambda index: DictMaterial("Bois", 0.1 + index, "m³"),
+            lambda index: Material("Bois", 0.1 + index, "m³"),
+        ),
+        "Dropout, not parsed": (
+            lambda index: DictDropout(date(index), "HUY", raw_materials()),
+            lambda index: Dropout(date(index), "HUY", raw_materials()),
+        ),
+        "Dropout, parsed": (
+            lambda index: parsed_dropout(index, DictDropout),
+            parsed_dropout,
+        ),
+        "Dropout, raw dropped": (
+            lambda index: parsed_dropout(index, DictDropout),
+            dropped_dropout,
+        ),
+    }
+    print(f"{'record':<22} {'__dict__':>10} {'slots':>10} {'saved':>8}")
+    for name, (dict_record, slotted_record) in comparisons.items():
+        before: float = bytes_per_record(dict_record)
+        after: float = bytes_per_record(slotted_record)
+        print(f"{name:<22} {before:10.0f} {after:10.0f} {1 - after / before:8.0%}")
+
+    pickups: List[Pickup] = [Pickup(date(index), 72.8) for index in range(RECORDS)]
+    gc.collect()
+    tracemalloc.start()
+    series = PickupSeries(pickups)
+    series_bytes: float = tracemalloc.get_traced_memory()[0] / RECORDS
+    tracemalloc.stop()
+    list_bytes: float = bytes_per_record(lambda index: Pickup(date(index), 72.8))
+    print(
+        f"{'Pickup in PickupSeries':<22} {list_bytes:10.0f} {series_bytes:10.0f}"
+        f" {1 - series_bytes / list_bytes:8.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
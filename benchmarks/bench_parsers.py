@@ -0,0 +1,26 @@
+"""Compare the HTML parser backends on the recorded Intradel page."""
+
+from importlib.util import find_spec
+
+from common import best_of, fixture_page_content, offline_container
+
+from intradel_my_container.const import INTRADEL_PARSER_LXML, INTRADEL_PARSERS
+
+
+def main() -> None:
+    """
+    Print the construction time of IntradelMyContainer for each installed backend.
+    """
+
+    page_content: bytes = fixture_page_content()
+
+    for parser in INTRADEL_PARSERS:
+        if parser == INTRADEL_PARSER_LXML and find_spec(parser) is None:
+            print(f"{parser:<12} not installed")
+            continue
+        seconds: float = best_of(lambda: offline_container(page_content, parser=parser))
+        print(f"{parser:<12} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Measure how parsing and aggregation scale with the number of rows of a page."""
+
+import json
+import os
+from importlib.util import find_spec
+from typing import Callable, Dict, List
+
+import typer
+from bs4 import Tag
+from common import best_of, offline_container, unmemoized
+from synthetic import synthetic_page
+from typing_extensions import Annotated
+
+from intradel_my_container import IntradelMyContainer, const
+from intradel_my_container.functions import make_soup, p_to_dictionary
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Slowdowns smaller than this are timer noise, whatever their ratio.
+NOISE_SECONDS: float = 0.001
+
+
+def section_tags(page_content: bytes) -> Dict[str, Tag]:
+    """
+    Find the post__content sections of a page, by title.
+
+    Parameters:
+    ----------
+    page_content : bytes
+        The page content as bytes.
+
+    Returns:
+    -------
+    Dict[str, Tag]
+        The section tags, by the text of their 'h3' tag.
+    """
+
+    sections: Dict[str, Tag] = {}
+    for content in make_soup(page_content).find_all(
+        const.INTRADEL_SECTION_TAG, class_=const.INTRADEL_SECTION_CLASS
+    ):
+        h3_tag = content.find_next("h3")
+        if h3_tag is not None:
+            sections[h3_tag.text] = content
+    return sections
+
+
+def build_sections(data: IntradelMyContainer) -> IntradelMyContainer:
+    """
+    Access every section, as they are only built on their first access.
+
+    Parameters:
+    ----------
+    data : IntradelMyContainer
+        The container.
+
+    Returns:
+    -------
+    IntradelMyContainer
+        The container, with its sections built.
+    """
+
+    for name in const.INTRADEL_SECTIONS.values():
+        getattr(data, name)
+    return data
+
+
+def measure(rows: int) -> Dict[str, float]:
+    """
+    Time every step of the parsing and the aggregates on a synthetic page.
+
+    Parameters:
+    ----------
+    rows : int
+        The number of rows of each table of the synthetic page.
+
+    Returns:
+    -------
+    Dict[str, float]
+        The best time of each step, in seconds.
+    """
+
+    repeat: int = 5 if rows <= 1_000 else 3 if rows <= 10_000 else 1
+    page_content: bytes = synthetic_page(rows)
+    data: IntradelMyContainer = offline_container(page_content)
+    sections: Dict[str, Tag] = section_tags(page_content)
+    organic_tag: Tag = sections[const.INTRADEL_ORGANIC_TITLE]
+    recyparc_tag: Tag = sections[const.INTRADEL_RECYPARC_TITLE]
+
+    steps: Dict[str, Callable[[], object]] = {}
+    for parser in const.INTRADEL_PARSERS:
+        if parser == const.INTRADEL_PARSER_LXML and find_spec(parser) is None:
+            continue
+        steps[f"construct[{parser}]"] = lambda parser=parser: build_sections(
+            offline_container(page_content, parser=parser)
+        )
+    steps.update(
+        {
+            "get_pickups": lambda: data.organic.get_pickups(organic_tag),
+            "get_dropouts": lambda: data.recyparc.get_dropouts(recyparc_tag),
+            "p_to_dictionary": lambda: p_to_dictionary(organic_tag),
+        }
+    )
+    for name in (
+        "total_collects",
+        "total_kilograms",
+        "total_collects_per_year",
+        "total_kilograms_per_year",
+    ):
+        steps[name] = unmemoized(getattr(data.organic, name), data.organic.pickups)
+
+    return {
+        name: best_of(step, number=1, repeat=repeat) for name, step in steps.items()
+    }
+
+
+def main(
+    sizes: Annotated[
+        List[int], typer.Option("--size", "-n", help="Rows per table.")
+    ] = [1_000, 10_000, 100_000],
+    save: Annotated[
+        bool, typer.Option("--save", help="Store the results as the new baseline.")
+    ] = False,
+    tolerance: Annotated[
+        float,
+        typer.Option("--tolerance", help="Allowed slowdown against the baseline."),
+    ] = 1.5,
+):
+    """
+    Run the scaling benchmark and compare it with benchmarks/baseline.json.
+    """
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results: Dict[str, Dict[str, float]] = dict(baseline)
+    regressions: int = 0
+
+    for rows in sizes:
+        print(f"{rows} rows")
+        results[str(rows)] = measure(rows)
+        for name, seconds in results[str(rows)].items():
+            reference: float = baseline.get(str(rows), {}).get(name, 0.0)
+            line: str = f"  {name:<28} {seconds * 1000:12.3f} ms"
+            if reference > 0:
+                ratio: float = seconds / reference
+                line += f" {ratio:6.2f}x baseline"
+                if ratio > tolerance and seconds - reference > NOISE_SECONDS:
+                    line += "  REGRESSION"
+                    regressions += 1
+            print(line)
+
+    if save:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+        print(f"Baseline saved to {BASELINE_PATH}")
+    elif regressions > 0:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,49 @@
+"""Compare parsing the whole page against parsing only the post__content sections."""
+
+import tracemalloc
+
+from common import best_of, fixture_page_content, offline_container
+
+
+def peak_memory(page_content: bytes, only_sections: bool) -> int:
+    """
+    Measure the peak memory allocated while building an IntradelMyContainer.
+
+    Parameters:
+    ----------
+    page_content : bytes
+        The page to parse.
+    only_sections : bool
+        Whether only the post__content sections are parsed.
+
+    Returns:
+    -------
+    int
+        The peak of allocated memory, in bytes.
+    """
+
+    tracemalloc.start()
+    offline_container(page_content, only_sections=only_sections)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    """
+    Print time and peak memory of a full and of a restricted parse.
+    """
+
+    page_content: bytes = fixture_page_content()
+
+    for only_sections in (False, True):
+        seconds: float = best_of(
+            lambda: offline_container(page_content, only_sections=only_sections)
+        )
+        peak: int = peak_memory(page_content, only_sections)
+        label: str = "sections" if only_sections else "full page"
+        print(f"{label:<10} {seconds * 1000:8.2f} ms {peak / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
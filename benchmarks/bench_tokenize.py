@@ -0,0 +1,43 @@
+"""Check that tokenize_materials scales linearly on pathological materials cells."""
+
+from typing import Dict
+
+from common import best_of
+
+from intradel_my_container.functions import tokenize_materials
+
+SIZES: Dict[str, int] = {"small": 20_000, "large": 200_000}
+
+PATTERNS: Dict[str, str] = {
+    "opening parentheses": "(",
+    "closing parentheses": ")",
+    "names without quantity": "DSM (Autre) ",
+    "materials": "Bois (0.10 m³), ",
+    "enclosed commas": "Foo, (a, b) ",
+}
+
+
+def main() -> None:
+    """
+    Print the time of tokenize_materials on cells ten times longer, and the ratio.
+    """
+
+    for label, pattern in PATTERNS.items():
+        times: Dict[str, float] = {
+            size: best_of(
+                lambda cell=pattern * (length // len(pattern)) + "(1.00 m³)": list(
+                    tokenize_materials(cell)
+                ),
+                1,
+                5,
+            )
+            for size, length in SIZES.items()
+        }
+        print(
+            f"{label:24}  {times['small'] * 1000:7.2f} ms  {times['large'] * 1000:7.2f} ms"
+            f"   {times['large'] / times['small']:5.1f}x for 10x characters"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare the pure Python and the NumPy aggregates of a PickupSeries."""
+
+import random
+from datetime import date
+from typing import Callable, Dict
+from unittest import mock
+
+from common import best_of, unmemoized
+
+from intradel_my_container import PickupSeries, vectorized
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def synthetic_series(size: int) -> PickupSeries:
+    """
+    Create a series of pickups, in date order, spread over thirty years.
+
+    Parameters:
+    ----------
+    size : int
+        The number of pickups.
+
+    Returns:
+    -------
+    PickupSeries
+        The pickups.
+    """
+
+    generator = random.Random(size)
+    first: int = date(1994, 1, 1).toordinal()
+    ordinals = sorted(generator.randrange(first, first + 30 * 365) for _ in range(size))
+    kilograms = [round(generator.uniform(0, 100), 1) for _ in range(size)]
+    return PickupSeries.from_columns(ordinals, kilograms)
+
+
+def main() -> None:
+    """
+    Print the time of each aggregate with and without NumPy, and check they agree.
+    """
+
+    if not vectorized.NUMPY_AVAILABLE:
+        print("numpy is not installed")
+        return
+
+    for size in SIZES:
+        series: PickupSeries = synthetic_series(size)
+        aggregates: Dict[str, Callable[[], object]] = {
+            name: unmemoized(getattr(series, name), series)
+            for name in ("total_kilograms", "count_per_year", "kilograms_per_year")
+        }
+        print(f"{size} pickups")
+        for name, aggregate in aggregates.items():
+            numpy_seconds: float = best_of(aggregate, number=3, repeat=3)
+            numpy_result = aggregate()
+            with mock.patch.object(vectorized, "NUMPY_AVAILABLE", False):
+                python_seconds: float = best_of(aggregate, number=3, repeat=3)
+                python_result = aggregate()
+            assert numpy_result == python_result, name
+            print(
+                f"  {name:<20} python {python_seconds * 1000:9.3f} ms"
+                f"   numpy {numpy_seconds * 1000:9.3f} ms"
+                f"   {python_seconds / numpy_seconds:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
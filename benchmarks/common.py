@@ -0,0 +1,102 @@
+"""Shared helpers for the benchmarks."""
+
+import os
+import timeit
+from typing import Any, Callable
+from unittest import mock
+
+from intradel_my_container import IntradelMyContainer, PickupSeries
+
+FIXTURE_PATH: str = os.path.join(
+    os.path.dirname(__file__), os.pardir, "tests", "page.content.html"
+)
+
+
+def fixture_page_content() -> bytes:
+    """
+    Read the recorded Intradel page used by the tests.
+
+    Returns:
+    -------
+    bytes
+        The page content as bytes.
+    """
+
+    with open(FIXTURE_PATH, "rb") as my_file:
+        return my_file.read()
+
+
+def offline_container(page_content: bytes, **kwargs: Any) -> IntradelMyContainer:
+    """
+    Build an IntradelMyContainer from a page without calling Intradel.
+
+    Parameters:
+    ----------
+    page_content : bytes
+        The page content returned instead of the website's answer.
+    **kwargs : Any
+        Extra keyword arguments given to IntradelMyContainer.
+
+    Returns:
+    -------
+    IntradelMyContainer
+        The parsed container.
+    """
+
+    with mock.patch.object(
+        IntradelMyContainer, "_get_page_content", return_value=page_content
+    ):
+        return IntradelMyContainer(
+            login="benchmark",
+            password="benchmark",
+            municipality_id="benchmark",
+            **kwargs,
+        )
+
+
+def best_of(function: Callable[[], Any], number: int = 10, repeat: int = 5) -> float:
+    """
+    Time a function and keep the best run.
+
+    Parameters:
+    ----------
+    function : Callable[[], Any]
+        The function to time.
+    number : int, optional
+        The number of calls per run, by default 10.
+    repeat : int, optional
+        The number of runs, by default 5.
+
+    Returns:
+    -------
+    float
+        The best time of one call, in seconds.
+    """
+
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def unmemoized(
+    total: Callable[[], object], series: PickupSeries
+) -> Callable[[], object]:
+    """
+    Wrap a total so that each call computes it again, instead of reading the memo.
+
+    Parameters:
+    ----------
+    total : Callable[[], object]
+        The total method of a trash bin.
+    series : PickupSeries
+        The pickups of the trash bin, whose memo is cleared before each call.
+
+    Returns:
+    -------
+    Callable[[], object]
+        The wrapped total.
+    """
+
+    def call() -> object:
+        series._totals.clear()
+        return total()
+
+    return call
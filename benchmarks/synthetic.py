@@ -0,0 +1,63 @@
+"""Generate synthetic Intradel pages with any number of pickup and dropout rows."""
+
+import re
+from datetime import date, timedelta
+from itertools import cycle, islice
+from typing import Iterator, List
+
+from common import fixture_page_content
+
+SYNTHETIC_START_DATE: date = date(1990, 1, 1)
+
+_TBODY = re.compile(rb"(<tbody>)(.*?)(\s*</tbody>)", re.DOTALL)
+_TR = re.compile(rb"\s*<tr>.*?</tr>", re.DOTALL)
+_DATE = re.compile(rb"\d\d-\d\d-\d\d\d\d")
+
+
+def _rows(templates: List[bytes], rows: int) -> Iterator[bytes]:
+    """
+    Repeat the row templates of a table, with one new date per row.
+
+    Parameters:
+    ----------
+    templates : List[bytes]
+        The '<tr>' blocks of the recorded table.
+    rows : int
+        The number of rows to generate.
+
+    Yields:
+    ------
+    bytes
+        A '<tr>' block.
+    """
+
+    for index, template in enumerate(islice(cycle(templates), rows)):
+        row_date: bytes = (
+            (SYNTHETIC_START_DATE + timedelta(days=index)).strftime("%d-%m-%Y").encode()
+        )
+        yield _DATE.sub(row_date, template, count=1)
+
+
+def synthetic_page(rows: int) -> bytes:
+    """
+    Build a page with the layout of tests/page.content.html and the given number of rows.
+
+    Each of the organic, residual and recyparc tables gets 'rows' rows, copied from the
+    recorded ones with one day between two rows, starting on SYNTHETIC_START_DATE.
+
+    Parameters:
+    ----------
+    rows : int
+        The number of rows of each table.
+
+    Returns:
+    -------
+    bytes
+        The page content as bytes.
+    """
+
+    def replace_tbody(match: re.Match[bytes]) -> bytes:
+        templates: List[bytes] = _TR.findall(match.group(2))
+        return match.group(1) + b"".join(_rows(templates, rows)) + match.group(3)
+
+    return _TBODY.sub(replace_tbody, fixture_page_content())
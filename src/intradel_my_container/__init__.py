@@ -1,25 +1,49 @@
 """The core of the package. Provide the functionality to parse Intradel's website"""
-import re
-from abc import ABC
+import copy
+import functools
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Self,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import requests
 from bs4 import BeautifulSoup, ResultSet, Tag
 
+from intradel_my_container import buckets, quotas, vectorized
+from intradel_my_container.buckets import BucketStats
+from intradel_my_container.cache import ResponseCache
 from intradel_my_container.const import *
 from intradel_my_container.functions import (
     cleanup,
     extract_number,
     find_date,
+    make_soup,
     p_to_dictionary,
+    tokenize_materials,
 )
+from intradel_my_container.session import ConnectionPool
 
 from . import const
 
 
-@dataclass
+@dataclass(slots=True)
 class Pickup:
     """
     Represents a pickup event.
@@ -36,7 +60,301 @@ class Pickup:
     kilograms: float
 
 
-@dataclass
+class PickupSeries(Sequence[Pickup]):
+    """
+    Represents pickup events as two columns: ordinal dates and kilograms.
+
+    The dates are kept as the proleptic Gregorian ordinals of their day, in an
+    array('i'), and the weights in an array('d'). Pickup instances are only created
+    when an item is read, so a long history takes 12 bytes per event. When NumPy is
+    installed, the totals of long series are computed by the vectorized module.
+
+    The totals are memoized until the series changes through append or extend. The
+    columns are private so that they only change through these methods, and are read
+    as copies.
+
+    Attributes:
+    ----------
+    _ordinals : array
+        The ordinal of the day of each pickup event.
+    _kilograms : array
+        The weight of materials collected at each pickup event.
+    _totals : Dict[str, Any]
+        The memoized totals, by method name.
+    """
+
+    _ordinals: array
+    _kilograms: array
+    _totals: Dict[str, Any]
+
+    def __init__(self, pickups: Iterable[Pickup] = ()) -> None:
+        """
+        Initialize a PickupSeries instance.
+
+        Parameters:
+        ----------
+        pickups : Iterable[Pickup], optional
+            The pickup events, by default none. Their time of day is dropped.
+        """
+
+        self._totals = {}
+        if isinstance(pickups, PickupSeries):
+            self._ordinals = array("i", pickups._ordinals)
+            self._kilograms = array("d", pickups._kilograms)
+        else:
+            self._ordinals = array("i")
+            self._kilograms = array("d")
+            self.extend(pickups)
+
+    @property
+    def ordinals(self) -> array:
+        """
+        A copy of the ordinal of the day of each pickup event.
+        """
+
+        return array("i", self._ordinals)
+
+    @property
+    def kilograms(self) -> array:
+        """
+        A copy of the weight of materials collected at each pickup event.
+        """
+
+        return array("d", self._kilograms)
+
+    @classmethod
+    def from_columns(cls, ordinals: Iterable[int], kilograms: Iterable[float]) -> Self:
+        """
+        Create a PickupSeries instance from its columns.
+
+        Parameters:
+        ----------
+        ordinals : Iterable[int]
+            The ordinal of the day of each pickup event.
+        kilograms : Iterable[float]
+            The weight of materials collected at each pickup event.
+
+        Returns:
+        -------
+        Self
+            The PickupSeries instance.
+        """
+
+        series = cls()
+        series._ordinals = array("i", ordinals)
+        series._kilograms = array("d", kilograms)
+        if len(series._ordinals) != len(series._kilograms):
+            raise ValueError("The columns must have the same length.")
+        return series
+
+    def append(self, pickup: Pickup) -> None:
+        """
+        Add a pickup event at the end of the series.
+
+        Parameters:
+        ----------
+        pickup : Pickup
+            The pickup event.
+        """
+
+        self._ordinals.append(pickup.date.toordinal())
+        self._kilograms.append(pickup.kilograms)
+        self._totals.clear()
+
+    def extend(self, pickups: Iterable[Pickup]) -> None:
+        """
+        Add pickup events at the end of the series.
+
+        Parameters:
+        ----------
+        pickups : Iterable[Pickup]
+            The pickup events.
+        """
+
+        if isinstance(pickups, PickupSeries):
+            self._ordinals.extend(pickups._ordinals)
+            self._kilograms.extend(pickups._kilograms)
+        else:
+            for pickup in pickups:
+                self._ordinals.append(pickup.date.toordinal())
+                self._kilograms.append(pickup.kilograms)
+        self._totals.clear()
+
+    def before(self, until: datetime) -> "PickupSeries":
+        """
+        Select the pickup events strictly before a date.
+
+        Parameters:
+        ----------
+        until : datetime
+            The first date excluded. A time of day includes its day.
+
+        Returns:
+        -------
+        PickupSeries
+            The pickup events before 'until', in the same order.
+        """
+
+        limit: int = until.toordinal() + (until.time() != datetime.min.time())
+        series = PickupSeries()
+        for ordinal, kilograms in zip(self._ordinals, self._kilograms):
+            if ordinal < limit:
+                series._ordinals.append(ordinal)
+                series._kilograms.append(kilograms)
+        return series
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    @overload
+    def __getitem__(self, index: int) -> Pickup:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PickupSeries":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Pickup, "PickupSeries"]:
+        if isinstance(index, slice):
+            return PickupSeries.from_columns(
+                self._ordinals[index], self._kilograms[index]
+            )
+        return Pickup(
+            date=datetime.fromordinal(self._ordinals[index]),
+            kilograms=self._kilograms[index],
+        )
+
+    def __iter__(self) -> Iterator[Pickup]:
+        for ordinal, kilograms in zip(self._ordinals, self._kilograms):
+            yield Pickup(date=datetime.fromordinal(ordinal), kilograms=kilograms)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PickupSeries):
+            return (
+                self._ordinals == other._ordinals
+                and self._kilograms == other._kilograms
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PickupSeries({list(self)!r})"
+
+    def _memoized(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Give the memoized value of a total, computing it on the first call.
+
+        Parameters:
+        ----------
+        name : str
+            The name of the total.
+        compute : Callable[[], Any]
+            Computes the total.
+
+        Returns:
+        -------
+        Any
+            The total.
+        """
+
+        if name not in self._totals:
+            self._totals[name] = compute()
+        return self._totals[name]
+
+    def total_kilograms(self) -> float:
+        """
+        Calculate the total weight of materials collected.
+
+        Returns:
+        -------
+        float
+            The total weight of materials collected in kilograms.
+        """
+
+        return self._memoized("total_kilograms", self._total_kilograms)
+
+    def _total_kilograms(self) -> float:
+        if vectorized.use_numpy(self._kilograms):
+            return vectorized.total_kilograms(self._kilograms)
+        return sum(self._kilograms, 0.0)
+
+    def aggregate(
+        self, granularity: str = INTRADEL_GRANULARITY_YEAR
+    ) -> Dict[str, BucketStats]:
+        """
+        Calculate the count, total, minimum and maximum kilograms of each time bucket.
+
+        Parameters:
+        ----------
+        granularity : str, optional
+            One of INTRADEL_GRANULARITIES, by default INTRADEL_GRANULARITY_YEAR.
+
+        Returns:
+        -------
+        Dict[str, BucketStats]
+            The statistics of each bucket, by key in order of first appearance. The
+            statistics are copies, free to be modified.
+        """
+
+        return {
+            key: copy.copy(stats) for key, stats in self._aggregate(granularity).items()
+        }
+
+    def _aggregate(self, granularity: str) -> Dict[str, BucketStats]:
+        return self._memoized(
+            f"aggregate[{granularity}]",
+            lambda: buckets.aggregate(
+                zip(self._ordinals, self._kilograms), granularity
+            ),
+        )
+
+    def count_per_year(self) -> Dict[str, int]:
+        """
+        Calculate the number of pickup events per year.
+
+        Returns:
+        -------
+        Dict[str, int]
+            A dictionary with years as keys and the number of pickup events as values.
+            The dictionary is a copy, free to be modified.
+        """
+
+        return dict(self._memoized("count_per_year", self._count_per_year))
+
+    def _count_per_year(self) -> Dict[str, int]:
+        if vectorized.use_numpy(self._ordinals):
+            return vectorized.count_per_year(self._ordinals)
+
+        return {
+            year: stats.count
+            for year, stats in self._aggregate(INTRADEL_GRANULARITY_YEAR).items()
+        }
+
+    def kilograms_per_year(self) -> Dict[str, float]:
+        """
+        Calculate the total weight of materials collected per year.
+
+        Returns:
+        -------
+        Dict[str, float]
+            A dictionary with years as keys and the total weight of materials
+            collected as values. The dictionary is a copy, free to be modified.
+        """
+
+        return dict(self._memoized("kilograms_per_year", self._kilograms_per_year))
+
+    def _kilograms_per_year(self) -> Dict[str, float]:
+        if vectorized.use_numpy(self._ordinals):
+            return vectorized.kilograms_per_year(self._ordinals, self._kilograms)
+
+        return {
+            year: stats.total
+            for year, stats in self._aggregate(INTRADEL_GRANULARITY_YEAR).items()
+        }
+
+
+@dataclass(slots=True)
 class Material:
     """
     Represents a material with quantity and unit.
@@ -58,9 +376,12 @@ class Material:
     def __post_init__(self):
         """
         Ensure strings are stripped a Material instance.
+
+        The name and unit are interned: there are only a few dozen of them, so every
+        material shares the same string objects.
         """
-        self.name = self.name.strip()
-        self.unit = self.unit.strip()
+        self.name = sys.intern(self.name.strip())
+        self.unit = sys.intern(self.unit.strip())
 
 
 class Dropout:
@@ -72,17 +393,22 @@ class Dropout:
     date : datetime
         The date of the dropout event.
     parc : str
-        The name of the parc associated with the dropout event.
+        The name of the parc associated with the dropout event, interned.
     materials : List[Material]
         A list of Material instances representing the materials in the dropout event.
-    _raw_materials : str
-        The raw string of materials before processing.
+        They are parsed from the raw string on the first access.
+    _materials : Union[None, List[Material]]
+        The parsed materials, or None until the first access.
+    _raw_materials : Union[None, str]
+        The raw string of materials before processing, or None once dropped.
     """
 
+    __slots__ = ("date", "parc", "_materials", "_raw_materials")
+
     date: datetime
     parc: str
-    materials: List[Material]
-    _raw_materials: str
+    _materials: Union[None, List[Material]]
+    _raw_materials: Union[None, str]
 
     def _create_material(self, raw_material: str) -> List[Material]:
         """
@@ -93,20 +419,10 @@ class Dropout:
         raw_material : str
             The raw material string to parse.
         """
-        raw_material = cleanup(raw_material)
-        split_materials = raw_material.split(",")
-        list_material: List[Material] = []
-        for material in split_materials:
-            search = re.search(r"(.*)\((\d+\.\d+)\s(.*)\)", material)
-            if search is not None:
-                list_material.append(
-                    Material(
-                        name=search.group(1),
-                        quantity=float(search.group(2)),
-                        unit=search.group(3),
-                    )
-                )
-        return list_material
+        return [
+            Material(name=name, quantity=float(quantity), unit=unit)
+            for name, quantity, unit in tokenize_materials(cleanup(raw_material))
+        ]
 
     def __init__(self, date: datetime, parc: str, materials: str) -> None:
         """
@@ -123,10 +439,48 @@ class Dropout:
         """
 
         self.date = date
-        self.parc = parc
-        self.materials = self._create_material(raw_material=materials)
+        self.parc = sys.intern(parc)
+        self._materials = None
         self._raw_materials = materials
 
+    @property
+    def materials(self) -> List[Material]:
+        """
+        The materials of the dropout event, parsed from the raw string on first access.
+        """
+
+        if self._materials is None:
+            self._materials = self._create_material(
+                raw_material=self._raw_materials or ""
+            )
+        return self._materials
+
+    @materials.setter
+    def materials(self, materials: List[Material]) -> None:
+        self._materials = materials
+
+    @property
+    def raw_materials(self) -> str:
+        """
+        The raw string of materials, or once dropped, the materials written back the
+        way Intradel does, such as "Bois (0.10 m³), Inertes (0.20 m³)".
+        """
+
+        if self._raw_materials is not None:
+            return self._raw_materials
+        return ", ".join(
+            f"{material.name} ({material.quantity:.2f} {material.unit})"
+            for material in self.materials
+        )
+
+    def drop_raw_materials(self) -> None:
+        """
+        Release the raw string of materials, keeping only the parsed materials.
+        """
+
+        self._materials = self.materials
+        self._raw_materials = None
+
 
 class Informations:
     """
@@ -159,13 +513,43 @@ class Informations:
             The HTML 'Tag' object containing information content.
         """
 
-        dict_my_informations: Dict[str, str] = p_to_dictionary(content)
+        self._fill(p_to_dictionary(content))
+
+    def _fill(self, dict_my_informations: Dict[str, str]) -> None:
+        """
+        Set the attributes from the 'p' tags dictionary of the section.
+
+        Parameters:
+        ----------
+        dict_my_informations : Dict[str, str]
+            The key-value pairs of the section, as returned by p_to_dictionary.
+        """
 
         self.name = dict_my_informations[INTRADEL_INFO_NAME]
         self.category = dict_my_informations[INTRADEL_INFO_CATEGORY]
         self.address = dict_my_informations[INTRADEL_INFO_ADDRESS]
         self.actif = find_date(dict_my_informations[INTRADEL_INFO_ACTIF])
 
+    @classmethod
+    def from_dictionary(cls, dict_my_informations: Dict[str, str]) -> Self:
+        """
+        Create an Informations instance from already extracted values.
+
+        Parameters:
+        ----------
+        dict_my_informations : Dict[str, str]
+            The key-value pairs of the section, as returned by p_to_dictionary.
+
+        Returns:
+        -------
+        Self
+            The Informations instance.
+        """
+
+        informations = cls.__new__(cls)
+        informations._fill(dict_my_informations)
+        return informations
+
 
 class TrashBin(ABC):
     """
@@ -181,15 +565,15 @@ class TrashBin(ABC):
         The status of the trash bin.
     since : datetime
         The starting date of the trash bin's usage.
-    pickups : List[Pickup]
-        A list of Pickup instances representing pickup events associated with the trash bin.
+    pickups : PickupSeries
+        The pickup events associated with the trash bin.
     """
 
     volume: int
     chip_number: str
     status: str
     since: datetime
-    pickups: List[Pickup]
+    pickups: PickupSeries
 
     def get_pickups(self, content: Tag) -> List[Pickup]:
         """
@@ -226,6 +610,81 @@ class TrashBin(ABC):
 
         return pickup_list
 
+    @abstractmethod
+    def _fill(self, dictionary: Dict[str, str], pickups: Iterable[Pickup]) -> None:
+        """
+        Set the attributes from the section values and its pickups.
+
+        Parameters:
+        ----------
+        dictionary : Dict[str, str]
+            The key-value pairs of the section, as returned by p_to_dictionary.
+        pickups : Iterable[Pickup]
+            The pickup events of the section.
+        """
+
+    @classmethod
+    def from_dictionary(
+        cls, dictionary: Dict[str, str], pickups: Iterable[Pickup]
+    ) -> Self:
+        """
+        Create a trash bin from already extracted values.
+
+        Parameters:
+        ----------
+        dictionary : Dict[str, str]
+            The key-value pairs of the section, as returned by p_to_dictionary.
+        pickups : Iterable[Pickup]
+            The pickup events of the section.
+
+        Returns:
+        -------
+        Self
+            The trash bin instance.
+        """
+
+        trash_bin = cls.__new__(cls)
+        trash_bin._fill(dictionary, pickups)
+        return trash_bin
+
+    def merge_pickups(self, pickups: Iterable[Pickup], since: datetime) -> None:
+        """
+        Replace the pickup events from a date onwards by newly retrieved ones.
+
+        The pickups must cover every event from 'since', so that the events known
+        before are not duplicated. The ones before 'since' are ignored, in case the
+        website gave back more than requested.
+
+        Parameters:
+        ----------
+        pickups : Iterable[Pickup]
+            The pickup events retrieved from 'since'.
+        since : datetime
+            The start date of the retrieval of the new pickups.
+        """
+
+        merged_pickups: PickupSeries = self.pickups.before(since)
+        merged_pickups.extend(pickup for pickup in pickups if pickup.date >= since)
+        self.pickups = merged_pickups
+
+    def merge(self, other: "TrashBin", since: datetime) -> None:
+        """
+        Take the state of a trash bin retrieved from a date onwards.
+
+        Parameters:
+        ----------
+        other : TrashBin
+            The same trash bin, retrieved from 'since'.
+        since : datetime
+            The start date of the retrieval of other.
+        """
+
+        self.volume = other.volume
+        self.chip_number = other.chip_number
+        self.status = other.status
+        self.since = other.since
+        self.merge_pickups(other.pickups, since)
+
     def total_collects(self) -> int:
         """
         Calculate the total number of pickup events.
@@ -247,14 +706,7 @@ class TrashBin(ABC):
             A dictionary with years as keys and the corresponding total pickup events as values.
         """
 
-        per_year_dict: Dict[str, int] = {}
-        for pickup in self.pickups:
-            year: str = str(pickup.date.year)
-            if year in per_year_dict:
-                per_year_dict[year] = per_year_dict[year] + 1
-            else:
-                per_year_dict[year] = 1
-        return per_year_dict
+        return self.pickups.count_per_year()
 
     def total_kilograms(self) -> float:
         """
@@ -266,10 +718,7 @@ class TrashBin(ABC):
             The total weight of materials collected in kilograms.
         """
 
-        total: float = 0
-        for pickup in self.pickups:
-            total = total + pickup.kilograms
-        return total
+        return self.pickups.total_kilograms()
 
     def total_kilograms_per_year(self) -> Dict[str, float]:
         """
@@ -282,14 +731,28 @@ class TrashBin(ABC):
             collected as values.
         """
 
-        per_year_dict: Dict[str, float] = {}
-        for pickup in self.pickups:
-            year: str = str(pickup.date.year)
-            if year in per_year_dict:
-                per_year_dict[year] = per_year_dict[year] + pickup.kilograms
-            else:
-                per_year_dict[year] = pickup.kilograms
-        return per_year_dict
+        return self.pickups.kilograms_per_year()
+
+    def aggregate(
+        self, granularity: str = INTRADEL_GRANULARITY_YEAR
+    ) -> Dict[str, BucketStats]:
+        """
+        Calculate the count, total, minimum and maximum kilograms of the pickup events
+        of each day, ISO week, month, quarter or year.
+
+        Parameters:
+        ----------
+        granularity : str, optional
+            One of INTRADEL_GRANULARITIES, by default INTRADEL_GRANULARITY_YEAR.
+
+        Returns:
+        -------
+        Dict[str, BucketStats]
+            The statistics of each bucket, by key: "2023-06-16", "2023-W24", "2023-06",
+            "2023-Q2" or "2023".
+        """
+
+        return self.pickups.aggregate(granularity)
 
 
 class Organic(TrashBin):
@@ -313,13 +776,14 @@ class Organic(TrashBin):
             The HTML 'Tag' object containing organic waste content.
         """
 
-        dict_organic: Dict[str, str] = p_to_dictionary(content)
+        self._fill(p_to_dictionary(content), self.get_pickups(content))
 
-        self.volume = extract_number(dict_organic[INTRADEL_ORGANIC_VOLUME])
-        self.chip_number = dict_organic[INTRADEL_ORGANIC_CHIP_NUMBER]
-        self.status = dict_organic[INTRADEL_ORGANIC_STATUS]
-        self.since = find_date(dict_organic[INTRADEL_ORGANIC_SINCE])
-        self.pickups = self.get_pickups(content)
+    def _fill(self, dictionary: Dict[str, str], pickups: Iterable[Pickup]) -> None:
+        self.volume = extract_number(dictionary[INTRADEL_ORGANIC_VOLUME])
+        self.chip_number = dictionary[INTRADEL_ORGANIC_CHIP_NUMBER]
+        self.status = dictionary[INTRADEL_ORGANIC_STATUS]
+        self.since = find_date(dictionary[INTRADEL_ORGANIC_SINCE])
+        self.pickups = PickupSeries(pickups)
 
 
 class Residual(TrashBin):
@@ -343,15 +807,14 @@ class Residual(TrashBin):
             The HTML 'Tag' object containing residual waste content.
         """
 
-        dict_residual: Dict[str, str] = p_to_dictionary(content)
-
-        self.volume = extract_number(dict_residual[INTRADEL_RESIDUAL_VOLUME])
-        self.chip_number = dict_residual[INTRADEL_RESIDUAL_CHIP_NUMBER]
-        self.status = dict_residual[INTRADEL_RESIDUAL_STATUS]
-        self.since = find_date(dict_residual[INTRADEL_RESIDUAL_SINCE])
-        self.pickups = []
+        self._fill(p_to_dictionary(content), self.get_pickups(content))
 
-        self.pickups = self.get_pickups(content)
+    def _fill(self, dictionary: Dict[str, str], pickups: Iterable[Pickup]) -> None:
+        self.volume = extract_number(dictionary[INTRADEL_RESIDUAL_VOLUME])
+        self.chip_number = dictionary[INTRADEL_RESIDUAL_CHIP_NUMBER]
+        self.status = dictionary[INTRADEL_RESIDUAL_STATUS]
+        self.since = find_date(dictionary[INTRADEL_RESIDUAL_SINCE])
+        self.pickups = PickupSeries(pickups)
 
 
 class Recyparc:
@@ -364,10 +827,13 @@ class Recyparc:
         The starting date of the recyparc's operation.
     dropout : List[Dropout]
         A list of Dropout instances representing dropout events associated with the recyparc.
+    _quota_usage : Union[None, Tuple[Tuple[Dropout, ...], Dict[str, Dict[str, float]]]]
+        The memoized quota consumption, with the dropouts it was calculated from.
     """
 
     since: datetime
     dropout: List[Dropout]
+    _quota_usage: Union[None, Tuple[Tuple[Dropout, ...], Dict[str, Dict[str, float]]]]
 
     def get_dropouts(self, content: Tag) -> List[Dropout]:
         """
@@ -415,10 +881,192 @@ class Recyparc:
             The HTML 'Tag' object containing recyparc content.
         """
 
-        dict_recyparc: Dict[str, str] = p_to_dictionary(content)
+        self._fill(p_to_dictionary(content), self.get_dropouts(content))
+
+    def _fill(self, dict_recyparc: Dict[str, str], dropouts: List[Dropout]) -> None:
+        """
+        Set the attributes from the section values and its dropouts.
+
+        Parameters:
+        ----------
+        dict_recyparc : Dict[str, str]
+            The key-value pairs of the section, as returned by p_to_dictionary.
+        dropouts : List[Dropout]
+            The dropout events of the section.
+        """
 
         self.since = find_date(dict_recyparc[INTRADEL_RESIDUAL_SINCE])
-        self.dropout = self.get_dropouts(content)
+        self.dropout = dropouts
+        self._quota_usage = None
+
+    @classmethod
+    def from_dictionary(
+        cls, dict_recyparc: Dict[str, str], dropouts: List[Dropout]
+    ) -> Self:
+        """
+        Create a Recyparc instance from already extracted values.
+
+        Parameters:
+        ----------
+        dict_recyparc : Dict[str, str]
+            The key-value pairs of the section, as returned by p_to_dictionary.
+        dropouts : List[Dropout]
+            The dropout events of the section.
+
+        Returns:
+        -------
+        Self
+            The Recyparc instance.
+        """
+
+        recyparc = cls.__new__(cls)
+        recyparc._fill(dict_recyparc, dropouts)
+        return recyparc
+
+    def merge_dropouts(self, dropouts: List[Dropout], since: datetime) -> None:
+        """
+        Replace the dropout events from a date onwards by newly retrieved ones.
+
+        The dropouts must cover every event from 'since', so that the events known
+        before are not duplicated. The ones before 'since' are ignored, in case the
+        website gave back more than requested.
+
+        Parameters:
+        ----------
+        dropouts : List[Dropout]
+            The dropout events retrieved from 'since'.
+        since : datetime
+            The start date of the retrieval of the new dropouts.
+        """
+
+        self.dropout = [dropout for dropout in self.dropout if dropout.date < since] + [
+            dropout for dropout in dropouts if dropout.date >= since
+        ]
+        self._quota_usage = None
+
+    def merge(self, other: "Recyparc", since: datetime) -> None:
+        """
+        Take the state of the recyparc visits retrieved from a date onwards.
+
+        Parameters:
+        ----------
+        other : Recyparc
+            The recyparc visits, retrieved from 'since'.
+        since : datetime
+            The start date of the retrieval of other.
+        """
+
+        self.since = other.since
+        self.merge_dropouts(other.dropout, since)
+
+    def drop_raw_materials(self) -> None:
+        """
+        Release the raw string of materials of every dropout event.
+        """
+
+        for dropout in self.dropout:
+            dropout.drop_raw_materials()
+
+    def aggregate(
+        self,
+        unit: str,
+        granularity: str = INTRADEL_GRANULARITY_YEAR,
+        name: Union[None, str] = None,
+    ) -> Dict[str, BucketStats]:
+        """
+        Calculate the count, total, minimum and maximum quantities dropped in a unit
+        on each day, ISO week, month, quarter or year.
+
+        The quantity of a dropout is the sum of its materials in the unit. The
+        dropouts without any of them are not counted.
+
+        Parameters:
+        ----------
+        unit : str
+            The unit of the quantities, as written by Intradel, for example "m³".
+        granularity : str, optional
+            One of INTRADEL_GRANULARITIES, by default INTRADEL_GRANULARITY_YEAR.
+        name : Union[None, str], optional
+            The name of the material, by default None for every material.
+
+        Returns:
+        -------
+        Dict[str, BucketStats]
+            The statistics of each bucket, by key: "2023-06-16", "2023-W24", "2023-06",
+            "2023-Q2" or "2023".
+        """
+
+        # Interned like the materials, the strings are compared by identity first.
+        unit = sys.intern(unit)
+        name = None if name is None else sys.intern(name)
+        points: List[Tuple[int, float]] = []
+        for dropout in self.dropout:
+            quantities: List[float] = [
+                material.quantity
+                for material in dropout.materials
+                if material.unit == unit and (name is None or material.name == name)
+            ]
+            if len(quantities) > 0:
+                points.append((dropout.date.toordinal(), sum(quantities, 0.0)))
+        return buckets.aggregate(points, granularity)
+
+    def _quota_consumption(self) -> Dict[str, Dict[str, float]]:
+        """
+        Give the memoized quota consumption, calculating it again when a dropout of
+        the list was added, removed or replaced.
+
+        The list is compared item by item with the dropouts of the memo, which costs
+        far less than the consumption. The materials of a dropout are not compared:
+        replace the dropout instead of changing them.
+
+        Returns:
+        -------
+        Dict[str, Dict[str, float]]
+            The quantity used of each quota per year, not to be modified.
+        """
+
+        dropouts: Tuple[Dropout, ...] = tuple(self.dropout)
+        usage = self._quota_usage
+        if usage is None or usage[0] != dropouts:
+            usage = (dropouts, quotas.consumption_per_year(dropouts))
+            self._quota_usage = usage
+        return usage[1]
+
+    def quota_consumption_per_year(self) -> Dict[str, Dict[str, float]]:
+        """
+        Calculate the quantity of each quota used per year.
+
+        The consumption is calculated in one pass over the dropouts, then memoized
+        until a dropout is added, removed or replaced.
+
+        Returns:
+        -------
+        Dict[str, Dict[str, float]]
+            A dictionary with years as keys and the quantity used of every quota of
+            INTRADEL_QUOTAS, in INTRADEL_QUOTA_UNIT, as values.
+        """
+
+        return {year: dict(used) for year, used in self._quota_consumption().items()}
+
+    def remaining_quotas(self, year: Union[None, int] = None) -> Dict[str, float]:
+        """
+        Calculate the quantity left of each quota in a year.
+
+        Parameters:
+        ----------
+        year : Union[None, int], optional
+            The year, by default None for the current year.
+
+        Returns:
+        -------
+        Dict[str, float]
+            The quantity left of every quota of INTRADEL_QUOTAS, in
+            INTRADEL_QUOTA_UNIT, negative when the quota is exceeded.
+        """
+
+        if year is None:
+            year = datetime.today().year
+        return quotas.remaining(self._quota_consumption().get(str(year)))
 
 
 class CannotParse(Exception):
@@ -427,6 +1075,43 @@ class CannotParse(Exception):
     """
 
 
+SectionT = TypeVar("SectionT")
+
+
+class _LazySection(Generic[SectionT]):
+    """
+    Build a section of IntradelMyContainer on its first access.
+
+    The builder registered by the parsing is called once, and its result is stored
+    in the instance, where the next accesses find it directly. Without a builder, the
+    section is missing, as when the page does not have it or it was not selected.
+    A builder is only dropped once it succeeded, so a failing section raises its own
+    error on every access. A builder only holds the part of the page of its
+    section.
+    """
+
+    _name: str
+
+    def __set_name__(self, owner: Type[Any], name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Union[None, Type[Any]] = None) -> SectionT:
+        if instance is None:
+            return self  # type: ignore[return-value]
+        builders: Dict[str, Callable[[], Any]] = instance.__dict__.get(
+            "_section_builders", {}
+        )
+        builder: Union[None, Callable[[], Any]] = builders.get(self._name)
+        if builder is None:
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self._name}'"
+            )
+        section: SectionT = builder()
+        instance.__dict__[self._name] = section
+        del builders[self._name]
+        return section
+
+
 class IntradelMyContainer:
     """
     Represents an IntradelMyContainer instance for retrieving waste management data.
@@ -455,19 +1140,45 @@ class IntradelMyContainer:
         The formatted start date string.
     _end_date_str : str
         The formatted end date string.
+    _parser : str
+        The HTML parser backend used to read the page.
+    _only_sections : bool
+        Whether only the 'div.post__content' sections of the page are parsed.
+    _pool : Union[None, ConnectionPool]
+        The shared connection pool, or None to use a new connection on each fetch.
+    _cache : Union[None, ResponseCache]
+        The on-disk cache of the pages, or None to always fetch them.
+    _sections : List[str]
+        The attributes of the sections to build, among INTRADEL_SECTIONS.
+    _section_builders : Dict[str, Callable[[], Any]]
+        Build each section found in the page and not accessed yet, by attribute.
     """
 
     _login: str
     _password: str
     _municipality_id: str
-    my_informations: Informations
-    organic: Organic
-    residual: Residual
-    recyparc: Recyparc
+    my_informations = _LazySection[Informations]()
+    organic = _LazySection[Organic]()
+    residual = _LazySection[Residual]()
+    recyparc = _LazySection[Recyparc]()
     start_date: datetime
     end_date: datetime
     _start_date_str: str
     _end_date_str: str
+    _parser: str
+    _only_sections: bool
+    _pool: Union[None, ConnectionPool]
+    _cache: Union[None, ResponseCache]
+    _sections: List[str]
+    _section_builders: Dict[str, Callable[[], Any]]
+
+    @property
+    def login(self) -> str:
+        """
+        The login credential of the account.
+        """
+
+        return self._login
 
     def _get_page_content(
         self,
@@ -522,9 +1233,37 @@ class IntradelMyContainer:
             "edate": self._end_date_str,
         }
 
-        session = requests.session()
-        page = session.post(url=INTRADEL_URL_LOGIN, data=post_login)
-        page = session.post(url=INTRADEL_URL_DATA, data=post_data)
+        if self._cache is not None:
+            cached_page_content: Union[None, bytes] = self._cache.get(
+                self._login,
+                self._password,
+                self._municipality_id,
+                self.start_date,
+                self.end_date,
+            )
+            if cached_page_content is not None:
+                return cached_page_content
+
+        session: requests.Session = (
+            requests.session() if self._pool is None else self._pool.session()
+        )
+        try:
+            page = session.post(url=INTRADEL_URL_LOGIN, data=post_login)
+            page = session.post(url=INTRADEL_URL_DATA, data=post_data)
+        finally:
+            if self._pool is None:
+                session.close()
+
+        # Only the pages holding the sections are kept, not the failed logins.
+        if self._cache is not None and INTRADEL_SECTION_CLASS.encode() in page.content:
+            self._cache.put(
+                self._login,
+                self._password,
+                self._municipality_id,
+                self.start_date,
+                self.end_date,
+                page.content,
+            )
 
         return page.content
 
@@ -535,10 +1274,19 @@ class IntradelMyContainer:
         municipality_id: str,
         start_date: Union[None, datetime] = None,
         end_date: Union[None, datetime] = None,
+        parser: str = INTRADEL_PARSER_HTML,
+        only_sections: bool = False,
+        pool: Union[None, ConnectionPool] = None,
+        cache: Union[None, ResponseCache] = None,
+        sections: Union[None, Iterable[str]] = None,
     ) -> None:
         """
         Initialize an IntradelMyContainer instance.
 
+        The page is retrieved and split into sections, but each section is only built
+        on the first access to its attribute. Until then, the part of the page of the
+        section is kept.
+
         Parameters:
         ----------
         login : str
@@ -551,36 +1299,376 @@ class IntradelMyContainer:
             The start date for data retrieval, by default None.
         end_date : Union[None, datetime], optional
             The end date for data retrieval, by default None.
+        parser : str, optional
+            The HTML parser backend, one of INTRADEL_PARSERS, by default INTRADEL_PARSER_HTML.
+            INTRADEL_PARSER_STREAM reads the page from parser events, without a DOM.
+        only_sections : bool, optional
+            Only parse the 'div.post__content' sections of the page, by default False.
+            It lowers the memory and time spent on large date ranges.
+            The streaming parser always skips the rest of the page.
+        pool : Union[None, ConnectionPool], optional
+            A connection pool shared with other instances, by default None.
+            Without it, the connection is opened and closed by this fetch.
+        cache : Union[None, ResponseCache], optional
+            An on-disk cache of the pages, by default None.
+        sections : Union[None, Iterable[str]], optional
+            The attributes of the sections to build, among "my_informations",
+            "organic", "residual" and "recyparc", by default None for all of them.
+            The others are never built and stay missing.
         """
-        self._login = login
-        self._password = password
-        self._municipality_id = municipality_id
+        self._configure(
+            login,
+            password,
+            municipality_id,
+            parser,
+            only_sections,
+            pool,
+            cache,
+            sections,
+        )
 
         page_content: bytes = self._get_page_content(
             start_date=start_date,
             end_date=end_date,
         )
 
-        soup: BeautifulSoup = BeautifulSoup(page_content, "html.parser")
-        all_post__content: ResultSet[Any] = soup.find_all("div", class_="post__content")
+        self._parse_page_content(page_content)
+
+    def _configure(
+        self,
+        login: str,
+        password: str,
+        municipality_id: str,
+        parser: str = INTRADEL_PARSER_HTML,
+        only_sections: bool = False,
+        pool: Union[None, ConnectionPool] = None,
+        cache: Union[None, ResponseCache] = None,
+        sections: Union[None, Iterable[str]] = None,
+    ) -> None:
+        """
+        Set the credentials and the fetch settings, before any page is retrieved.
+
+        Parameters:
+        ----------
+        (same as __init__, without the dates)
+        """
+
+        self._login = login
+        self._password = password
+        self._municipality_id = municipality_id
+        self._parser = parser
+        self._only_sections = only_sections
+        self._pool = pool
+        self._cache = cache
+        self._sections = self._select_sections(sections)
+        self._section_builders = {}
+
+    @classmethod
+    def iter_records(
+        cls,
+        login: str,
+        password: str,
+        municipality_id: str,
+        start_date: Union[None, datetime] = None,
+        end_date: Union[None, datetime] = None,
+        pool: Union[None, ConnectionPool] = None,
+        cache: Union[None, ResponseCache] = None,
+    ) -> Iterator[Tuple[str, Union[Pickup, Dropout]]]:
+        """
+        Retrieve the page and yield its Pickup and Dropout records as they are parsed.
+
+        No section is built: the records are read with the streaming parser and
+        given away one by one, so they are never all held in memory.
+
+        Parameters:
+        ----------
+        login : str
+            The login credential.
+        password : str
+            The password credential.
+        municipality_id : str
+            The id of the municipality.
+        start_date : Union[None, datetime], optional
+            The start date for data retrieval, by default None.
+        end_date : Union[None, datetime], optional
+            The end date for data retrieval, by default None.
+        pool : Union[None, ConnectionPool], optional
+            A connection pool shared with other instances, by default None.
+        cache : Union[None, ResponseCache], optional
+            An on-disk cache of the pages, by default None.
+
+        Yields:
+        ------
+        Tuple[str, Union[Pickup, Dropout]]
+            The section title and the Pickup or Dropout record.
+        """
+
+        # Imported here as the stream module builds on the classes of this module.
+        from intradel_my_container import (  # pylint: disable=import-outside-toplevel
+            stream,
+        )
+
+        container = cls.__new__(cls)
+        container._configure(
+            login,
+            password,
+            municipality_id,
+            INTRADEL_PARSER_STREAM,
+            pool=pool,
+            cache=cache,
+        )
+        page_content: bytes = container._get_page_content(
+            start_date=start_date, end_date=end_date
+        )
+
+        if INTRADEL_SECTION_CLASS.encode() not in page_content:
+            raise CannotParse(
+                "Cannot parse the website. Check credentials or the layout changed."
+            )
+
+        yield from stream.iter_records(page_content)
+
+    @staticmethod
+    def _select_sections(sections: Union[None, Iterable[str]]) -> List[str]:
+        """
+        Check the selection of sections.
+
+        Parameters:
+        ----------
+        sections : Union[None, Iterable[str]]
+            The attributes of the sections to build, or None for all of them.
+
+        Returns:
+        -------
+        List[str]
+            The attributes of the sections to build.
+        """
+
+        if sections is None:
+            return list(INTRADEL_SECTIONS.values())
+        selected: List[str] = list(sections)
+        for section in selected:
+            if section not in INTRADEL_SECTIONS.values():
+                raise ValueError(
+                    f"Unknown section '{section}'. "
+                    f"Use some of {list(INTRADEL_SECTIONS.values())}."
+                )
+        return selected
+
+    def _add_section(self, title: str, builder: Callable[[], Any]) -> None:
+        """
+        Register the builder of a section found in the page, when it is selected.
+
+        Parameters:
+        ----------
+        title : str
+            The title of the section.
+        builder : Callable[[], Any]
+            Builds the section.
+        """
+
+        name: Union[None, str] = INTRADEL_SECTIONS.get(title)
+        if name is not None and name in self._sections:
+            self.__dict__.pop(name, None)
+            self._section_builders[name] = builder
+
+    def _build_sections(self) -> None:
+        """
+        Build every section not accessed yet, releasing their parts of the page.
+        """
+
+        for name in list(self._section_builders):
+            getattr(self, name)
+
+    def _parse_page_content(self, page_content: bytes) -> None:
+        """
+        Split the page into sections with the selected parser backend.
+
+        Parameters:
+        ----------
+        page_content : bytes
+            The page content as bytes.
+        """
+
+        if self._parser == INTRADEL_PARSER_STREAM:
+            self._parse_stream(page_content)
+        else:
+            self._parse_soup(page_content)
+
+    def _parse_soup(self, page_content: bytes) -> None:
+        """
+        Find the sections in the BeautifulSoup tree of the page.
+
+        Parameters:
+        ----------
+        page_content : bytes
+            The page content as bytes.
+        """
+
+        soup: BeautifulSoup = make_soup(
+            page_content, parser=self._parser, only_sections=self._only_sections
+        )
+        all_post__content: ResultSet[Any] = soup.find_all(
+            INTRADEL_SECTION_TAG, class_=INTRADEL_SECTION_CLASS
+        )
 
         if len(all_post__content) == 0:
             raise CannotParse(
                 "Cannot parse the website. Check credentials or the layout changed."
             )
 
+        section_classes: Dict[str, Callable[[Tag], Any]] = {
+            const.INTRADEL_INFO_TITLE: Informations,
+            const.INTRADEL_ORGANIC_TITLE: Organic,
+            const.INTRADEL_RESIDUAL_TITLE: Residual,
+            const.INTRADEL_RECYPARC_TITLE: Recyparc,
+        }
         for content in all_post__content:
             if isinstance(content, Tag):
                 h3_tag = content.find_next("h3")
-                if h3_tag is not None:
-                    match h3_tag.text:
-                        case const.INTRADEL_INFO_TITLE:
-                            self.my_informations = Informations(content)
-                        case const.INTRADEL_ORGANIC_TITLE:
-                            self.organic = Organic(content)
-                        case const.INTRADEL_RESIDUAL_TITLE:
-                            self.residual = Residual(content)
-                        case const.INTRADEL_RECYPARC_TITLE:
-                            self.recyparc = Recyparc(content)
-                        case _:
-                            pass
+                if h3_tag is not None and h3_tag.text in section_classes:
+                    # Detached from the page, a section only keeps its own subtree
+                    # alive until it is built, not the whole tree.
+                    self._add_section(
+                        h3_tag.text,
+                        functools.partial(
+                            section_classes[h3_tag.text], content.extract()
+                        ),
+                    )
+
+    def _parse_stream(self, page_content: bytes) -> None:
+        """
+        Read the sections from the events of the streaming parser, without a DOM.
+
+        The records of the sections not selected are not created.
+
+        Parameters:
+        ----------
+        page_content : bytes
+            The page content as bytes.
+        """
+
+        # Imported here as the stream module builds on the classes of this module.
+        from intradel_my_container.stream import (  # pylint: disable=import-outside-toplevel
+            parse_page,
+        )
+
+        sections = parse_page(
+            page_content,
+            titles=[
+                title
+                for title, name in INTRADEL_SECTIONS.items()
+                if name in self._sections
+            ],
+        )
+
+        if len(sections) == 0:
+            raise CannotParse(
+                "Cannot parse the website. Check credentials or the layout changed."
+            )
+
+        for title, section in sections.items():
+            match title:
+                case const.INTRADEL_INFO_TITLE:
+                    self._add_section(
+                        title,
+                        functools.partial(
+                            Informations.from_dictionary, section.dictionary
+                        ),
+                    )
+                case const.INTRADEL_ORGANIC_TITLE:
+                    self._add_section(
+                        title,
+                        functools.partial(
+                            Organic.from_dictionary, section.dictionary, section.pickups
+                        ),
+                    )
+                case const.INTRADEL_RESIDUAL_TITLE:
+                    self._add_section(
+                        title,
+                        functools.partial(
+                            Residual.from_dictionary,
+                            section.dictionary,
+                            section.pickups,
+                        ),
+                    )
+                case const.INTRADEL_RECYPARC_TITLE:
+                    self._add_section(
+                        title,
+                        functools.partial(
+                            Recyparc.from_dictionary,
+                            section.dictionary,
+                            section.dropouts,
+                        ),
+                    )
+                case _:
+                    pass
+
+    def _refresh_start_date(self) -> datetime:
+        """
+        Find the date from which the data must be retrieved again to be up to date.
+
+        It is the day of the last event known in any section, or the previous end date
+        when no section has any event. A section without recent events does not drag
+        the retrieval back: its events before that day are already known.
+
+        Returns:
+        -------
+        datetime
+            The start date of the next incremental retrieval.
+        """
+
+        last_dates: List[datetime] = []
+        for trash_bin in (
+            getattr(self, "organic", None),
+            getattr(self, "residual", None),
+        ):
+            if trash_bin is not None and len(trash_bin.pickups) > 0:
+                last_dates.append(datetime.fromordinal(max(trash_bin.pickups.ordinals)))
+        recyparc: Union[None, Recyparc] = getattr(self, "recyparc", None)
+        if recyparc is not None and len(recyparc.dropout) > 0:
+            last_dates.append(max(dropout.date for dropout in recyparc.dropout))
+        if len(last_dates) == 0:
+            return self.end_date
+        return min(max(last_dates), self.end_date)
+
+    def refresh(self, end_date: Union[None, datetime] = None) -> None:
+        """
+        Retrieve only the events since the last known one and merge them.
+
+        The page is requested from the last known pickup or dropout date, and the
+        events of that day onwards are replaced by the retrieved ones, so none is
+        duplicated. The existing Organic, Residual and Recyparc instances are updated
+        in place.
+
+        Parameters:
+        ----------
+        end_date : Union[None, datetime], optional
+            The new end date for data retrieval, by default None for today.
+        """
+
+        start_date: datetime = self.start_date
+        start_date_str: str = self._start_date_str
+        since: datetime = self._refresh_start_date()
+
+        page_content: bytes = self._get_page_content(
+            start_date=since, end_date=end_date
+        )
+        self.start_date = start_date
+        self._start_date_str = start_date_str
+
+        update: IntradelMyContainer = copy.copy(self)
+        for name in INTRADEL_SECTIONS.values():
+            update.__dict__.pop(name, None)
+        update._section_builders = {}
+        update._parse_page_content(page_content)
+
+        if hasattr(update, "my_informations"):
+            self.my_informations = update.my_informations
+        for name in ("organic", "residual", "recyparc"):
+            if not hasattr(update, name):
+                continue
+            if hasattr(self, name):
+                getattr(self, name).merge(getattr(update, name), since)
+            else:
+                setattr(self, name, getattr(update, name))
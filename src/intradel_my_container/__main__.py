@@ -1,16 +1,54 @@
 """ Allow to test the package from command line"""
 
+import sys
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from typing_extensions import Annotated
 
-from intradel_my_container import Informations, IntradelMyContainer, Organic, Residual
+from intradel_my_container import (
+    Informations,
+    IntradelMyContainer,
+    Organic,
+    Residual,
+    const,
+)
+from intradel_my_container.export import write_records
+from intradel_my_container.municipalities import municipality_index
 
-console = Console()
+
+class OutputFormat(str, Enum):
+    """
+    The output formats of the command line.
+    """
+
+    TABLE = "table"
+    JSON = const.INTRADEL_EXPORT_JSON
+    NDJSON = const.INTRADEL_EXPORT_NDJSON
+    CSV = const.INTRADEL_EXPORT_CSV
+
+
+def resolve_municipality(value: str) -> str:
+    """
+    Convert the name or the id of a municipality given on the command line to its id.
+
+    Parameters:
+    ----------
+    value : str
+        A numeric id, a name or a prefix matching a single municipality.
+
+    Returns:
+    -------
+    str
+        The id of the municipality.
+    """
+
+    try:
+        return str(municipality_index().resolve(value))
+    except ValueError as error:
+        raise typer.BadParameter(str(error)) from error
 
 
 def main(
@@ -30,7 +68,8 @@ def main(
             "--municipality-id",
             "-m",
             envvar="INTRADEL_MUNICIPALITY",
-            prompt="Intradel municipality ID",
+            prompt="Intradel municipality ID or name",
+            callback=resolve_municipality,
         ),
     ],
     start_date: Annotated[
@@ -41,10 +80,31 @@ def main(
         Optional[datetime],
         typer.Option("--end-date", "-e", formats=["%Y-%m-%d"]),
     ] = None,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option("--format", "-f", case_sensitive=False),
+    ] = OutputFormat.TABLE,
 ):
     """
     Retrieve the Intradel data from command line.
+
+    The table format prints the totals. The json, ndjson and csv formats stream every
+    pickup, dropout and material row to the standard output as it is parsed.
     """
+    if output_format != OutputFormat.TABLE:
+        write_records(
+            IntradelMyContainer.iter_records(
+                login=login,
+                password=password,
+                municipality_id=municipality_id,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+            sys.stdout,
+            output_format.value,
+        )
+        return
+
     data: IntradelMyContainer = IntradelMyContainer(
         login=login,
         password=password,
@@ -52,6 +112,24 @@ def main(
         start_date=start_date,
         end_date=end_date,
     )
+    print_tables(data)
+
+
+def print_tables(data: IntradelMyContainer) -> None:
+    """
+    Print the informations and the totals of the trash bins as tables.
+
+    Parameters:
+    ----------
+    data : IntradelMyContainer
+        The retrieved data.
+    """
+
+    # Imported here as the other formats do not need rich.
+    from rich.console import Console  # pylint: disable=import-outside-toplevel
+    from rich.table import Table  # pylint: disable=import-outside-toplevel
+
+    console = Console()
 
     informations: Informations = data.my_informations
     table_info: Table = Table(title="Informations", show_header=False)
@@ -0,0 +1,145 @@
+"""asyncio variant of IntradelMyContainer, to refresh many households concurrently."""
+
+import asyncio
+from contextlib import AbstractAsyncContextManager, nullcontext
+from datetime import datetime
+from typing import Iterable, List, Self, Union
+
+from intradel_my_container import IntradelMyContainer
+from intradel_my_container.cache import ResponseCache
+from intradel_my_container.const import INTRADEL_PARSER_HTML
+from intradel_my_container.session import ConnectionPool
+
+
+class AsyncIntradelMyContainer(IntradelMyContainer):
+    """
+    Represents an IntradelMyContainer instance fetched with asyncio.
+
+    Nothing is retrieved by the constructor: await fetch() to fill my_informations,
+    organic, residual and recyparc. The blocking HTTP calls and the parsing run in
+    worker threads, so the event loop stays free while many instances are fetched.
+    For the same reason, the selected sections are built by fetch(), not on access.
+
+    Attributes:
+    ----------
+    (inherits attributes from IntradelMyContainer)
+    _requested_start_date : Union[None, datetime]
+        The start date given to the constructor.
+    _requested_end_date : Union[None, datetime]
+        The end date given to the constructor.
+    _semaphore : Union[None, asyncio.Semaphore]
+        Bounds the number of fetches running at the same time.
+    """
+
+    _requested_start_date: Union[None, datetime]
+    _requested_end_date: Union[None, datetime]
+    _semaphore: Union[None, asyncio.Semaphore]
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        login: str,
+        password: str,
+        municipality_id: str,
+        start_date: Union[None, datetime] = None,
+        end_date: Union[None, datetime] = None,
+        parser: str = INTRADEL_PARSER_HTML,
+        only_sections: bool = False,
+        pool: Union[None, ConnectionPool] = None,
+        cache: Union[None, ResponseCache] = None,
+        sections: Union[None, Iterable[str]] = None,
+        semaphore: Union[None, asyncio.Semaphore] = None,
+    ) -> None:
+        """
+        Initialize an AsyncIntradelMyContainer instance.
+
+        Parameters:
+        ----------
+        (same as IntradelMyContainer)
+        semaphore : Union[None, asyncio.Semaphore], optional
+            Shared by the instances whose concurrent fetches must be bounded,
+            by default None.
+        """
+
+        # The page is retrieved by fetch(), not by the constructor of the parent.
+        self._configure(
+            login,
+            password,
+            municipality_id,
+            parser=parser,
+            only_sections=only_sections,
+            sections=sections,
+            pool=pool,
+            cache=cache,
+        )
+        self._requested_start_date = start_date
+        self._requested_end_date = end_date
+        self._semaphore = semaphore
+
+    async def fetch(self) -> Self:
+        """
+        Retrieve and parse the page of the account.
+
+        Returns:
+        -------
+        Self
+            The instance, with its sections filled.
+        """
+
+        limit: AbstractAsyncContextManager = (
+            nullcontext() if self._semaphore is None else self._semaphore
+        )
+        async with limit:
+            page_content: bytes = await asyncio.to_thread(
+                self._get_page_content,
+                start_date=self._requested_start_date,
+                end_date=self._requested_end_date,
+            )
+        await asyncio.to_thread(self._parse_and_build, page_content)
+        return self
+
+    def _parse_and_build(self, page_content: bytes) -> None:
+        """
+        Parse the page and build its selected sections.
+
+        Parameters:
+        ----------
+        page_content : bytes
+            The page content as bytes.
+        """
+
+        self._parse_page_content(page_content)
+        self._build_sections()
+
+
+async def fetch_all(
+    containers: Iterable[AsyncIntradelMyContainer], max_concurrency: int = 4
+) -> List[Union[AsyncIntradelMyContainer, BaseException]]:
+    """
+    Fetch several accounts concurrently, with at most max_concurrency fetches running.
+
+    Parameters:
+    ----------
+    containers : Iterable[AsyncIntradelMyContainer]
+        The instances to fetch.
+    max_concurrency : int, optional
+        The maximum number of accounts fetched at the same time, by default 4.
+
+    Returns:
+    -------
+    List[Union[AsyncIntradelMyContainer, BaseException]]
+        The fetched instances, or the exception raised by their fetch, in the order
+        of containers.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_fetch(
+        container: AsyncIntradelMyContainer,
+    ) -> AsyncIntradelMyContainer:
+        async with semaphore:
+            return await container.fetch()
+
+    return await asyncio.gather(
+        *(bounded_fetch(container) for container in containers),
+        return_exceptions=True,
+    )
@@ -0,0 +1,185 @@
+"""Fetch many Intradel accounts on a pool of worker threads."""
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Union
+
+from intradel_my_container import IntradelMyContainer
+from intradel_my_container.cache import ResponseCache
+from intradel_my_container.const import INTRADEL_PARSER_HTML
+from intradel_my_container.session import ConnectionPool
+
+
+@dataclass
+class IntradelJob:
+    """
+    Represents the account and the date range of one fetch.
+
+    Attributes:
+    ----------
+    login : str
+        The login credential.
+    password : str
+        The password credential.
+    municipality_id : str
+        The id of the municipality.
+    start_date : Union[None, datetime]
+        The start date for data retrieval.
+    end_date : Union[None, datetime]
+        The end date for data retrieval.
+    """
+
+    login: str
+    password: str
+    municipality_id: str
+    start_date: Union[None, datetime] = None
+    end_date: Union[None, datetime] = None
+
+
+@dataclass
+class IntradelJobResult:
+    """
+    Represents the outcome of one job.
+
+    Attributes:
+    ----------
+    job : IntradelJob
+        The job.
+    container : Union[None, IntradelMyContainer]
+        The retrieved data, or None when the job failed.
+    error : Union[None, BaseException]
+        The exception raised by the job, or None when it succeeded.
+    """
+
+    job: IntradelJob
+    container: Union[None, IntradelMyContainer] = None
+    error: Union[None, BaseException] = None
+
+
+def _run_job(
+    job: IntradelJob,
+    pool: ConnectionPool,
+    parser: str,
+    only_sections: bool,
+    cache: Union[None, ResponseCache],
+    sections: Union[None, List[str]],
+) -> IntradelMyContainer:
+    """
+    Fetch the data of one job.
+
+    Parameters:
+    ----------
+    job : IntradelJob
+        The job to run.
+    pool : ConnectionPool
+        The connection pool shared by the jobs.
+    parser : str
+        The HTML parser backend.
+    only_sections : bool
+        Only parse the 'div.post__content' sections of the page.
+    cache : Union[None, ResponseCache]
+        The on-disk cache of the pages, or None.
+    sections : Union[None, List[str]]
+        The attributes of the sections to build, or None for all of them.
+
+    Returns:
+    -------
+    IntradelMyContainer
+        The retrieved data.
+    """
+
+    return IntradelMyContainer(
+        login=job.login,
+        password=job.password,
+        municipality_id=job.municipality_id,
+        start_date=job.start_date,
+        end_date=job.end_date,
+        parser=parser,
+        only_sections=only_sections,
+        pool=pool,
+        cache=cache,
+        sections=sections,
+    )
+
+
+def fetch_many(
+    jobs: Iterable[IntradelJob],
+    max_workers: int = 4,
+    requests_per_second: Union[None, float] = 2.0,
+    pool: Union[None, ConnectionPool] = None,
+    parser: str = INTRADEL_PARSER_HTML,
+    only_sections: bool = False,
+    cache: Union[None, ResponseCache] = None,
+    sections: Union[None, Iterable[str]] = None,
+) -> Iterator[IntradelJobResult]:
+    """
+    Run the jobs on a pool of worker threads and yield their results as they complete.
+
+    A job that fails does not stop the others: its exception is returned in its result.
+
+    Parameters:
+    ----------
+    jobs : Iterable[IntradelJob]
+        The jobs to run.
+    max_workers : int, optional
+        The number of worker threads, by default 4.
+    requests_per_second : Union[None, float], optional
+        The maximum number of requests per second sent to Intradel, by default 2.0.
+        None removes the limit. Ignored when a pool is given.
+    pool : Union[None, ConnectionPool], optional
+        The connection pool to use, by default None to create one for this call and
+        close it once every job is done.
+    parser : str, optional
+        The HTML parser backend, by default INTRADEL_PARSER_HTML.
+    only_sections : bool, optional
+        Only parse the 'div.post__content' sections of the page, by default False.
+    cache : Union[None, ResponseCache], optional
+        The on-disk cache of the pages, shared by the jobs, by default None.
+    sections : Union[None, Iterable[str]], optional
+        The attributes of the sections to build, by default None for all of them.
+        The sections are built on their first access, out of the worker threads.
+
+    Yields:
+    ------
+    IntradelJobResult
+        The result of each job, in completion order.
+    """
+
+    selected_sections: Union[None, List[str]] = (
+        None if sections is None else list(sections)
+    )
+    own_pool: bool = pool is None
+    shared_pool: ConnectionPool = (
+        ConnectionPool(
+            pool_maxsize=max_workers, requests_per_second=requests_per_second
+        )
+        if pool is None
+        else pool
+    )
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures: Dict[Future[IntradelMyContainer], IntradelJob] = {
+            executor.submit(
+                _run_job,
+                job,
+                shared_pool,
+                parser,
+                only_sections,
+                cache,
+                selected_sections,
+            ): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is None:
+                yield IntradelJobResult(job=futures[future], container=future.result())
+            else:
+                yield IntradelJobResult(job=futures[future], error=error)
+    finally:
+        # The jobs not started yet are dropped when the caller stops early.
+        executor.shutdown(wait=True, cancel_futures=True)
+        if own_pool:
+            shared_pool.close()
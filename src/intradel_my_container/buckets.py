@@ -0,0 +1,130 @@
+"""Group dated values by day, week, month, quarter or year, in a single pass."""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, Tuple, Union
+
+from intradel_my_container import const
+
+
+@dataclass
+class BucketStats:
+    """
+    Represents the values of one time bucket.
+
+    Attributes:
+    ----------
+    count : int
+        The number of values.
+    total : float
+        The sum of the values.
+    minimum : float
+        The smallest value.
+    maximum : float
+        The largest value.
+    """
+
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+
+
+def bucket_bounds(ordinal: int, granularity: str) -> Tuple[str, int, int]:
+    """
+    Find the bucket of a day.
+
+    The keys are "2023-06-16" by day, "2023-W24" by ISO week, "2023-06" by month,
+    "2023-Q2" by quarter and "2023" by year.
+
+    Parameters:
+    ----------
+    ordinal : int
+        The ordinal of the day.
+    granularity : str
+        One of INTRADEL_GRANULARITIES.
+
+    Returns:
+    -------
+    Tuple[str, int, int]
+        The key of the bucket, and the ordinals of its first and last days.
+    """
+
+    day: date = date.fromordinal(ordinal)
+    first: int
+    match granularity:
+        case const.INTRADEL_GRANULARITY_DAY:
+            return day.isoformat(), ordinal, ordinal
+        case const.INTRADEL_GRANULARITY_WEEK:
+            iso_calendar = day.isocalendar()
+            first = ordinal - day.weekday()
+            return f"{iso_calendar.year}-W{iso_calendar.week:02d}", first, first + 6
+        case const.INTRADEL_GRANULARITY_MONTH:
+            first = ordinal - day.day + 1
+            days: int = calendar.monthrange(day.year, day.month)[1]
+            return f"{day.year}-{day.month:02d}", first, first + days - 1
+        case const.INTRADEL_GRANULARITY_QUARTER:
+            quarter: int = (day.month - 1) // 3
+            first = date(day.year, 3 * quarter + 1, 1).toordinal()
+            last_month: int = 3 * quarter + 3
+            last: int = date(
+                day.year, last_month, calendar.monthrange(day.year, last_month)[1]
+            ).toordinal()
+            return f"{day.year}-Q{quarter + 1}", first, last
+        case const.INTRADEL_GRANULARITY_YEAR:
+            first = date(day.year, 1, 1).toordinal()
+            return str(day.year), first, first + 364 + calendar.isleap(day.year)
+        case _:
+            raise ValueError(
+                f"Unknown granularity '{granularity}'. "
+                f"Use one of {const.INTRADEL_GRANULARITIES}."
+            )
+
+
+def aggregate(
+    points: Iterable[Tuple[int, float]], granularity: str
+) -> Dict[str, BucketStats]:
+    """
+    Calculate the count, sum, minimum and maximum of the values of each bucket.
+
+    The bucket of a day is only looked up when it leaves the bucket of the previous
+    day, so dates in order cost one lookup per bucket. The values of a bucket are
+    added in their order.
+
+    Parameters:
+    ----------
+    points : Iterable[Tuple[int, float]]
+        The ordinal of the day and the value of each point.
+    granularity : str
+        One of INTRADEL_GRANULARITIES.
+
+    Returns:
+    -------
+    Dict[str, BucketStats]
+        The statistics of each bucket, by key in order of first appearance.
+    """
+
+    if granularity not in const.INTRADEL_GRANULARITIES:
+        raise ValueError(
+            f"Unknown granularity '{granularity}'. "
+            f"Use one of {const.INTRADEL_GRANULARITIES}."
+        )
+
+    buckets: Dict[str, BucketStats] = {}
+    first: int = 0
+    last: int = -1
+    stats: Union[None, BucketStats] = None
+    for ordinal, value in points:
+        if stats is None or not first <= ordinal <= last:
+            key, first, last = bucket_bounds(ordinal, granularity)
+            stats = buckets.get(key)
+            if stats is None:
+                stats = buckets[key] = BucketStats(0, 0.0, value, value)
+        stats.count += 1
+        stats.total += value
+        if value < stats.minimum:
+            stats.minimum = value
+        elif value > stats.maximum:
+            stats.maximum = value
+    return buckets
@@ -0,0 +1,224 @@
+"""Keep the pages of Intradel's website on disk, compressed, to avoid fetching them again."""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple, Union
+
+CACHE_SUFFIX: str = ".html.gz"
+
+
+class ResponseCache:
+    """
+    Represents a size-bounded directory of gzip-compressed pages.
+
+    A page is stored per login, municipality and date range. A page stored after the
+    end of its range can no longer change and never expires. The other pages expire
+    after ttl seconds, even once their range has ended. When the directory grows over
+    max_bytes, the least recently read pages are removed.
+
+    Attributes:
+    ----------
+    directory : str
+        The directory holding the pages.
+    ttl : float
+        The lifetime of a page stored before the end of its range, in seconds.
+    max_bytes : int
+        The maximum size of the directory, in bytes.
+    """
+
+    directory: str
+    ttl: float
+    max_bytes: int
+
+    def __init__(
+        self, directory: str, ttl: float = 3600, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        Initialize a ResponseCache instance.
+
+        Parameters:
+        ----------
+        directory : str
+            The directory holding the pages. It is created when missing.
+        ttl : float, optional
+            The lifetime of a page stored before the end of its range, in seconds,
+            by default 3600.
+        max_bytes : int, optional
+            The maximum size of the directory, in bytes, by default 64 MiB.
+        """
+
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(
+        self,
+        login: str,
+        password: str,
+        municipality_id: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> str:
+        """
+        Build the file path of a page.
+
+        The password is part of the digest, so a page is never given back for wrong
+        credentials, and no credential appears in the file name.
+
+        Parameters:
+        ----------
+        login : str
+            The login credential.
+        password : str
+            The password credential.
+        municipality_id : str
+            The id of the municipality.
+        start_date : datetime
+            The start date of the page.
+        end_date : datetime
+            The end date of the page.
+
+        Returns:
+        -------
+        str
+            The path of the compressed page.
+        """
+
+        key: str = "\0".join(
+            [
+                login,
+                password,
+                municipality_id,
+                start_date.strftime("%d-%m-%Y"),
+                end_date.strftime("%d-%m-%Y"),
+            ]
+        )
+        digest: str = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + CACHE_SUFFIX)
+
+    def get(
+        self,
+        login: str,
+        password: str,
+        municipality_id: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Union[None, bytes]:
+        """
+        Read a page from the cache.
+
+        Parameters:
+        ----------
+        login : str
+            The login credential.
+        password : str
+            The password credential.
+        municipality_id : str
+            The id of the municipality.
+        start_date : datetime
+            The start date of the page.
+        end_date : datetime
+            The end date of the page.
+
+        Returns:
+        -------
+        Union[None, bytes]
+            The page content, or None when it is missing or expired.
+        """
+
+        path: str = self._path(login, password, municipality_id, start_date, end_date)
+        try:
+            stored_at: float = os.stat(path).st_mtime
+            now: float = time.time()
+            closed_at: float = (
+                datetime.combine(end_date.date(), datetime.min.time())
+                + timedelta(days=1)
+            ).timestamp()
+            if stored_at < closed_at and now - stored_at > self.ttl:
+                os.remove(path)
+                return None
+            with gzip.open(path, "rb") as cache_file:
+                page_content: bytes = cache_file.read()
+            # The access time orders the eviction, the modification time the expiry.
+            os.utime(path, (now, stored_at))
+        except (FileNotFoundError, EOFError, gzip.BadGzipFile):
+            return None
+        return page_content
+
+    def put(
+        self,
+        login: str,
+        password: str,
+        municipality_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        page_content: bytes,
+    ) -> None:
+        """
+        Store a page in the cache, then evict the oldest pages over max_bytes.
+
+        Parameters:
+        ----------
+        login : str
+            The login credential.
+        password : str
+            The password credential.
+        municipality_id : str
+            The id of the municipality.
+        start_date : datetime
+            The start date of the page.
+        end_date : datetime
+            The end date of the page.
+        page_content : bytes
+            The page content as bytes.
+        """
+
+        path: str = self._path(login, password, municipality_id, start_date, end_date)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(gzip.compress(page_content))
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently read pages until the directory fits in max_bytes.
+        """
+
+        entries: List[Tuple[float, int, str]] = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX):
+                # Another process may have removed the page since the listing.
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+
+        total: int = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove every page of the cache.
+        """
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX):
+                os.remove(entry.path)
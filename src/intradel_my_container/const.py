@@ -6,6 +6,41 @@ from typing import Dict, Final, List
 INTRADEL_URL_LOGIN: Final[str] = "https://www.intradel.be/particulier/"
 INTRADEL_URL_DATA: Final[str] = "https://www.intradel.be/particulier/data.php"
 
+# Parsers
+INTRADEL_PARSER_HTML: Final[str] = "html.parser"
+INTRADEL_PARSER_LXML: Final[str] = "lxml"
+INTRADEL_PARSER_STREAM: Final[str] = "stream"
+INTRADEL_SOUP_PARSERS: Final[List[str]] = [INTRADEL_PARSER_HTML, INTRADEL_PARSER_LXML]
+INTRADEL_PARSERS: Final[List[str]] = INTRADEL_SOUP_PARSERS + [INTRADEL_PARSER_STREAM]
+
+# Aggregation buckets
+INTRADEL_GRANULARITY_DAY: Final[str] = "day"
+INTRADEL_GRANULARITY_WEEK: Final[str] = "week"
+INTRADEL_GRANULARITY_MONTH: Final[str] = "month"
+INTRADEL_GRANULARITY_QUARTER: Final[str] = "quarter"
+INTRADEL_GRANULARITY_YEAR: Final[str] = "year"
+INTRADEL_GRANULARITIES: Final[List[str]] = [
+    INTRADEL_GRANULARITY_DAY,
+    INTRADEL_GRANULARITY_WEEK,
+    INTRADEL_GRANULARITY_MONTH,
+    INTRADEL_GRANULARITY_QUARTER,
+    INTRADEL_GRANULARITY_YEAR,
+]
+
+# Export formats
+INTRADEL_EXPORT_JSON: Final[str] = "json"
+INTRADEL_EXPORT_NDJSON: Final[str] = "ndjson"
+INTRADEL_EXPORT_CSV: Final[str] = "csv"
+INTRADEL_EXPORT_FORMATS: Final[List[str]] = [
+    INTRADEL_EXPORT_JSON,
+    INTRADEL_EXPORT_NDJSON,
+    INTRADEL_EXPORT_CSV,
+]
+
+# Sections
+INTRADEL_SECTION_TAG: Final[str] = "div"
+INTRADEL_SECTION_CLASS: Final[str] = "post__content"
+
 # Mes informations
 
 INTRADEL_INFO_TITLE: Final[str] = "Mes informations"
@@ -29,6 +64,18 @@ INTRADEL_RESIDUAL_SINCE: Final[str] = "Depuis"
 INTRADEL_RECYPARC_TITLE: Final[str] = "RECYPARC"
 INTRADEL_RECYPARC_SINCE: Final[str] = "Depuis"
 
+# IntradelMyContainer attribute of each section, by title
+INTRADEL_SECTION_INFO: Final[str] = "my_informations"
+INTRADEL_SECTION_ORGANIC: Final[str] = "organic"
+INTRADEL_SECTION_RESIDUAL: Final[str] = "residual"
+INTRADEL_SECTION_RECYPARC: Final[str] = "recyparc"
+INTRADEL_SECTIONS: Final[Dict[str, str]] = {
+    INTRADEL_INFO_TITLE: INTRADEL_SECTION_INFO,
+    INTRADEL_ORGANIC_TITLE: INTRADEL_SECTION_ORGANIC,
+    INTRADEL_RESIDUAL_TITLE: INTRADEL_SECTION_RESIDUAL,
+    INTRADEL_RECYPARC_TITLE: INTRADEL_SECTION_RECYPARC,
+}
+
 INTRADEL_QUOTAS: Final[Dict[str, int]] = {
     "ENCOMBRANTS": 4,
     "BOIS": 3,
@@ -40,6 +87,9 @@ INTRADEL_QUOTAS: Final[Dict[str, int]] = {
     "PNEUS": 5,
 }
 
+INTRADEL_QUOTA_UNIT: Final[str] = "m³"
+INTRADEL_QUOTA_UNKNOWN: Final[str] = "unknown"
+
 INTRADEL_QUOTAS_MAPPING: Final[Dict[str, List[str]]] = {
     "ENCOMBRANTS": ["Encombrants", "Enc.valorisables"],
     "BOIS": ["Bois"],
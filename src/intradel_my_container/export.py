@@ -0,0 +1,155 @@
+"""Write the records of Intradel as JSON, NDJSON or CSV rows, one at a time."""
+
+import csv
+import json
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+
+from intradel_my_container import Dropout, Pickup, const
+from intradel_my_container.functions import cleanup
+
+EXPORT_FIELDS: List[str] = [
+    "type",
+    "section",
+    "date",
+    "kilograms",
+    "parc",
+    "materials",
+    "name",
+    "quantity",
+    "unit",
+]
+
+
+def iter_rows(
+    records: Iterable[Tuple[str, Union[Pickup, Dropout]]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Convert the records to rows, each dropout being followed by one row per material.
+
+    Parameters:
+    ----------
+    records : Iterable[Tuple[str, Union[Pickup, Dropout]]]
+        The section title and the Pickup or Dropout record, as given by iter_records.
+
+    Yields:
+    ------
+    Dict[str, Any]
+        The fields of EXPORT_FIELDS used by the row, "type" being "pickup",
+        "dropout" or "material" and "section" the attribute of the section.
+    """
+
+    for title, record in records:
+        section: str = const.INTRADEL_SECTIONS.get(title, title)
+        date: str = record.date.date().isoformat()
+        if isinstance(record, Pickup):
+            yield {
+                "type": "pickup",
+                "section": section,
+                "date": date,
+                "kilograms": record.kilograms,
+            }
+            continue
+        yield {
+            "type": "dropout",
+            "section": section,
+            "date": date,
+            "parc": record.parc,
+            "materials": cleanup(record.raw_materials),
+        }
+        for material in record.materials:
+            yield {
+                "type": "material",
+                "section": section,
+                "date": date,
+                "parc": record.parc,
+                "name": material.name,
+                "quantity": material.quantity,
+                "unit": material.unit,
+            }
+
+
+def write_json(rows: Iterable[Dict[str, Any]], output: TextIO) -> None:
+    """
+    Write the rows as a JSON array, one row per line.
+
+    Parameters:
+    ----------
+    rows : Iterable[Dict[str, Any]]
+        The rows.
+    output : TextIO
+        The text stream written to.
+    """
+
+    separator: str = "[\n"
+    for row in rows:
+        output.write(separator)
+        output.write(json.dumps(row, ensure_ascii=False))
+        separator = ",\n"
+    output.write("[]\n" if separator == "[\n" else "\n]\n")
+
+
+def write_ndjson(rows: Iterable[Dict[str, Any]], output: TextIO) -> None:
+    """
+    Write the rows as newline-delimited JSON, one object per line.
+
+    Parameters:
+    ----------
+    rows : Iterable[Dict[str, Any]]
+        The rows.
+    output : TextIO
+        The text stream written to.
+    """
+
+    for row in rows:
+        output.write(json.dumps(row, ensure_ascii=False))
+        output.write("\n")
+
+
+def write_csv(rows: Iterable[Dict[str, Any]], output: TextIO) -> None:
+    """
+    Write the rows as CSV, with a header of EXPORT_FIELDS.
+
+    Parameters:
+    ----------
+    rows : Iterable[Dict[str, Any]]
+        The rows.
+    output : TextIO
+        The text stream written to.
+    """
+
+    writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+
+
+def write_records(
+    records: Iterable[Tuple[str, Union[Pickup, Dropout]]],
+    output: TextIO,
+    export_format: str,
+) -> None:
+    """
+    Write the records in a format, each row as soon as its record is given.
+
+    Parameters:
+    ----------
+    records : Iterable[Tuple[str, Union[Pickup, Dropout]]]
+        The section title and the Pickup or Dropout record, as given by iter_records.
+    output : TextIO
+        The text stream written to.
+    export_format : str
+        One of INTRADEL_EXPORT_FORMATS.
+    """
+
+    match export_format:
+        case const.INTRADEL_EXPORT_JSON:
+            write_json(iter_rows(records), output)
+        case const.INTRADEL_EXPORT_NDJSON:
+            write_ndjson(iter_rows(records), output)
+        case const.INTRADEL_EXPORT_CSV:
+            write_csv(iter_rows(records), output)
+        case _:
+            raise ValueError(
+                f"Unknown format '{export_format}'. "
+                f"Use one of {const.INTRADEL_EXPORT_FORMATS}."
+            )
@@ -1,9 +1,17 @@
 """Centralize helper functions."""
 import re
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Union
 
-from bs4 import Tag
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+
+from intradel_my_container.const import (
+    INTRADEL_PARSER_HTML,
+    INTRADEL_SECTION_CLASS,
+    INTRADEL_SECTION_TAG,
+    INTRADEL_SOUP_PARSERS,
+)
 
 
 def cleanup(string: str) -> str:
@@ -20,16 +28,129 @@ def cleanup(string: str) -> str:
     str
         The cleaned up string.
     """
-    to_return: str = re.sub("\t+|\n+|\r+", " ", string.strip())
-    to_return = re.sub(r"\s+", " ", to_return.strip())
-    to_return = re.sub(" , ", ", ", to_return.strip())
-    return to_return
+    # str.split() splits on the same whitespace as the \s of the re module.
+    return " ".join(string.split()).replace(" , ", ", ")
+
+
+def _name_start(string: str, start: int, end: int) -> int:
+    """
+    Find where the name of a material begins: after the last comma of its text that
+    is not enclosed by a pair of parentheses.
+
+    Parameters:
+    ----------
+    string : str
+        The materials cell.
+    start : int
+        The end of the previous material.
+    end : int
+        The opening parenthesis of the quantity of the material.
+
+    Returns:
+    -------
+    int
+        The position of the first character of the name.
+    """
+
+    if string.find(",", start, end) == -1:
+        return start
+
+    # A comma is enclosed when a parenthesis opened before it is still open, and
+    # one closed after it was not opened after it.
+    opened: int = 0
+    opened_at: Dict[int, int] = {}
+    for position in range(start, end):
+        character: str = string[position]
+        if character == "(":
+            opened += 1
+        elif character == ")":
+            opened = max(opened - 1, 0)
+        elif character == ",":
+            opened_at[position] = opened
+
+    closed: int = 0
+    for position in range(end - 1, start - 1, -1):
+        character = string[position]
+        if character == ")":
+            closed += 1
+        elif character == "(":
+            closed = max(closed - 1, 0)
+        elif character == "," and (closed == 0 or opened_at[position] == 0):
+            return position + 1
+    return start
+
+
+def tokenize_materials(string: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Split a cleaned up materials cell into its materials, in a single pass.
+
+    A material ends with its quantity, as in "DSM (Autre) (1.00 pièce)": a
+    parenthesis holding a decimal number, one space and the unit. Its name starts
+    after the last comma outside parentheses, so a text without any quantity, as in
+    "Foo, Bois (0.10 m³)", is left out like the former regular expression did. Each
+    character is read a bounded number of times, whatever the cell.
+
+    Parameters:
+    ----------
+    string : str
+        The materials cell, cleaned up, such as "Bois (0.10 m³), Inertes (0.20 m³)".
+
+    Yields:
+    ------
+    Tuple[str, str, str]
+        The name, the quantity and the unit of each material, stripped of spaces.
+    """
+
+    name_start: int = 0
+    position: int = 0
+    while True:
+        close: int = string.find(")", position)
+        if close == -1:
+            return
+        opening: int = string.rfind("(", position, close)
+        position = close + 1
+        if opening == -1:
+            continue
+        quantity, space, unit = string[opening + 1 : close].partition(" ")
+        integer, dot, fraction = quantity.partition(".")
+        if space and dot and integer.isdecimal() and fraction.isdecimal():
+            name: str = string[
+                _name_start(string, name_start, opening) : opening
+            ].strip()
+            yield name, quantity, unit.strip()
+            name_start = position
+
+
+@lru_cache(maxsize=16384)
+def _parse_day_month_year(string: str) -> datetime:
+    """
+    Convert a 'dd-mm-yyyy' string of ASCII digits, the same way strptime would.
+
+    Pickups and dropouts repeat the same dates, so the results are memoized, up to
+    about 45 years of distinct days.
+
+    Parameters:
+    ----------
+    string : str
+        The date string, such as "02-03-2023".
+
+    Returns:
+    -------
+    datetime
+        A datetime object representing the date.
+    """
+
+    return datetime(int(string[6:10]), int(string[3:5]), int(string[0:2]))
 
 
 def find_date(string: str) -> datetime:
     """
     Find a date string in the input using regular expressions and return it as a datetime object.
 
+    A string holding only a 'dd-mm-yyyy' date, the layout of Intradel's tables, is
+    converted without the regular expression. A date of ASCII digits is converted
+    without strptime.
+
     Parameters:
     ----------
     string : str
@@ -42,10 +163,22 @@ def find_date(string: str) -> datetime:
         If no date is found, returns January 1, 1970.
     """
 
+    candidate: str = string.strip()
+    if (
+        len(candidate) == 10
+        and candidate[2] == "-"
+        and candidate[5] == "-"
+        and candidate.isascii()
+        and (candidate[0:2] + candidate[3:5] + candidate[6:10]).isdigit()
+    ):
+        return _parse_day_month_year(candidate)
+
     search = re.search(r"(\d\d-\d\d-\d\d\d\d)", string)
     if search is None:
         print("Cannot extract date. Return 01-01-1970")
         return datetime.strptime("01-01-1970", "%d-%m-%Y")
+    elif search.group(1).isascii():
+        return _parse_day_month_year(search.group(1))
     else:
         return datetime.strptime(search.group(1), "%d-%m-%Y")
 
@@ -101,3 +234,44 @@ def p_to_dictionary(content: Tag) -> Dict[str, str]:
             p_dic[key] = value
 
     return p_dic
+
+
+def make_soup(
+    page_content: bytes,
+    parser: str = INTRADEL_PARSER_HTML,
+    only_sections: bool = False,
+) -> BeautifulSoup:
+    """
+    Build the BeautifulSoup tree of a page with the requested parser backend.
+
+    Parameters:
+    ----------
+    page_content : bytes
+        The raw page content.
+    parser : str, optional
+        One of INTRADEL_SOUP_PARSERS, by default INTRADEL_PARSER_HTML.
+        When the backend is not installed, the stdlib 'html.parser' is used instead.
+    only_sections : bool, optional
+        Only build the 'div.post__content' sections and drop the rest of the page
+        (navigation, footer, scripts), by default False.
+
+    Returns:
+    -------
+    BeautifulSoup
+        The parsed page.
+    """
+
+    if parser not in INTRADEL_SOUP_PARSERS:
+        raise ValueError(
+            f"Unknown parser '{parser}'. Use one of {INTRADEL_SOUP_PARSERS}."
+        )
+
+    parse_only: Union[None, SoupStrainer] = None
+    if only_sections:
+        parse_only = SoupStrainer(INTRADEL_SECTION_TAG, class_=INTRADEL_SECTION_CLASS)
+
+    try:
+        return BeautifulSoup(page_content, parser, parse_only=parse_only)
+    except FeatureNotFound:
+        print(f"Parser '{parser}' is not installed. Use '{INTRADEL_PARSER_HTML}'")
+        return BeautifulSoup(page_content, INTRADEL_PARSER_HTML, parse_only=parse_only)
@@ -0,0 +1,222 @@
+"""Look up the municipalities of Intradel by name, whatever their accents and case."""
+
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+
+from intradel_my_container import const
+
+
+def normalize_name(name: str) -> str:
+    """
+    Fold the accents and the case of a municipality name, and its separators to spaces.
+
+    Parameters:
+    ----------
+    name : str
+        The name, such as "Crisnée" or "SAINT-GEORGES-SUR-MEUSE".
+
+    Returns:
+    -------
+    str
+        The normalized name, such as "crisnee" or "saint georges sur meuse".
+    """
+
+    decomposed: str = unicodedata.normalize("NFKD", name)
+    folded: str = "".join(
+        character for character in decomposed if not unicodedata.combining(character)
+    ).casefold()
+    for separator in "-_'’":
+        folded = folded.replace(separator, " ")
+    return " ".join(folded.split())
+
+
+class _TrieNode:
+    """
+    Represents the names sharing a prefix.
+
+    Attributes:
+    ----------
+    children : Dict[str, _TrieNode]
+        The node of each next character.
+    municipalities : List[Tuple[str, int]]
+        The name and the id of the municipalities under this node, in alphabetical
+        order.
+    """
+
+    __slots__ = ("children", "municipalities")
+
+    children: Dict[str, "_TrieNode"]
+    municipalities: List[Tuple[str, int]]
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.municipalities = []
+
+
+class MunicipalityIndex:
+    """
+    Represents the municipalities, by normalized name and by id.
+
+    A prefix trie holds every name from the start of each of its words, so "nicol"
+    finds "SAINT-NICOLAS" as well as a name starting with it.
+
+    Attributes:
+    ----------
+    ids : Dict[str, int]
+        The id of each normalized name.
+    names : Dict[int, str]
+        The name of each id, as written by Intradel.
+    """
+
+    ids: Dict[str, int]
+    names: Dict[int, str]
+    _root: _TrieNode
+
+    def __init__(
+        self, municipalities: Dict[str, int] = const.INTRADEL_MUNICIPALITIES
+    ) -> None:
+        """
+        Initialize a MunicipalityIndex instance.
+
+        Parameters:
+        ----------
+        municipalities : Dict[str, int], optional
+            The id of each municipality name, by default INTRADEL_MUNICIPALITIES.
+        """
+
+        self.ids = {}
+        self.names = {}
+        self._root = _TrieNode()
+        for name in sorted(municipalities):
+            normalized: str = normalize_name(name)
+            self.ids[normalized] = municipalities[name]
+            self.names[municipalities[name]] = name
+            words: List[str] = normalized.split(" ")
+            for first_word in range(len(words)):
+                self._insert(" ".join(words[first_word:]), (name, municipalities[name]))
+
+    def _insert(self, key: str, municipality: Tuple[str, int]) -> None:
+        """
+        Add a municipality under every prefix of a key.
+
+        Parameters:
+        ----------
+        key : str
+            The normalized key.
+        municipality : Tuple[str, int]
+            The name, as written by Intradel, and the id of the municipality.
+        """
+
+        node: _TrieNode = self._root
+        if node.municipalities[-1:] != [municipality]:
+            node.municipalities.append(municipality)
+        for character in key:
+            node = node.children.setdefault(character, _TrieNode())
+            if node.municipalities[-1:] != [municipality]:
+                node.municipalities.append(municipality)
+
+    def find(self, name: str) -> Union[None, int]:
+        """
+        Find the id of a municipality from its name.
+
+        Parameters:
+        ----------
+        name : str
+            The name, in any case and with or without accents.
+
+        Returns:
+        -------
+        Union[None, int]
+            The id, or None when no municipality has this name.
+        """
+
+        return self.ids.get(normalize_name(name))
+
+    def name(self, municipality_id: int) -> Union[None, str]:
+        """
+        Find the name of a municipality from its id.
+
+        Parameters:
+        ----------
+        municipality_id : int
+            The id of the municipality.
+
+        Returns:
+        -------
+        Union[None, str]
+            The name as written by Intradel, or None when the id is unknown.
+        """
+
+        return self.names.get(municipality_id)
+
+    def search(self, prefix: str) -> List[Tuple[str, int]]:
+        """
+        Find the municipalities whose name, or one of its words, starts with a prefix.
+
+        Parameters:
+        ----------
+        prefix : str
+            The prefix, in any case and with or without accents.
+
+        Returns:
+        -------
+        List[Tuple[str, int]]
+            The name and the id of each municipality, in alphabetical order.
+        """
+
+        node: _TrieNode = self._root
+        for character in normalize_name(prefix):
+            child: Union[None, _TrieNode] = node.children.get(character)
+            if child is None:
+                return []
+            node = child
+        return list(node.municipalities)
+
+    def resolve(self, value: str) -> int:
+        """
+        Find the id of a municipality from its id, its name or a prefix of its name.
+
+        A numeric id is taken as is, even when it is not in the index. A ValueError is
+        raised when no municipality, or more than one, matches the value.
+
+        Parameters:
+        ----------
+        value : str
+            A numeric id, a name or a prefix matching a single municipality.
+
+        Returns:
+        -------
+        int
+            The id of the municipality.
+        """
+
+        value = value.strip()
+        if value.isdecimal():
+            return int(value)
+        municipality_id: Union[None, int] = self.find(value)
+        if municipality_id is not None:
+            return municipality_id
+        matches: List[Tuple[str, int]] = self.search(value)
+        if len(matches) == 1:
+            return matches[0][1]
+        if len(matches) == 0:
+            raise ValueError(f"Unknown municipality '{value}'.")
+        raise ValueError(
+            f"Ambiguous municipality '{value}'. "
+            f"Use one of {[name for name, _ in matches]}."
+        )
+
+
+@lru_cache(maxsize=None)
+def municipality_index() -> MunicipalityIndex:
+    """
+    Give the index of INTRADEL_MUNICIPALITIES, built on the first call.
+
+    Returns:
+    -------
+    MunicipalityIndex
+        The index.
+    """
+
+    return MunicipalityIndex()
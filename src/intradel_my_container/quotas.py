@@ -0,0 +1,324 @@
+"""Measure the recyparc dropouts against the yearly quotas of Intradel."""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Self, Set, Tuple, Union
+
+from intradel_my_container import const
+
+if TYPE_CHECKING:  # pragma: no cover - the package imports this module
+    from intradel_my_container import Dropout, Recyparc
+
+QUOTA_KEYS: List[str] = list(const.INTRADEL_QUOTAS)
+
+
+def quota_index(
+    mapping: Dict[str, List[str]] = const.INTRADEL_QUOTAS_MAPPING
+) -> Dict[str, str]:
+    """
+    Build the reverse index of a quota mapping, from the material names to their quota.
+
+    The names are interned like the ones of the materials, and the placeholder
+    INTRADEL_QUOTA_UNKNOWN of the quotas without known materials is left out.
+
+    Parameters:
+    ----------
+    mapping : Dict[str, List[str]], optional
+        The material names of each quota, by default INTRADEL_QUOTAS_MAPPING.
+
+    Returns:
+    -------
+    Dict[str, str]
+        The quota of each material name.
+    """
+
+    return {
+        sys.intern(name): quota
+        for quota, names in mapping.items()
+        for name in names
+        if name != const.INTRADEL_QUOTA_UNKNOWN
+    }
+
+
+QUOTA_INDEX: Dict[str, str] = quota_index()
+
+
+def consumption_per_year(
+    dropouts: Iterable["Dropout"], index: Union[None, Dict[str, str]] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Calculate the quantity of each quota used per year, in a single pass.
+
+    Only the materials counted in INTRADEL_QUOTA_UNIT count against a quota.
+
+    Parameters:
+    ----------
+    dropouts : Iterable[Dropout]
+        The dropout events.
+    index : Union[None, Dict[str, str]], optional
+        The quota of each material name, by default None for QUOTA_INDEX.
+
+    Returns:
+    -------
+    Dict[str, Dict[str, float]]
+        A dictionary with years as keys, in order of first appearance, and the
+        quantity used of every quota of INTRADEL_QUOTAS as values.
+    """
+
+    material_quotas: Dict[str, str] = QUOTA_INDEX if index is None else index
+    consumption: Dict[str, Dict[str, float]] = {}
+    year: int = 0
+    used: Dict[str, float] = {}
+    for dropout in dropouts:
+        if dropout.date.year != year:
+            year = dropout.date.year
+            used = consumption.setdefault(
+                str(year), dict.fromkeys(const.INTRADEL_QUOTAS, 0.0)
+            )
+        for material in dropout.materials:
+            quota: Union[None, str] = material_quotas.get(material.name)
+            if quota is not None and material.unit == const.INTRADEL_QUOTA_UNIT:
+                used[quota] += material.quantity
+    return consumption
+
+
+def remaining(used: Union[None, Dict[str, float]]) -> Dict[str, float]:
+    """
+    Calculate the quantity left of each quota.
+
+    Parameters:
+    ----------
+    used : Union[None, Dict[str, float]]
+        The quantity used of each quota in a year, or None when nothing was dropped.
+
+    Returns:
+    -------
+    Dict[str, float]
+        The quantity left of every quota of INTRADEL_QUOTAS, negative when the quota
+        is exceeded.
+    """
+
+    if used is None:
+        return {quota: float(limit) for quota, limit in const.INTRADEL_QUOTAS.items()}
+    return {
+        quota: limit - used.get(quota, 0.0)
+        for quota, limit in const.INTRADEL_QUOTAS.items()
+    }
+
+
+@dataclass(frozen=True)
+class QuotaSnapshot:
+    """
+    Represents the state of a QuotaTracker at one point.
+
+    Attributes:
+    ----------
+    consumption : Dict[str, Tuple[float, ...]]
+        The quantity used of each quota of QUOTA_KEYS, in their order, by year.
+    """
+
+    consumption: Dict[str, Tuple[float, ...]]
+
+
+class QuotaTracker:
+    """
+    Represents the quota consumption of an account, updated one dropout at a time.
+
+    Each dropout costs one counter update per material, whatever the length of the
+    history. A dropout of a new year opens the counters of that year, and the queries
+    default to the current year, so the quotas are whole again on January 1st.
+    """
+
+    _slots: Dict[str, int]
+    _years: Dict[str, List[float]]
+    _frozen: Dict[str, Tuple[float, ...]]
+    _dirty: Set[str]
+    _year: int
+    _counters: List[float]
+
+    def __init__(
+        self,
+        dropouts: Iterable["Dropout"] = (),
+        index: Union[None, Dict[str, str]] = None,
+    ) -> None:
+        """
+        Initialize a QuotaTracker instance.
+
+        Parameters:
+        ----------
+        dropouts : Iterable[Dropout], optional
+            The dropout events already known, by default none.
+        index : Union[None, Dict[str, str]], optional
+            The quota of each material name, by default None for QUOTA_INDEX.
+        """
+
+        self._slots = {
+            name: QUOTA_KEYS.index(quota)
+            for name, quota in (QUOTA_INDEX if index is None else index).items()
+        }
+        self._years = {}
+        self._frozen = {}
+        self._dirty = set()
+        self._year = 0
+        self._counters = []
+        self.extend(dropouts)
+
+    @classmethod
+    def from_recyparc(cls, recyparc: "Recyparc") -> Self:
+        """
+        Create a QuotaTracker seeded with the consumption of the recyparc visits.
+
+        Parameters:
+        ----------
+        recyparc : Recyparc
+            The recyparc visits.
+
+        Returns:
+        -------
+        Self
+            The QuotaTracker instance.
+        """
+
+        tracker = cls()
+        for year, used in recyparc.quota_consumption_per_year().items():
+            tracker._years[year] = [used[quota] for quota in QUOTA_KEYS]
+            tracker._dirty.add(year)
+        return tracker
+
+    def add(self, dropout: "Dropout") -> None:
+        """
+        Count the materials of a new dropout event against the quotas of its year.
+
+        Parameters:
+        ----------
+        dropout : Dropout
+            The dropout event.
+        """
+
+        if dropout.date.year != self._year:
+            self._year = dropout.date.year
+            self._counters = self._years.setdefault(
+                str(self._year), [0.0] * len(QUOTA_KEYS)
+            )
+        counters: List[float] = self._counters
+        for material in dropout.materials:
+            slot: Union[None, int] = self._slots.get(material.name)
+            if slot is not None and material.unit == const.INTRADEL_QUOTA_UNIT:
+                counters[slot] += material.quantity
+        self._dirty.add(str(self._year))
+
+    def extend(self, dropouts: Iterable["Dropout"]) -> None:
+        """
+        Count the materials of new dropout events against the quotas of their year.
+
+        Parameters:
+        ----------
+        dropouts : Iterable[Dropout]
+            The dropout events.
+        """
+
+        for dropout in dropouts:
+            self.add(dropout)
+
+    def used(self, year: Union[None, int] = None) -> Dict[str, float]:
+        """
+        Give the quantity used of each quota in a year.
+
+        Parameters:
+        ----------
+        year : Union[None, int], optional
+            The year, by default None for the current year.
+
+        Returns:
+        -------
+        Dict[str, float]
+            The quantity used of every quota of INTRADEL_QUOTAS, in
+            INTRADEL_QUOTA_UNIT.
+        """
+
+        counters: Union[None, List[float]] = self._years.get(
+            str(datetime.today().year if year is None else year)
+        )
+        if counters is None:
+            return dict.fromkeys(QUOTA_KEYS, 0.0)
+        return dict(zip(QUOTA_KEYS, counters))
+
+    def remaining(self, year: Union[None, int] = None) -> Dict[str, float]:
+        """
+        Give the quantity left of each quota in a year.
+
+        Parameters:
+        ----------
+        year : Union[None, int], optional
+            The year, by default None for the current year.
+
+        Returns:
+        -------
+        Dict[str, float]
+            The quantity left of every quota of INTRADEL_QUOTAS, in
+            INTRADEL_QUOTA_UNIT, negative when the quota is exceeded.
+        """
+
+        return remaining(self.used(year))
+
+    def alerts(self, ratio: float = 0.8, year: Union[None, int] = None) -> List[str]:
+        """
+        Find the quotas used to at least a ratio of their limit in a year.
+
+        Parameters:
+        ----------
+        ratio : float, optional
+            The share of the limit, by default 0.8.
+        year : Union[None, int], optional
+            The year, by default None for the current year.
+
+        Returns:
+        -------
+        List[str]
+            The quotas, in the order of INTRADEL_QUOTAS.
+        """
+
+        used: Dict[str, float] = self.used(year)
+        return [
+            quota
+            for quota, limit in const.INTRADEL_QUOTAS.items()
+            if used[quota] >= ratio * limit
+        ]
+
+    def snapshot(self) -> QuotaSnapshot:
+        """
+        Save the state of the tracker.
+
+        Only the years changed since the previous snapshot are copied, the others are
+        shared with it.
+
+        Returns:
+        -------
+        QuotaSnapshot
+            The state of the tracker.
+        """
+
+        for year in self._dirty:
+            self._frozen[year] = tuple(self._years[year])
+        self._dirty.clear()
+        return QuotaSnapshot(consumption=dict(self._frozen))
+
+    def restore(self, snapshot: QuotaSnapshot) -> None:
+        """
+        Go back to a saved state of the tracker.
+
+        Parameters:
+        ----------
+        snapshot : QuotaSnapshot
+            The state of the tracker, as returned by snapshot.
+        """
+
+        self._years = {
+            year: list(consumption)
+            for year, consumption in snapshot.consumption.items()
+        }
+        self._frozen = dict(snapshot.consumption)
+        self._dirty = set()
+        self._year = 0
+        self._counters = []
@@ -0,0 +1,203 @@
+"""Share the HTTP connections to Intradel's website between IntradelMyContainer instances."""
+
+import threading
+import time
+from types import TracebackType
+from typing import Any, Dict, Self, Type, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class RateLimiter:
+    """
+    Space the requests sent to each host, from any number of threads.
+
+    Attributes:
+    ----------
+    requests_per_second : float
+        The maximum number of requests per second and per host.
+    """
+
+    requests_per_second: float
+    _interval: float
+    _next_slot: Dict[str, float]
+    _lock: threading.Lock
+
+    def __init__(self, requests_per_second: float) -> None:
+        """
+        Initialize a RateLimiter instance.
+
+        Parameters:
+        ----------
+        requests_per_second : float
+            The maximum number of requests per second and per host.
+        """
+
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive.")
+
+        self.requests_per_second = requests_per_second
+        self._interval = 1 / requests_per_second
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        """
+        Block until a request can be sent to the host.
+
+        Parameters:
+        ----------
+        host : str
+            The host the request is sent to.
+        """
+
+        with self._lock:
+            now: float = time.monotonic()
+            slot: float = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter waiting for its RateLimiter before sending each request.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs: Any) -> None:
+        self._rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any):
+        url: Union[None, str, bytes] = request.url
+        if isinstance(url, bytes):
+            url = url.decode("utf-8")
+        self._rate_limiter.wait(urlsplit(url or "").hostname or "")
+        return super().send(request, *args, **kwargs)
+
+
+class ConnectionPool:
+    """
+    Represents a bounded pool of keep-alive HTTP connections to Intradel's website.
+
+    Each fetch gets its own requests.Session, so the login cookies of an account are
+    never seen by another one, while the TCP and TLS connections of the pool are reused
+    from one fetch to the next.
+
+    Attributes:
+    ----------
+    pool_connections : int
+        The number of hosts whose connections are kept.
+    pool_maxsize : int
+        The maximum number of connections kept per host. When all of them are in use,
+        a new request waits for a connection to be released.
+    rate_limiter : Union[None, RateLimiter]
+        Spaces the requests sent to each host, or None to send them at once.
+    """
+
+    pool_connections: int
+    pool_maxsize: int
+    rate_limiter: Union[None, RateLimiter]
+    _adapter: HTTPAdapter
+    _closed: bool
+
+    def __init__(
+        self,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        requests_per_second: Union[None, float] = None,
+    ) -> None:
+        """
+        Initialize a ConnectionPool instance.
+
+        Parameters:
+        ----------
+        pool_connections : int, optional
+            The number of hosts whose connections are kept, by default 1.
+        pool_maxsize : int, optional
+            The maximum number of connections kept per host, by default 10.
+        requests_per_second : Union[None, float], optional
+            The maximum number of requests per second and per host, by default None
+            for no limit.
+        """
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.rate_limiter = (
+            None if requests_per_second is None else RateLimiter(requests_per_second)
+        )
+        self._adapter = self._create_adapter()
+        self._closed = False
+
+    def _create_adapter(self) -> HTTPAdapter:
+        """
+        Create the adapter holding the connections of the pool.
+
+        Returns:
+        -------
+        HTTPAdapter
+            The adapter mounted on every session of the pool.
+        """
+
+        if self.rate_limiter is None:
+            return HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=True,
+            )
+        return _RateLimitedAdapter(
+            self.rate_limiter,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True,
+        )
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the pool has been closed.
+        """
+
+        return self._closed
+
+    def session(self) -> requests.Session:
+        """
+        Create a session using the connections of the pool.
+
+        The session must not be closed, as it would close the pool. Dropping it is enough.
+
+        Returns:
+        -------
+        requests.Session
+            A session with its own cookies and the shared connections.
+        """
+
+        if self._closed:
+            raise RuntimeError("The connection pool is closed.")
+
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close every connection of the pool.
+        """
+
+        self._adapter.close()
+        self._closed = True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[None, Type[BaseException]],
+        exc_value: Union[None, BaseException],
+        traceback: Union[None, TracebackType],
+    ) -> None:
+        self.close()
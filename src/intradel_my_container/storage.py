@@ -0,0 +1,424 @@
+"""Keep the history of the Intradel records in an indexed SQLite database."""
+
+import sqlite3
+from datetime import datetime
+from types import TracebackType
+from typing import Dict, Iterable, List, Self, Tuple, Type, Union
+
+from intradel_my_container import (
+    Dropout,
+    IntradelMyContainer,
+    Pickup,
+    Recyparc,
+    TrashBin,
+)
+
+HISTORY_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS pickups (
+    chip_number TEXT NOT NULL,
+    date TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    kilograms REAL NOT NULL,
+    PRIMARY KEY (chip_number, date, sequence)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS pickups_chip_number_year ON pickups (chip_number, year);
+CREATE TABLE IF NOT EXISTS dropouts (
+    id INTEGER PRIMARY KEY,
+    login TEXT NOT NULL,
+    date TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    parc TEXT NOT NULL,
+    raw_materials TEXT NOT NULL,
+    UNIQUE (login, date, sequence)
+);
+CREATE INDEX IF NOT EXISTS dropouts_login_year ON dropouts (login, year);
+CREATE TABLE IF NOT EXISTS materials (
+    dropout_id INTEGER NOT NULL REFERENCES dropouts (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    unit TEXT NOT NULL,
+    PRIMARY KEY (dropout_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS materials_name_unit ON materials (name, unit);
+"""
+
+
+class HistoryStore:
+    """
+    Represents a SQLite database of the pickups, dropouts and materials.
+
+    The pickups are stored by chip number, the dropouts and their materials by login.
+    Saving records replaces the stored ones of the dates they cover, from the first to
+    the last, so the records of overlapping date ranges can be saved as they are
+    retrieved. The records of the same day are kept apart, numbered in their order.
+
+    Attributes:
+    ----------
+    path : str
+        The path of the database file, or ":memory:".
+    """
+
+    path: str
+    _connection: sqlite3.Connection
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Initialize a HistoryStore instance, creating the tables when missing.
+
+        Parameters:
+        ----------
+        path : str, optional
+            The path of the database file, by default ":memory:".
+        """
+
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(HISTORY_SCHEMA)
+
+    def save_pickups(self, chip_number: str, pickups: Iterable[Pickup]) -> None:
+        """
+        Replace the pickup events of a trash bin over the dates they cover.
+
+        Parameters:
+        ----------
+        chip_number : str
+            The chip number of the trash bin.
+        pickups : Iterable[Pickup]
+            Every pickup event of the trash bin from the first date to the last.
+        """
+
+        rows: List[Tuple[str, str, int, int, float]] = []
+        sequences: Dict[str, int] = {}
+        for pickup in pickups:
+            date: str = pickup.date.isoformat()
+            sequence: int = sequences.get(date, 0)
+            sequences[date] = sequence + 1
+            rows.append(
+                (chip_number, date, sequence, pickup.date.year, pickup.kilograms)
+            )
+        if len(rows) == 0:
+            return
+
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM pickups WHERE chip_number = ? AND date >= ? AND date <= ?",
+                (chip_number, min(sequences), max(sequences)),
+            )
+            self._connection.executemany(
+                "INSERT INTO pickups (chip_number, date, sequence, year, kilograms)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def save_trash_bin(self, trash_bin: TrashBin) -> None:
+        """
+        Replace the pickup events of a trash bin, under its chip number.
+
+        Parameters:
+        ----------
+        trash_bin : TrashBin
+            The trash bin.
+        """
+
+        self.save_pickups(trash_bin.chip_number, trash_bin.pickups)
+
+    def save_dropouts(self, login: str, dropouts: Iterable[Dropout]) -> None:
+        """
+        Replace the dropout events of an account over the dates they cover, with their
+        materials.
+
+        Parameters:
+        ----------
+        login : str
+            The login of the account.
+        dropouts : Iterable[Dropout]
+            Every dropout event of the account from the first date to the last.
+        """
+
+        rows: List[Tuple[str, str, int, int, str, str]] = []
+        material_rows: List[Tuple[int, str, float, str, str, str, int]] = []
+        sequences: Dict[str, int] = {}
+        for dropout in dropouts:
+            date: str = dropout.date.isoformat()
+            sequence: int = sequences.get(date, 0)
+            sequences[date] = sequence + 1
+            rows.append(
+                (
+                    login,
+                    date,
+                    sequence,
+                    dropout.date.year,
+                    dropout.parc,
+                    dropout.raw_materials,
+                )
+            )
+            material_rows.extend(
+                (
+                    position,
+                    material.name,
+                    material.quantity,
+                    material.unit,
+                    login,
+                    date,
+                    sequence,
+                )
+                for position, material in enumerate(dropout.materials)
+            )
+        if len(rows) == 0:
+            return
+
+        with self._connection:
+            # The materials of the deleted dropouts are deleted by cascade.
+            self._connection.execute(
+                "DELETE FROM dropouts WHERE login = ? AND date >= ? AND date <= ?",
+                (login, min(sequences), max(sequences)),
+            )
+            self._connection.executemany(
+                "INSERT INTO dropouts"
+                " (login, date, sequence, year, parc, raw_materials)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.executemany(
+                "INSERT INTO materials (dropout_id, position, name, quantity, unit)"
+                " SELECT id, ?, ?, ?, ? FROM dropouts"
+                " WHERE login = ? AND date = ? AND sequence = ?",
+                material_rows,
+            )
+
+    def save_recyparc(self, login: str, recyparc: Recyparc) -> None:
+        """
+        Replace the dropout events of the recyparc visits of an account.
+
+        Parameters:
+        ----------
+        login : str
+            The login of the account.
+        recyparc : Recyparc
+            The recyparc visits.
+        """
+
+        self.save_dropouts(login, recyparc.dropout)
+
+    def save_container(self, container: IntradelMyContainer) -> None:
+        """
+        Replace the records retrieved by an IntradelMyContainer instance.
+
+        Parameters:
+        ----------
+        container : IntradelMyContainer
+            The retrieved data.
+        """
+
+        for trash_bin in (
+            getattr(container, "organic", None),
+            getattr(container, "residual", None),
+        ):
+            if trash_bin is not None:
+                self.save_trash_bin(trash_bin)
+        recyparc: Union[None, Recyparc] = getattr(container, "recyparc", None)
+        if recyparc is not None:
+            self.save_recyparc(container.login, recyparc)
+
+    def pickups(
+        self,
+        chip_number: str,
+        start_date: Union[None, datetime] = None,
+        end_date: Union[None, datetime] = None,
+    ) -> List[Pickup]:
+        """
+        Read the pickup events of a trash bin, in date order.
+
+        Parameters:
+        ----------
+        chip_number : str
+            The chip number of the trash bin.
+        start_date : Union[None, datetime], optional
+            The first date included, by default None for no limit.
+        end_date : Union[None, datetime], optional
+            The last date included, by default None for no limit.
+
+        Returns:
+        -------
+        List[Pickup]
+            The pickup events.
+        """
+
+        cursor = self._connection.execute(
+            "SELECT date, kilograms FROM pickups"
+            " WHERE chip_number = ? AND date >= ? AND date <= ?"
+            " ORDER BY date, sequence",
+            (
+                chip_number,
+                (datetime.min if start_date is None else start_date).isoformat(),
+                (datetime.max if end_date is None else end_date).isoformat(),
+            ),
+        )
+        return [
+            Pickup(date=datetime.fromisoformat(date), kilograms=kilograms)
+            for date, kilograms in cursor
+        ]
+
+    def dropouts(self, login: str) -> List[Dropout]:
+        """
+        Read the dropout events of an account, in date order.
+
+        Parameters:
+        ----------
+        login : str
+            The login of the account.
+
+        Returns:
+        -------
+        List[Dropout]
+            The dropout events.
+        """
+
+        cursor = self._connection.execute(
+            "SELECT date, parc, raw_materials FROM dropouts"
+            " WHERE login = ? ORDER BY date, sequence",
+            (login,),
+        )
+        return [
+            Dropout(date=datetime.fromisoformat(date), parc=parc, materials=materials)
+            for date, parc, materials in cursor
+        ]
+
+    def total_collects(self, chip_number: str) -> int:
+        """
+        Calculate the total number of pickup events of a trash bin.
+
+        Parameters:
+        ----------
+        chip_number : str
+            The chip number of the trash bin.
+
+        Returns:
+        -------
+        int
+            The total number of pickup events.
+        """
+
+        (total,) = self._connection.execute(
+            "SELECT COUNT(*) FROM pickups WHERE chip_number = ?", (chip_number,)
+        ).fetchone()
+        return total
+
+    def total_collects_per_year(self, chip_number: str) -> Dict[str, int]:
+        """
+        Calculate the total number of pickup events of a trash bin per year.
+
+        Parameters:
+        ----------
+        chip_number : str
+            The chip number of the trash bin.
+
+        Returns:
+        -------
+        Dict[str, int]
+            A dictionary with years as keys and the corresponding total pickup events as values.
+        """
+
+        cursor = self._connection.execute(
+            "SELECT year, COUNT(*) FROM pickups"
+            " WHERE chip_number = ? GROUP BY year ORDER BY year",
+            (chip_number,),
+        )
+        return {str(year): total for year, total in cursor}
+
+    def total_kilograms(self, chip_number: str) -> float:
+        """
+        Calculate the total weight of materials collected from a trash bin.
+
+        Parameters:
+        ----------
+        chip_number : str
+            The chip number of the trash bin.
+
+        Returns:
+        -------
+        float
+            The total weight of materials collected in kilograms.
+        """
+
+        (total,) = self._connection.execute(
+            "SELECT TOTAL(kilograms) FROM pickups WHERE chip_number = ?",
+            (chip_number,),
+        ).fetchone()
+        return total
+
+    def total_kilograms_per_year(self, chip_number: str) -> Dict[str, float]:
+        """
+        Calculate the total weight of materials collected from a trash bin per year.
+
+        Parameters:
+        ----------
+        chip_number : str
+            The chip number of the trash bin.
+
+        Returns:
+        -------
+        Dict[str, float]
+            A dictionary with years as keys and the corresponding total weight of materials
+            collected as values.
+        """
+
+        cursor = self._connection.execute(
+            "SELECT year, TOTAL(kilograms) FROM pickups"
+            " WHERE chip_number = ? GROUP BY year ORDER BY year",
+            (chip_number,),
+        )
+        return {str(year): total for year, total in cursor}
+
+    def total_quantity_per_year(
+        self, login: str, unit: str, name: Union[None, str] = None
+    ) -> Dict[str, float]:
+        """
+        Calculate the total quantity of materials dropped by an account per year.
+
+        Parameters:
+        ----------
+        login : str
+            The login of the account.
+        unit : str
+            The unit of the quantities summed.
+        name : Union[None, str], optional
+            The name of the material, by default None for every material.
+
+        Returns:
+        -------
+        Dict[str, float]
+            A dictionary with years as keys and the corresponding total quantity as values.
+        """
+
+        cursor = self._connection.execute(
+            "SELECT dropouts.year, TOTAL(materials.quantity)"
+            " FROM dropouts JOIN materials ON materials.dropout_id = dropouts.id"
+            " WHERE dropouts.login = ? AND materials.unit = ?"
+            " AND (? IS NULL OR materials.name = ?)"
+            " GROUP BY dropouts.year ORDER BY dropouts.year",
+            (login, unit, name, name),
+        )
+        return {str(year): total for year, total in cursor}
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[None, Type[BaseException]],
+        exc_value: Union[None, BaseException],
+        traceback: Union[None, TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,333 @@
+"""Event-driven parser of Intradel's website. Build the records without a DOM."""
+
+import codecs
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+from intradel_my_container import Dropout, Pickup, const
+from intradel_my_container.functions import cleanup, find_date
+
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
+Record = Union[Pickup, Dropout]
+
+
+@dataclass
+class StreamSection:
+    """
+    Represents a 'post__content' section read by the IntradelPageParser.
+
+    Attributes:
+    ----------
+    title : str
+        The text of the first 'h3' tag of the section.
+    dictionary : Dict[str, str]
+        The key-value pairs of the 'p' tags, as returned by p_to_dictionary.
+    pickups : List[Pickup]
+        The pickup events of an organic or residual section.
+    dropouts : List[Dropout]
+        The dropout events of a recyparc section.
+    """
+
+    title: str = ""
+    dictionary: Dict[str, str] = field(default_factory=dict)
+    pickups: List[Pickup] = field(default_factory=list)
+    dropouts: List[Dropout] = field(default_factory=list)
+
+
+class IntradelPageParser(HTMLParser):
+    """
+    Parse an Intradel page from HTMLParser events.
+
+    Pickup and Dropout records are created from the '<tr>'/'<td>' events of the
+    'table_results' tables, so no tree of the page is ever built.
+
+    Attributes:
+    ----------
+    sections : Dict[str, StreamSection]
+        The sections found so far, by title.
+    on_record : Union[None, Callable[[str, Record], None]]
+        Called with the section title and each record. When set, the records
+        are not kept in the sections.
+    titles : Union[None, List[str]]
+        The titles of the sections whose records are created, or None for all of them.
+    """
+
+    sections: Dict[str, StreamSection]
+    on_record: Union[None, Callable[[str, Record], None]]
+    titles: Union[None, List[str]]
+
+    def __init__(
+        self,
+        on_record: Union[None, Callable[[str, Record], None]] = None,
+        titles: Union[None, Iterable[str]] = None,
+    ) -> None:
+        """
+        Initialize an IntradelPageParser instance.
+
+        Parameters:
+        ----------
+        on_record : Union[None, Callable[[str, Record], None]], optional
+            Called with the section title and each record, by default None.
+        titles : Union[None, Iterable[str]], optional
+            The titles of the sections whose records are created, by default None
+            for all of them. The other sections are found without their records.
+        """
+
+        super().__init__(convert_charrefs=True)
+        self.sections = {}
+        self.on_record = on_record
+        self.titles = None if titles is None else list(titles)
+        self._section: Union[None, StreamSection] = None
+        self._div_depth: int = 0
+        self._h3_seen: bool = False
+        self._h3_text: Union[None, List[str]] = None
+        self._p_depth: int = 0
+        self._p_text: List[str] = []
+        # 0: before the results table, 1: in it, 2: in its tbody, 3: after its tbody
+        self._table_state: int = 0
+        self._cells: Union[None, List[str]] = None
+        self._cell_text: Union[None, List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Union[str, None]]]):
+        if self._section is None:
+            if tag == const.INTRADEL_SECTION_TAG:
+                classes = (dict(attrs).get("class") or "").split()
+                if const.INTRADEL_SECTION_CLASS in classes:
+                    self._section = StreamSection()
+                    self._div_depth = 1
+                    self._h3_seen = False
+                    self._table_state = 0
+            return
+
+        match tag:
+            case const.INTRADEL_SECTION_TAG:
+                self._div_depth += 1
+            case "h3":
+                if not self._h3_seen:
+                    self._h3_seen = True
+                    self._h3_text = []
+            case "p":
+                if self._p_depth == 0:
+                    self._p_text = []
+                self._p_depth += 1
+            case "table":
+                if self._table_state == 0 and dict(attrs).get("id") == "table_results":
+                    self._table_state = 1
+            case "tbody":
+                if self._table_state == 1:
+                    self._table_state = 2
+            case "tr":
+                if self._table_state == 2:
+                    self._cells = []
+            case "td":
+                if self._cells is not None:
+                    self._cell_text = []
+            case _:
+                pass
+
+    def handle_endtag(self, tag: str):
+        if self._section is None:
+            return
+
+        match tag:
+            case const.INTRADEL_SECTION_TAG:
+                self._div_depth -= 1
+                if self._div_depth == 0:
+                    self._end_section()
+            case "h3":
+                if self._h3_text is not None:
+                    self._section.title = "".join(self._h3_text)
+                    self._h3_text = None
+            case "p":
+                if self._p_depth > 0:
+                    self._p_depth -= 1
+                    if self._p_depth == 0:
+                        self._add_p_text("".join(self._p_text))
+            case "td":
+                if self._cells is not None and self._cell_text is not None:
+                    self._cells.append("".join(self._cell_text))
+                    self._cell_text = None
+            case "tr":
+                if self._cells is not None:
+                    self._add_row(self._cells)
+                    self._cells = None
+            case "tbody":
+                if self._table_state == 2:
+                    self._table_state = 3
+            case _:
+                pass
+
+    def handle_data(self, data: str):
+        if self._section is None:
+            return
+        if self._h3_text is not None:
+            self._h3_text.append(data)
+        if self._p_depth > 0:
+            self._p_text.append(data)
+        if self._cell_text is not None:
+            self._cell_text.append(data)
+
+    def _add_p_text(self, text: str) -> None:
+        """
+        Store a 'p' tag text as a key-value pair, the same way p_to_dictionary does.
+
+        Parameters:
+        ----------
+        text : str
+            The whole text of the 'p' tag.
+        """
+
+        if self._section is None:
+            return
+        splitted_text: List[str] = text.split(":")
+        if len(splitted_text) == 2:
+            self._section.dictionary[cleanup(splitted_text[0])] = cleanup(
+                splitted_text[1]
+            )
+
+    def _add_row(self, cells: List[str]) -> None:
+        """
+        Create the record of a table row of the current section.
+
+        Parameters:
+        ----------
+        cells : List[str]
+            The text of each 'td' tag of the row.
+        """
+
+        if self._section is None or (
+            self.titles is not None and self._section.title not in self.titles
+        ):
+            return
+
+        record: Record
+        match self._section.title:
+            case const.INTRADEL_ORGANIC_TITLE | const.INTRADEL_RESIDUAL_TITLE:
+                record = Pickup(date=find_date(cells[0]), kilograms=float(cells[2]))
+                if self.on_record is None:
+                    self._section.pickups.append(record)
+            case const.INTRADEL_RECYPARC_TITLE:
+                record = Dropout(
+                    date=find_date(cells[0]), parc=cells[1], materials=cells[2]
+                )
+                if self.on_record is None:
+                    self._section.dropouts.append(record)
+            case _:
+                return
+
+        if self.on_record is not None:
+            self.on_record(self._section.title, record)
+
+    def _end_section(self) -> None:
+        """
+        Close the current section and keep it when it has a title.
+        """
+
+        if self._section is not None and self._section.title:
+            self.sections[self._section.title] = self._section
+        self._section = None
+        self._h3_text = None
+        self._p_depth = 0
+        self._cells = None
+        self._cell_text = None
+
+
+def _feed(
+    parser: IntradelPageParser,
+    page_content: bytes,
+    encoding: str,
+    chunk_size: int,
+) -> Iterator[None]:
+    """
+    Feed the page to the parser by chunks, yielding after each chunk.
+
+    Parameters:
+    ----------
+    parser : IntradelPageParser
+        The parser to feed.
+    page_content : bytes
+        The page content as bytes.
+    encoding : str
+        The encoding of the page.
+    chunk_size : int
+        The number of bytes decoded and parsed at once.
+    """
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    view = memoryview(page_content)
+    for start in range(0, len(view), chunk_size):
+        parser.feed(decoder.decode(view[start : start + chunk_size]))
+        yield
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    yield
+
+
+def parse_page(
+    page_content: bytes,
+    encoding: str = "utf-8",
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    titles: Union[None, Iterable[str]] = None,
+) -> Dict[str, StreamSection]:
+    """
+    Parse an Intradel page without building a DOM.
+
+    Parameters:
+    ----------
+    page_content : bytes
+        The page content as bytes.
+    encoding : str, optional
+        The encoding of the page, by default "utf-8".
+    chunk_size : int, optional
+        The number of bytes decoded and parsed at once, by default STREAM_CHUNK_SIZE.
+    titles : Union[None, Iterable[str]], optional
+        The titles of the sections whose records are created, by default None for
+        all of them.
+
+    Returns:
+    -------
+    Dict[str, StreamSection]
+        The sections of the page, by title.
+    """
+
+    parser = IntradelPageParser(titles=titles)
+    for _ in _feed(parser, page_content, encoding, chunk_size):
+        pass
+    return parser.sections
+
+
+def iter_records(
+    page_content: bytes,
+    encoding: str = "utf-8",
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[Tuple[str, Record]]:
+    """
+    Yield the Pickup and Dropout records of an Intradel page as they are parsed.
+
+    Only the records of the current chunk are held in memory, whatever the
+    number of rows of the page.
+
+    Parameters:
+    ----------
+    page_content : bytes
+        The page content as bytes.
+    encoding : str, optional
+        The encoding of the page, by default "utf-8".
+    chunk_size : int, optional
+        The number of bytes decoded and parsed at once, by default STREAM_CHUNK_SIZE.
+
+    Yields:
+    ------
+    Tuple[str, Record]
+        The section title and the Pickup or Dropout record.
+    """
+
+    pending: List[Tuple[str, Record]] = []
+    parser = IntradelPageParser(
+        on_record=lambda title, record: pending.append((title, record))
+    )
+    for _ in _feed(parser, page_content, encoding, chunk_size):
+        yield from pending
+        pending.clear()
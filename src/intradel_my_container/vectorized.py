@@ -0,0 +1,136 @@
+"""Aggregate the pickup columns with NumPy, when it is installed."""
+
+from array import array
+from datetime import date
+from typing import Any, Dict, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the installed extras
+    numpy = None  # type: ignore[assignment]
+
+NUMPY_AVAILABLE: bool = numpy is not None
+
+# Below this number of pickups, creating the NumPy arrays costs more than the loops.
+NUMPY_MIN_PICKUPS: int = 256
+
+_EPOCH_ORDINAL: int = date(1970, 1, 1).toordinal()
+
+
+def use_numpy(ordinals: array) -> bool:
+    """
+    Tell whether the NumPy engine should aggregate the columns.
+
+    Parameters:
+    ----------
+    ordinals : array
+        The ordinal of the day of each pickup event.
+
+    Returns:
+    -------
+    bool
+        True when NumPy is installed and the columns are long enough.
+    """
+
+    return NUMPY_AVAILABLE and len(ordinals) >= NUMPY_MIN_PICKUPS
+
+
+def _year_bins(ordinals: array) -> Tuple[Any, Any, int]:
+    """
+    Give each pickup event the bin of its year, the first year being bin 0.
+
+    Parameters:
+    ----------
+    ordinals : array
+        The ordinal of the day of each pickup event.
+
+    Returns:
+    -------
+    Tuple[Any, Any, int]
+        The bin of each pickup event, the used bins in order of first appearance
+        and the year of bin 0.
+    """
+
+    days = numpy.frombuffer(ordinals, dtype=numpy.int32) - _EPOCH_ORDINAL
+    years = days.astype("datetime64[D]").astype("datetime64[Y]").astype(numpy.intp)
+    first_year: int = int(years.min())
+    bins = years - first_year
+
+    if bool(numpy.all(bins[1:] >= bins[:-1])):
+        # In date order, the years appear in ascending order.
+        return bins, numpy.flatnonzero(numpy.bincount(bins)), first_year + 1970
+
+    used_bins, first_indexes = numpy.unique(bins, return_index=True)
+    order = used_bins[numpy.argsort(first_indexes, kind="stable")]
+    return bins, order, first_year + 1970
+
+
+def count_per_year(ordinals: array) -> Dict[str, int]:
+    """
+    Calculate the number of pickup events per year, with numpy.bincount.
+
+    Parameters:
+    ----------
+    ordinals : array
+        The ordinal of the day of each pickup event.
+
+    Returns:
+    -------
+    Dict[str, int]
+        A dictionary with years as keys, in order of first appearance, and the number
+        of pickup events as values.
+    """
+
+    bins, order, first_year = _year_bins(ordinals)
+    counts = numpy.bincount(bins)[order]
+    return dict(zip(map(str, (order + first_year).tolist()), counts.tolist()))
+
+
+def kilograms_per_year(ordinals: array, kilograms: array) -> Dict[str, float]:
+    """
+    Calculate the total weight of materials collected per year, with numpy.bincount.
+
+    numpy.bincount adds the weights of each bin in their order, so the totals are
+    the same as the ones of a Python loop, to the last bit.
+
+    Parameters:
+    ----------
+    ordinals : array
+        The ordinal of the day of each pickup event.
+    kilograms : array
+        The weight of materials collected at each pickup event.
+
+    Returns:
+    -------
+    Dict[str, float]
+        A dictionary with years as keys, in order of first appearance, and the total
+        weight of materials collected as values.
+    """
+
+    bins, order, first_year = _year_bins(ordinals)
+    totals = numpy.bincount(
+        bins, weights=numpy.frombuffer(kilograms, dtype=numpy.float64)
+    )[order]
+    return dict(zip(map(str, (order + first_year).tolist()), totals.tolist()))
+
+
+def total_kilograms(kilograms: array) -> float:
+    """
+    Calculate the total weight of materials collected, with numpy.cumsum.
+
+    numpy.sum adds by pairs, numpy.cumsum in order like a Python loop.
+
+    Parameters:
+    ----------
+    kilograms : array
+        The weight of materials collected at each pickup event.
+
+    Returns:
+    -------
+    float
+        The total weight of materials collected in kilograms.
+    """
+
+    if len(kilograms) == 0:
+        return 0.0
+    return float(numpy.cumsum(numpy.frombuffer(kilograms, dtype=numpy.float64))[-1])
@@ -0,0 +1,38 @@
+import os
+from typing import Callable
+
+import pytest
+
+from intradel_my_container import IntradelMyContainer
+
+
+@pytest.fixture(scope="session")
+def page_content() -> bytes:
+    current_path = os.path.dirname(__file__)
+    page_content_file_path = os.path.join(current_path, "page.content.html")
+    with open(page_content_file_path, "rb") as my_file:
+        return my_file.read()
+
+
+@pytest.fixture
+def disable_intradel_call(monkeypatch, page_content):
+    def stunted_get(container: IntradelMyContainer, *args, **kwargs) -> bytes:
+        # A failed login gives back a page without any section.
+        if container._login == "wrong":
+            return b"<html></html>"
+        return page_content
+
+    monkeypatch.setattr(IntradelMyContainer, "_get_page_content", stunted_get)
+
+
+@pytest.fixture
+def mocked_container(disable_intradel_call) -> Callable[..., IntradelMyContainer]:
+    def make_container(**kwargs) -> IntradelMyContainer:
+        return IntradelMyContainer(
+            login="not_required__mocked",
+            password="not_required__mocked",
+            municipality_id="not_required__mocked",
+            **kwargs,
+        )
+
+    return make_container
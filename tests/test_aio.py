@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+from typing import List, Union
+
+import pytest
+
+from intradel_my_container import (
+    CannotParse,
+    Informations,
+    IntradelMyContainer,
+    Organic,
+)
+from intradel_my_container.aio import AsyncIntradelMyContainer, fetch_all
+
+
+class ConcurrencyProbe:
+    def __init__(self, page_content: bytes) -> None:
+        self.page_content = page_content
+        self.lock = threading.Lock()
+        self.running = 0
+        self.highest = 0
+
+    def get_page_content(self, *args, **kwargs) -> bytes:
+        with self.lock:
+            self.running += 1
+            self.highest = max(self.highest, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return self.page_content
+
+
+@pytest.fixture
+def probe(monkeypatch, page_content) -> ConcurrencyProbe:
+    concurrency_probe = ConcurrencyProbe(page_content)
+    monkeypatch.setattr(
+        IntradelMyContainer, "_get_page_content", concurrency_probe.get_page_content
+    )
+    return concurrency_probe
+
+
+def test_fetch(probe):
+    data: AsyncIntradelMyContainer = asyncio.run(
+        AsyncIntradelMyContainer("login", "password", "26").fetch()
+    )
+    assert (
+        data.my_informations.__class__ == Informations
+        and data.organic.__class__ == Organic
+        and len(data.recyparc.dropout) == 38
+    )
+
+
+def test_fetch_nothing_before_await(probe):
+    data = AsyncIntradelMyContainer("login", "password", "26")
+    assert not hasattr(data, "organic") and probe.highest == 0
+
+
+def test_fetch_semaphore(probe):
+    async def run() -> None:
+        semaphore = asyncio.Semaphore(2)
+        await asyncio.gather(
+            *(
+                AsyncIntradelMyContainer(
+                    "login", "password", "26", semaphore=semaphore
+                ).fetch()
+                for _ in range(6)
+            )
+        )
+
+    asyncio.run(run())
+    assert probe.highest == 2
+
+
+def test_fetch_all(probe):
+    containers: List[AsyncIntradelMyContainer] = [
+        AsyncIntradelMyContainer("login", "password", "26", parser="stream")
+        for _ in range(5)
+    ]
+    results: List[Union[AsyncIntradelMyContainer, BaseException]] = asyncio.run(
+        fetch_all(containers, max_concurrency=3)
+    )
+    assert results == containers and probe.highest == 3
+
+
+def test_fetch_all_errors(monkeypatch):
+    monkeypatch.setattr(
+        IntradelMyContainer, "_get_page_content", lambda *args, **kwargs: b"<html/>"
+    )
+    results = asyncio.run(
+        fetch_all([AsyncIntradelMyContainer("login", "password", "26")])
+    )
+    assert isinstance(results[0], CannotParse)
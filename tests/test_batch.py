@@ -0,0 +1,74 @@
+import time
+from typing import List
+
+import pytest
+
+from intradel_my_container import CannotParse, ConnectionPool, IntradelMyContainer
+from intradel_my_container.batch import IntradelJob, IntradelJobResult, fetch_many
+from intradel_my_container.session import RateLimiter
+
+pytestmark = pytest.mark.usefixtures("disable_intradel_call")
+
+
+def test_fetch_many():
+    jobs: List[IntradelJob] = [
+        IntradelJob(login=f"login{index}", password="password", municipality_id="26")
+        for index in range(5)
+    ]
+    results: List[IntradelJobResult] = list(
+        fetch_many(jobs, max_workers=3, parser="stream")
+    )
+    assert sorted(result.job.login for result in results) == [
+        job.login for job in jobs
+    ] and all(
+        result.error is None
+        and result.container is not None
+        and len(result.container.organic.pickups) == 70
+        for result in results
+    )
+
+
+def test_fetch_many_errors():
+    jobs: List[IntradelJob] = [
+        IntradelJob(login="wrong", password="password", municipality_id="26"),
+        IntradelJob(login="right", password="password", municipality_id="26"),
+    ]
+    results = {result.job.login: result for result in fetch_many(jobs)}
+    assert (
+        isinstance(results["wrong"].error, CannotParse)
+        and results["wrong"].container is None
+        and results["right"].error is None
+    )
+
+
+def test_fetch_many_given_pool():
+    with ConnectionPool() as pool:
+        list(fetch_many([IntradelJob("login", "password", "26")], pool=pool))
+        assert not pool.closed
+
+
+def test_rate_limiter_same_host():
+    rate_limiter: RateLimiter = RateLimiter(requests_per_second=50)
+    start: float = time.monotonic()
+    for _ in range(6):
+        rate_limiter.wait("www.intradel.be")
+    assert time.monotonic() - start >= 0.09
+
+
+def test_rate_limiter_other_hosts():
+    rate_limiter: RateLimiter = RateLimiter(requests_per_second=1)
+    start: float = time.monotonic()
+    rate_limiter.wait("www.intradel.be")
+    rate_limiter.wait("example.org")
+    assert time.monotonic() - start < 0.5
+
+
+def test_rate_limiter_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_second=0)
+
+
+def test_pool_rate_limited_adapter():
+    with ConnectionPool(requests_per_second=5) as pool:
+        adapter = pool.session().get_adapter("https://www.intradel.be")
+        assert adapter._rate_limiter is pool.rate_limiter
@@ -0,0 +1,101 @@
+from datetime import date, datetime
+from typing import Dict
+
+import pytest
+
+from intradel_my_container import Dropout, IntradelMyContainer, Recyparc, const
+from intradel_my_container.buckets import BucketStats, aggregate, bucket_bounds
+
+
+@pytest.mark.parametrize(
+    "day, granularity, key, first, last",
+    [
+        (date(2023, 6, 16), "day", "2023-06-16", date(2023, 6, 16), date(2023, 6, 16)),
+        (date(2023, 6, 16), "week", "2023-W24", date(2023, 6, 12), date(2023, 6, 18)),
+        (date(2024, 12, 31), "week", "2025-W01", date(2024, 12, 30), date(2025, 1, 5)),
+        (date(2024, 2, 10), "month", "2024-02", date(2024, 2, 1), date(2024, 2, 29)),
+        (date(2023, 8, 20), "quarter", "2023-Q3", date(2023, 7, 1), date(2023, 9, 30)),
+        (date(2024, 6, 1), "year", "2024", date(2024, 1, 1), date(2024, 12, 31)),
+    ],
+)
+def test_bucket_bounds(day, granularity, key, first, last):
+    assert bucket_bounds(day.toordinal(), granularity) == (
+        key,
+        first.toordinal(),
+        last.toordinal(),
+    )
+
+
+def test_bucket_bounds_cover_every_day():
+    for granularity in const.INTRADEL_GRANULARITIES:
+        day = date(2023, 1, 1)
+        while day.year < 2025:
+            key, first, last = bucket_bounds(day.toordinal(), granularity)
+            assert bucket_bounds(first, granularity)[0] == key
+            assert bucket_bounds(last, granularity)[0] == key
+            assert bucket_bounds(last + 1, granularity)[0] != key
+            day = date.fromordinal(last + 1)
+
+
+def test_aggregate_stats():
+    points = [
+        (date(2023, 1, 2).toordinal(), 3.0),
+        (date(2023, 1, 20).toordinal(), 1.0),
+        (date(2023, 2, 1).toordinal(), 7.0),
+        (date(2023, 1, 25).toordinal(), 5.0),
+    ]
+    assert aggregate(points, "month") == {
+        "2023-01": BucketStats(count=3, total=9.0, minimum=1.0, maximum=5.0),
+        "2023-02": BucketStats(count=1, total=7.0, minimum=7.0, maximum=7.0),
+    }
+
+
+def test_aggregate_unknown_granularity():
+    with pytest.raises(ValueError):
+        aggregate([], "fortnight")
+
+
+def test_trash_bin_aggregate(mocked_container):
+    data: IntradelMyContainer = mocked_container()
+    per_month: Dict[str, BucketStats] = data.organic.aggregate("month")
+    per_year: Dict[str, BucketStats] = data.organic.aggregate()
+    assert (
+        sum(stats.count for stats in per_month.values())
+        == data.organic.total_collects()
+        and {year: stats.count for year, stats in per_year.items()}
+        == data.organic.total_collects_per_year()
+        and {year: stats.total for year, stats in per_year.items()}
+        == data.organic.total_kilograms_per_year()
+        and all(
+            stats.minimum <= stats.total / stats.count <= stats.maximum
+            for stats in per_month.values()
+        )
+    )
+
+
+def test_trash_bin_aggregate_copies(mocked_container):
+    data: IntradelMyContainer = mocked_container()
+    data.organic.aggregate()["2013"].count = 0
+    assert data.organic.aggregate()["2013"].count > 0
+
+
+def test_recyparc_aggregate():
+    recyparc = Recyparc.from_dictionary(
+        {const.INTRADEL_RESIDUAL_SINCE: "Depuis le 01-02-2013"},
+        [
+            Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (0.10 m³), Inertes (0.20 m³)"),
+            Dropout(datetime(2023, 3, 22), "HUY", "Encombrants (0.15 m³)"),
+            Dropout(datetime(2023, 4, 1), "HUY", "DSM (Autre) (1.00 pièce)"),
+        ],
+    )
+    per_month = recyparc.aggregate("m³", "month")
+    assert (
+        list(per_month) == ["2023-03"]
+        and per_month["2023-03"].count == 2
+        and per_month["2023-03"].total == pytest.approx(0.45)
+        and per_month["2023-03"].minimum == pytest.approx(0.15)
+        and per_month["2023-03"].maximum == pytest.approx(0.3)
+        and recyparc.aggregate("m³", "year", name="Bois")["2023"].total
+        == pytest.approx(0.1)
+        and recyparc.aggregate("pièce", "quarter")["2023-Q2"].count == 1
+    )
@@ -0,0 +1,153 @@
+import os
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+import requests
+
+from intradel_my_container import IntradelMyContainer, ResponseCache
+
+LAST_YEAR = datetime(datetime.today().year - 1, 12, 31)
+THIS_YEAR = datetime.today()
+START = datetime(2013, 1, 1)
+
+
+def age_all(cache: ResponseCache, seconds: float) -> None:
+    store_all_at(cache, time.time() - seconds)
+
+
+def store_all_at(cache: ResponseCache, stored_at: float) -> None:
+    for entry in os.scandir(cache.directory):
+        os.utime(entry.path, (stored_at, stored_at))
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    page_content: bytes = b"<div class='post__content'></div>" * 1000
+    cache.put("login", "password", "26", START, THIS_YEAR, page_content)
+    sizes: List[int] = [entry.stat().st_size for entry in os.scandir(tmp_path)]
+    assert cache.get(
+        "login", "password", "26", START, THIS_YEAR
+    ) == page_content and sizes[0] < len(page_content)
+
+
+def test_cache_miss(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("login", "password", "26", START, THIS_YEAR, b"page")
+    assert (
+        cache.get("other", "password", "26", START, THIS_YEAR) is None
+        and cache.get("login", "wrong", "26", START, THIS_YEAR) is None
+        and cache.get("login", "password", "26", START, LAST_YEAR) is None
+    )
+
+
+def test_cache_ttl_current_year(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("login", "password", "26", START, THIS_YEAR, b"page")
+    age_all(cache, 120)
+    assert cache.get("login", "password", "26", START, THIS_YEAR) is None
+
+
+def test_cache_no_ttl_closed_ranges(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("login", "password", "26", START, LAST_YEAR, b"page")
+    store_all_at(cache, datetime(LAST_YEAR.year + 1, 1, 1).timestamp())
+    assert cache.get("login", "password", "26", START, LAST_YEAR) == b"page"
+
+
+def test_cache_ttl_ranges_stored_while_open(tmp_path):
+    end_date = datetime(2020, 12, 31)
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("login", "password", "26", START, end_date, b"page")
+    store_all_at(cache, datetime(2020, 12, 31, 18).timestamp())
+    assert cache.get("login", "password", "26", START, end_date) is None
+
+
+def test_cache_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=3500)
+    for index in range(3):
+        cache.put(f"login{index}", "password", "26", START, LAST_YEAR, os.urandom(1000))
+        read_at: float = time.time() - 30 + 10 * index
+        path: str = cache._path(f"login{index}", "password", "26", START, LAST_YEAR)
+        os.utime(path, (read_at, read_at))
+    cache.get("login0", "password", "26", START, LAST_YEAR)
+    cache.put("login3", "password", "26", START, LAST_YEAR, os.urandom(1000))
+    assert [
+        cache.get(f"login{index}", "password", "26", START, LAST_YEAR) is not None
+        for index in range(4)
+    ] == [True, False, True, True]
+
+
+def test_cache_eviction_page_removed_meanwhile(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path), max_bytes=1500)
+    cache.put("login0", "password", "26", START, LAST_YEAR, os.urandom(1000))
+    scandir = os.scandir
+
+    def scandir_then_remove(path):
+        entries: List[os.DirEntry] = list(scandir(path))
+        for entry in entries:
+            os.remove(entry.path)
+        return iter(entries)
+
+    monkeypatch.setattr(os, "scandir", scandir_then_remove)
+    cache.put("login1", "password", "26", START, LAST_YEAR, os.urandom(1000))
+    assert list(scandir(tmp_path)) == []
+
+
+def test_cache_put_failure_leaves_no_file(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path))
+
+    def compress(data: bytes) -> bytes:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr("gzip.compress", compress)
+    with pytest.raises(OSError):
+        cache.put("login", "password", "26", START, THIS_YEAR, b"page")
+    assert list(os.scandir(tmp_path)) == []
+
+
+def test_cache_clear(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("login", "password", "26", START, THIS_YEAR, b"page")
+    cache.clear()
+    assert cache.get("login", "password", "26", START, THIS_YEAR) is None
+
+
+@pytest.fixture
+def posts(monkeypatch, page_content) -> List[str]:
+    posted_urls: List[str] = []
+
+    class FakeResponse:
+        content: bytes = page_content
+
+    def fake_post(self, url, data=None, **kwargs):
+        posted_urls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    return posted_urls
+
+
+def test_container_uses_cache(tmp_path, posts):
+    cache = ResponseCache(str(tmp_path))
+    first = IntradelMyContainer(
+        "login", "password", "26", START, LAST_YEAR, cache=cache
+    )
+    second = IntradelMyContainer(
+        "login", "password", "26", START, LAST_YEAR, cache=cache
+    )
+    assert len(posts) == 2 and len(second.organic.pickups) == len(first.organic.pickups)
+
+
+def test_container_does_not_cache_failures(tmp_path, monkeypatch):
+    class FakeResponse:
+        content: bytes = b"<html>Wrong password</html>"
+
+    monkeypatch.setattr(
+        requests.Session, "post", lambda *args, **kwargs: FakeResponse()
+    )
+    cache = ResponseCache(str(tmp_path))
+    with pytest.raises(Exception):
+        IntradelMyContainer("login", "password", "26", START, LAST_YEAR, cache=cache)
+    assert len(os.listdir(tmp_path)) == 0
@@ -1257,3 +1257,55 @@ def test_recyparc_basic():
             )
         )
     )
+
+
+def test_records_have_no_dict():
+    dropout = Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (0.10 m³)")
+    assert not any(
+        hasattr(record, "__dict__")
+        for record in [Pickup(datetime.today(), 1.0), dropout, dropout.materials[0]]
+    )
+
+
+def test_dropout_drop_raw_materials():
+    raw_materials = "Bois   (0.10 m³), DSM (Autre) (1.00 pièce)"
+    dropout = Dropout(datetime(2023, 3, 3), "ENGIS", raw_materials)
+    before: str = dropout.raw_materials
+    dropout.drop_raw_materials()
+    assert (
+        before == raw_materials
+        and dropout._raw_materials is None
+        and dropout.raw_materials == "Bois (0.10 m³), DSM (Autre) (1.00 pièce)"
+        and Dropout(dropout.date, dropout.parc, dropout.raw_materials).materials
+        == dropout.materials
+    )
+
+
+def test_dropout_names_are_interned():
+    first = Dropout(datetime(2023, 3, 3), "EN" + "GIS", "Bois (0.10 m³)")
+    second = Dropout(datetime(2023, 3, 4), "".join(["ENG", "IS"]), " Bois (0.20 m³)")
+    assert (
+        first.parc is second.parc
+        and first.materials[0].name is second.materials[0].name
+        and first.materials[0].unit is second.materials[0].unit
+    )
+
+
+def test_dropout_materials_parsed_on_access(monkeypatch):
+    parsed: List[str] = []
+    create_material = Dropout._create_material
+
+    def counting_create_material(self, raw_material):
+        parsed.append(raw_material)
+        return create_material(self, raw_material)
+
+    monkeypatch.setattr(Dropout, "_create_material", counting_create_material)
+    dropout = Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (0.10 m³)")
+    not_parsed: int = len(parsed)
+    first: List[Material] = dropout.materials
+    assert (
+        not_parsed == 0
+        and dropout.materials is first
+        and parsed == ["Bois (0.10 m³)"]
+        and first == [Material("Bois", 0.1, "m³")]
+    )
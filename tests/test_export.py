@@ -0,0 +1,166 @@
+import csv
+import io
+import json
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+from typer.testing import CliRunner
+
+from intradel_my_container import CannotParse, Dropout, IntradelMyContainer, Pickup
+from intradel_my_container.export import EXPORT_FIELDS, iter_rows, write_records
+
+pytestmark = pytest.mark.usefixtures("disable_intradel_call")
+
+RECORDS = [
+    ("ORGANIQUE", Pickup(datetime(2013, 3, 2), 72.8)),
+    (
+        "RECYPARC",
+        Dropout(
+            datetime(2018, 3, 3), "ENGIS", "DSM (Autre) (1.00 pièce), Bois (0.10 m³)"
+        ),
+    ),
+]
+
+
+def exported(export_format: str, records=RECORDS) -> str:
+    output = io.StringIO()
+    write_records(iter(records), output, export_format)
+    return output.getvalue()
+
+
+def test_iter_rows():
+    rows: List[Dict[str, Any]] = list(iter_rows(RECORDS))
+    assert rows == [
+        {
+            "type": "pickup",
+            "section": "organic",
+            "date": "2013-03-02",
+            "kilograms": 72.8,
+        },
+        {
+            "type": "dropout",
+            "section": "recyparc",
+            "date": "2018-03-03",
+            "parc": "ENGIS",
+            "materials": "DSM (Autre) (1.00 pièce), Bois (0.10 m³)",
+        },
+        {
+            "type": "material",
+            "section": "recyparc",
+            "date": "2018-03-03",
+            "parc": "ENGIS",
+            "name": "DSM (Autre)",
+            "quantity": 1.0,
+            "unit": "pièce",
+        },
+        {
+            "type": "material",
+            "section": "recyparc",
+            "date": "2018-03-03",
+            "parc": "ENGIS",
+            "name": "Bois",
+            "quantity": 0.1,
+            "unit": "m³",
+        },
+    ]
+
+
+def test_write_json():
+    assert (
+        json.loads(exported("json")) == list(iter_rows(RECORDS))
+        and json.loads(exported("json", [])) == []
+    )
+
+
+def test_write_ndjson():
+    lines: List[str] = exported("ndjson").splitlines()
+    assert [json.loads(line) for line in lines] == list(iter_rows(RECORDS))
+
+
+def test_write_csv():
+    rows = list(csv.DictReader(io.StringIO(exported("csv"))))
+    assert (
+        list(rows[0]) == EXPORT_FIELDS
+        and len(rows) == 4
+        and rows[0]["kilograms"] == "72.8"
+        and rows[0]["parc"] == ""
+        and rows[3]["name"] == "Bois"
+        and rows[3]["unit"] == "m³"
+    )
+
+
+def test_write_records_unknown_format():
+    with pytest.raises(ValueError):
+        exported("xml")
+
+
+def test_write_records_is_lazy():
+    output = io.StringIO()
+
+    def records():
+        yield RECORDS[0]
+        assert output.getvalue().count("\n") == 1
+        yield RECORDS[1]
+
+    write_records(records(), output, "ndjson")
+    assert output.getvalue().count("\n") == 4
+
+
+def test_iter_records_of_account():
+    records = list(
+        IntradelMyContainer.iter_records(
+            login="not_required__mocked",
+            password="not_required__mocked",
+            municipality_id="not_required__mocked",
+        )
+    )
+    pickups = [record for _, record in records if isinstance(record, Pickup)]
+    dropouts = [record for _, record in records if isinstance(record, Dropout)]
+    assert len(pickups) > 0 and len(dropouts) == 38
+
+
+def test_materials_on_a_single_line():
+    records = list(
+        IntradelMyContainer.iter_records(
+            login="not_required__mocked",
+            password="not_required__mocked",
+            municipality_id="not_required__mocked",
+        )
+    )
+    rows = list(csv.DictReader(io.StringIO(exported("csv", records))))
+    materials: List[str] = [
+        row["materials"] for row in rows if row["type"] == "dropout"
+    ]
+    assert len(materials) == 38 and all(
+        "\n" not in cell and cell == cell.strip() and "  " not in cell
+        for cell in materials
+    )
+
+
+def test_iter_records_cannot_parse(monkeypatch):
+    monkeypatch.setattr(
+        IntradelMyContainer, "_get_page_content", lambda *args, **kwargs: b"<html/>"
+    )
+    with pytest.raises(CannotParse):
+        next(IntradelMyContainer.iter_records("login", "password", "613"))
+
+
+def test_cli_ndjson_without_rich(monkeypatch):
+    import typer
+
+    from intradel_my_container.__main__ import main
+
+    monkeypatch.delitem(sys.modules, "rich.table", raising=False)
+    app = typer.Typer()
+    app.command()(main)
+    result = CliRunner().invoke(
+        app, ["-l", "login", "-p", "password", "-m", "Visé", "--format", "ndjson"]
+    )
+    lines: List[str] = result.output.splitlines()
+    assert (
+        result.exit_code == 0
+        and json.loads(lines[0])["type"] == "pickup"
+        and "rich.table" not in sys.modules
+    )
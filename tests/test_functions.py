@@ -1,6 +1,11 @@
+import random
+import re
+import sys
+import time
 from datetime import datetime
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
 
+import pytest
 from bs4 import BeautifulSoup, Tag
 
 from intradel_my_container.functions import (
@@ -8,6 +13,7 @@ from intradel_my_container.functions import (
     extract_number,
     find_date,
     p_to_dictionary,
+    tokenize_materials,
 )
 
 # Cleanup Function
@@ -39,6 +45,30 @@ def test_cleanup_one_sentence_extra_spaces_tabs_and_lines():
     assert clean == "One sentence to clean."
 
 
+def regex_cleanup(string: str) -> str:
+    to_return: str = re.sub("\t+|\n+|\r+", " ", string.strip())
+    to_return = re.sub(r"\s+", " ", to_return.strip())
+    to_return = re.sub(" , ", ", ", to_return.strip())
+    return to_return
+
+
+def test_cleanup_identical_to_regex():
+    generator = random.Random(0)
+    whitespaces: List[str] = [
+        character
+        for character in map(chr, range(sys.maxunicode + 1))
+        if not 0xD800 <= ord(character) <= 0xDFFF and character.isspace()
+    ]
+    alphabet: List[str] = whitespaces + list("ab,, ()³é")
+    strings: List[str] = [
+        "".join(generator.choices(alphabet, k=generator.randrange(20)))
+        for _ in range(5_000)
+    ]
+    assert [cleanup(string) for string in strings] == [
+        regex_cleanup(string) for string in strings
+    ]
+
+
 # endregion cleanup
 
 # find_date Function
@@ -65,8 +95,145 @@ def test_find_date_wrong_format():
     assert date == datetime.strptime("01-01-1970", "%d-%m-%Y")
 
 
+def test_find_date_fast_path_matches_strptime():
+    cases: List[str] = [
+        "02-03-2023",
+        " 29-02-2024\n",
+        "\t31-12-1999 ",
+        "01-01-0001",
+        "02-03-2023 ",
+    ]
+    assert [find_date(case) for case in cases] == [
+        datetime.strptime(case.strip(), "%d-%m-%Y") for case in cases
+    ]
+
+
+def test_find_date_fast_path_not_a_date():
+    for case in ["02/03/2023", "2-03-20233", "ab-cd-efgh"]:
+        assert find_date(case) == datetime(1970, 1, 1)
+
+
+def test_find_date_invalid_day():
+    with pytest.raises(ValueError):
+        find_date("31-02-2023")
+    with pytest.raises(ValueError):
+        find_date("Invalid: 31-02-2023")
+
+
 # endregion find_date
 
+# tokenize_materials Function
+# region tokenize_materials
+
+
+def regex_materials(string: str) -> List[Tuple[str, str, str]]:
+    materials: List[Tuple[str, str, str]] = []
+    for material in string.split(","):
+        search = re.search(r"(.*)\((\d+\.\d+)\s(.*)\)", material)
+        if search is not None:
+            materials.append(
+                (search.group(1).strip(), search.group(2), search.group(3).strip())
+            )
+    return materials
+
+
+def test_tokenize_materials():
+    assert list(
+        tokenize_materials(
+            "Bois (0.10 m³), DSM (Autre) (1.00 pièce), Inertes (0.20 m³)"
+        )
+    ) == [
+        ("Bois", "0.10", "m³"),
+        ("DSM (Autre)", "1.00", "pièce"),
+        ("Inertes", "0.20", "m³"),
+    ]
+
+
+def test_tokenize_materials_comma_in_name():
+    assert list(tokenize_materials("Papiers, cartons (1.50 m³), Bois (0.10 m³)")) == [
+        ("cartons", "1.50", "m³"),
+        ("Bois", "0.10", "m³"),
+    ]
+
+
+def test_tokenize_materials_missing_quantity():
+    assert list(tokenize_materials("Foo, Bois (0.10 m³), Bar, (Autre), Inertes")) == [
+        ("Bois", "0.10", "m³")
+    ] and list(tokenize_materials("DSM (Autre, Piles) (1.00 pièce)")) == [
+        ("DSM (Autre, Piles)", "1.00", "pièce")
+    ]
+
+
+def test_tokenize_materials_unbalanced_parentheses():
+    assert list(tokenize_materials("Bois (beaucoup), ), PMC ( (7.50 m³)")) == [
+        ("PMC (", "7.50", "m³")
+    ] and list(tokenize_materials("DSM ( (1 m³), Piles) (2.00 kg)")) == [
+        ("DSM ( (1 m³), Piles)", "2.00", "kg")
+    ]
+
+
+def test_tokenize_materials_no_quantity():
+    assert list(tokenize_materials("Bois (beaucoup), (1 m³) ) ( (0.5m³)")) == []
+
+
+def random_materials_cell(generator: random.Random) -> str:
+    names: List[str] = ["Bois", "DSM", "Enc.valorisables", "Déchets verts", "PMC", ""]
+    suffixes: List[str] = ["", " (Autre)", " (Plein)", " ()", " (1.5)", " ("]
+    quantities: List[str] = [
+        f"({generator.randrange(100)}.{generator.randrange(100):02d} "
+        f"{generator.choice(['m³', 'pièce', 'kg', 'L', ''])})",
+        f"({generator.randrange(100)} m³)",
+        f"({generator.randrange(100)}.5m³)",
+        "(beaucoup)",
+        "",
+    ]
+    return ", ".join(
+        f"{generator.choice(names)}{generator.choice(suffixes)} "
+        f"{generator.choice(quantities)}"
+        for _ in range(generator.randrange(6))
+    )
+
+
+def test_tokenize_materials_identical_to_regex():
+    generator = random.Random(0)
+    for _ in range(5_000):
+        cell: str = cleanup(random_materials_cell(generator))
+        assert list(tokenize_materials(cell)) == regex_materials(cell), cell
+
+
+class CountingString(str):
+    calls: int = 0
+
+    def find(self, *args) -> int:
+        CountingString.calls += 1
+        return super().find(*args)
+
+    def rfind(self, *args) -> int:
+        CountingString.calls += 1
+        return super().rfind(*args)
+
+
+@pytest.mark.parametrize(
+    "cell",
+    [
+        "(" * 200_000,
+        ")" * 200_000,
+        "DSM (Autre) " * 20_000,
+        "(1." + "1" * 200_000,
+        "Bois (0.10 m³), " * 20_000,
+        "((((0.10 m³" * 20_000,
+        "Foo, (a, b) " * 20_000 + "(1.00 m³)",
+    ],
+)
+def test_tokenize_materials_bounded_searches(cell):
+    CountingString.calls = 0
+    list(tokenize_materials(CountingString(cell)))
+    # One find and one rfind per closing parenthesis, one more find per material.
+    assert CountingString.calls <= 3 * cell.count(")") + 1
+
+
+# endregion tokenize_materials
+
 # extract_number Function
 # region extract_number
 
@@ -1,25 +1,20 @@
-import os
 from datetime import datetime
 
 import pytest
 
 from intradel_my_container import Informations, IntradelMyContainer, Organic, Residual
 
+pytestmark = pytest.mark.usefixtures("disable_intradel_call")
 
-def mocked_page_content() -> bytes:
-    current_path = os.path.dirname(__file__)
-    page_content_file_path = os.path.join(current_path, "page.content.html")
-    with open(page_content_file_path, "rb") as my_file:
-        return my_file.read()
 
-
-@pytest.fixture(autouse=True)
-def disable_intradel_call(monkeypatch):
-    def stunted_get():
-        return mocked_page_content()
-
-    monkeypatch.setattr(
-        IntradelMyContainer, "_get_page_content", lambda *args, **kwargs: stunted_get()
+def same_containers(data: IntradelMyContainer, reference: IntradelMyContainer) -> bool:
+    return (
+        vars(data.my_informations) == vars(reference.my_informations)
+        and vars(data.organic) == vars(reference.organic)
+        and vars(data.residual) == vars(reference.residual)
+        and data.recyparc.since == reference.recyparc.since
+        and [(d.date, d.parc, d.materials) for d in data.recyparc.dropout]
+        == [(d.date, d.parc, d.materials) for d in reference.recyparc.dropout]
     )
 
 
@@ -31,3 +26,25 @@ def test_full_with_mock():
         start_date=datetime.today().replace(year=2014, month=1, day=1),
     )
     assert data.my_informations.__class__ == Informations
+
+
+def test_full_with_mock_lxml(mocked_container):
+    pytest.importorskip("lxml")
+    assert same_containers(mocked_container(parser="lxml"), mocked_container())
+
+
+def test_full_with_mock_only_sections(mocked_container):
+    assert same_containers(mocked_container(only_sections=True), mocked_container())
+
+
+def test_full_with_mock_stream(mocked_container):
+    data: IntradelMyContainer = mocked_container(parser="stream")
+    reference: IntradelMyContainer = mocked_container()
+    assert same_containers(data, reference) and [
+        d._raw_materials for d in data.recyparc.dropout
+    ] == [d._raw_materials for d in reference.recyparc.dropout]
+
+
+def test_unknown_parser(mocked_container):
+    with pytest.raises(ValueError):
+        mocked_container(parser="not_a_parser")
@@ -0,0 +1,108 @@
+import gc
+import weakref
+from typing import List
+
+import pytest
+
+import intradel_my_container
+from intradel_my_container import IntradelMyContainer, Recyparc
+from intradel_my_container.functions import make_soup
+from intradel_my_container.stream import parse_page
+
+
+@pytest.fixture
+def built_recyparcs(monkeypatch) -> List[Recyparc]:
+    recyparcs: List[Recyparc] = []
+    recyparc_init = Recyparc.__init__
+
+    def counting_init(self, content):
+        recyparc_init(self, content)
+        recyparcs.append(self)
+
+    monkeypatch.setattr(Recyparc, "__init__", counting_init)
+    return recyparcs
+
+
+def test_sections_built_on_access(built_recyparcs, mocked_container):
+    data: IntradelMyContainer = mocked_container()
+    organic_pickups: int = len(data.organic.pickups)
+    not_built: int = len(built_recyparcs)
+    first = data.recyparc
+    assert (
+        organic_pickups == 70
+        and not_built == 0
+        and data.recyparc is first
+        and len(built_recyparcs) == 1
+        and sorted(data._section_builders) == ["my_informations", "residual"]
+    )
+
+
+def test_sections_selection(built_recyparcs, mocked_container):
+    data: IntradelMyContainer = mocked_container(sections=["organic", "residual"])
+    assert (
+        len(data.residual.pickups) == 70
+        and not hasattr(data, "recyparc")
+        and not hasattr(data, "my_informations")
+        and len(built_recyparcs) == 0
+    )
+
+
+def test_sections_selection_stream(mocked_container):
+    data: IntradelMyContainer = mocked_container(parser="stream", sections=["organic"])
+    assert len(data.organic.pickups) == 70 and not hasattr(data, "recyparc")
+
+
+def test_sections_unknown(mocked_container):
+    with pytest.raises(ValueError):
+        mocked_container(sections=["organic", "glass"])
+
+
+def test_sections_assignment(mocked_container):
+    data: IntradelMyContainer = mocked_container()
+    data.organic = data.residual
+    assert data.organic is data.residual
+
+
+def test_stream_titles_skip_records(page_content):
+    sections = parse_page(page_content, titles=["ORGANIQUE"])
+    assert (
+        len(sections["ORGANIQUE"].pickups) == 70
+        and sections["RESIDUEL"].pickups == []
+        and sections["RECYPARC"].dropouts == []
+    )
+
+
+def test_failing_section_keeps_its_error(monkeypatch, mocked_container):
+    def failing_init(self, content):
+        raise KeyError("Depuis")
+
+    monkeypatch.setattr(Recyparc, "__init__", failing_init)
+    data: IntradelMyContainer = mocked_container()
+    errors: List[BaseException] = []
+    for _ in range(2):
+        with pytest.raises(KeyError) as error:
+            data.recyparc
+        errors.append(error.value)
+    assert len(errors) == 2 and "recyparc" in data._section_builders
+
+
+def test_page_released_with_sections_unread(monkeypatch, mocked_container):
+    soups: List[weakref.ref] = []
+
+    def recording_make_soup(*args, **kwargs):
+        soup = make_soup(*args, **kwargs)
+        soups.append(weakref.ref(soup))
+        return soup
+
+    monkeypatch.setattr(intradel_my_container, "make_soup", recording_make_soup)
+    data: IntradelMyContainer = mocked_container()
+    gc.collect()
+    released: bool = soups[0]() is None
+    pickups: int = len(data.organic.pickups) + len(data.residual.pickups)
+    assert (
+        released
+        and pickups == 140
+        and sorted(data._section_builders) == ["my_informations", "recyparc"]
+        and len(data.recyparc.dropout) == 38
+        and data.my_informations.name != ""
+    )
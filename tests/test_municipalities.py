@@ -0,0 +1,86 @@
+import pytest
+import typer
+
+from intradel_my_container import const
+from intradel_my_container.__main__ import resolve_municipality
+from intradel_my_container.municipalities import (
+    MunicipalityIndex,
+    municipality_index,
+    normalize_name,
+)
+
+
+@pytest.mark.parametrize(
+    "name, normalized",
+    [
+        ("CRISNÉE", "crisnee"),
+        ("Visé", "vise"),
+        ("SAINT-GEORGES-SUR-MEUSE", "saint georges sur meuse"),
+        (" grâce  hollogne ", "grace hollogne"),
+        ("DEMO_BERLOZ", "demo berloz"),
+    ],
+)
+def test_normalize_name(name, normalized):
+    assert normalize_name(name) == normalized
+
+
+def test_municipality_index_is_built_once():
+    assert municipality_index() is municipality_index()
+
+
+def test_municipality_index_lookups():
+    index = municipality_index()
+    assert all(
+        index.find(name) == municipality_id
+        and index.name(municipality_id) == name
+        and index.find(name.lower()) == municipality_id
+        for name, municipality_id in const.INTRADEL_MUNICIPALITIES.items()
+    ) and (
+        index.find("vise") == 613
+        and index.find("Liège") == 576
+        and index.find("Bruxelles") is None
+    )
+
+
+def test_municipality_index_search():
+    index = municipality_index()
+    assert (
+        index.search("sa") == [("SAINT-GEORGES-SUR-MEUSE", 33), ("SAINT-NICOLAS", 25)]
+        and index.search("NICOL") == [("SAINT-NICOLAS", 25)]
+        and index.search("crisné") == [("CRISNÉE", 593)]
+        and index.search("xyz") == []
+        and len(index.search("")) == len(const.INTRADEL_MUNICIPALITIES)
+    )
+
+
+def test_municipality_index_search_in_order():
+    index = MunicipalityIndex({"B A": 2, "A B": 1, "A": 3})
+    assert index.search("a") == [("A", 3), ("A B", 1), ("B A", 2)] and index.search(
+        "b"
+    ) == [("A B", 1), ("B A", 2)]
+
+
+@pytest.mark.parametrize(
+    "value, municipality_id",
+    [
+        ("613", 613),
+        ("12345", 12345),
+        ("visé", 613),
+        ("Grace Hollogne", 32),
+        ("nicol", 25),
+    ],
+)
+def test_municipality_index_resolve(value, municipality_id):
+    assert municipality_index().resolve(value) == municipality_id
+
+
+@pytest.mark.parametrize("value", ["sa", "unknown town"])
+def test_municipality_index_resolve_error(value):
+    with pytest.raises(ValueError):
+        municipality_index().resolve(value)
+
+
+def test_resolve_municipality_option():
+    assert resolve_municipality("Crisnée") == "593"
+    with pytest.raises(typer.BadParameter):
+        resolve_municipality("sa")
@@ -0,0 +1,176 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from intradel_my_container import Dropout, Recyparc, const
+from intradel_my_container.quotas import (
+    QUOTA_INDEX,
+    QUOTA_KEYS,
+    QuotaTracker,
+    consumption_per_year,
+    quota_index,
+    remaining,
+)
+
+
+def make_recyparc(dropouts: List[Dropout]) -> Recyparc:
+    return Recyparc.from_dictionary(
+        {const.INTRADEL_RESIDUAL_SINCE: "01-02-2013"}, dropouts
+    )
+
+
+def scanned_consumption(dropouts: List[Dropout]):
+    consumption = {}
+    for dropout in dropouts:
+        used = consumption.setdefault(
+            str(dropout.date.year), dict.fromkeys(const.INTRADEL_QUOTAS, 0.0)
+        )
+        for material in dropout.materials:
+            for quota, names in const.INTRADEL_QUOTAS_MAPPING.items():
+                if material.name in names and material.unit == "m³":
+                    used[quota] += material.quantity
+    return consumption
+
+
+def test_quota_index():
+    assert (
+        quota_index({"A": ["x", "y"], "B": ["z"], "C": ["unknown"]})
+        == {"x": "A", "y": "A", "z": "B"}
+        and QUOTA_INDEX["Enc.valorisables"] == "ENCOMBRANTS"
+        and "unknown" not in QUOTA_INDEX
+    )
+
+
+def test_consumption_per_year():
+    dropouts = [
+        Dropout(datetime(2022, 12, 30), "ENGIS", "Bois (0.50 m³), Frigolite (0.10 m³)"),
+        Dropout(
+            datetime(2023, 1, 3), "ENGIS", "Encombrants (1.00 m³), Piles (2.00 kg)"
+        ),
+        Dropout(datetime(2023, 4, 3), "ENGIS", "Enc.valorisables (0.25 m³)"),
+        Dropout(datetime(2023, 5, 3), "ENGIS", "Bois (3.00 pièce)"),
+    ]
+    consumption = consumption_per_year(dropouts)
+    assert (
+        list(consumption) == ["2022", "2023"]
+        and consumption["2022"]["BOIS"] == 0.5
+        and consumption["2022"]["FRIGOLITE"] == 0.1
+        and consumption["2023"]["ENCOMBRANTS"] == 1.25
+        and consumption["2023"]["BOIS"] == 0.0
+        and consumption == scanned_consumption(dropouts)
+    )
+
+
+def test_remaining():
+    assert (
+        remaining(None)
+        == {quota: float(limit) for quota, limit in const.INTRADEL_QUOTAS.items()}
+        and remaining({"BOIS": 4.0})["BOIS"] == -1.0
+    )
+
+
+def test_recyparc_quotas_same_as_scan(mocked_container):
+    recyparc: Recyparc = mocked_container().recyparc
+    consumption = recyparc.quota_consumption_per_year()
+    assert consumption == scanned_consumption(
+        recyparc.dropout
+    ) and recyparc.remaining_quotas(2023) == remaining(consumption["2023"])
+
+
+def test_recyparc_remaining_quotas():
+    recyparc = make_recyparc(
+        [Dropout(datetime.today(), "ENGIS", "Déchets verts (2.50 m³)")]
+    )
+    assert recyparc.remaining_quotas()["VERTS"] == const.INTRADEL_QUOTAS[
+        "VERTS"
+    ] - 2.5 and recyparc.remaining_quotas(1990) == remaining(None)
+
+
+def test_recyparc_quotas_follow_dropouts():
+    recyparc = make_recyparc([Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (1.00 m³)")])
+    before = recyparc.quota_consumption_per_year()
+    before["2023"]["BOIS"] = 100.0
+    recyparc.dropout.append(Dropout(datetime(2023, 3, 4), "ENGIS", "Bois (0.50 m³)"))
+    appended = recyparc.remaining_quotas(2023)["BOIS"]
+    recyparc.merge_dropouts([], datetime(2023, 3, 4))
+    assert appended == 1.5 and recyparc.remaining_quotas(2023)["BOIS"] == 2.0
+
+
+def test_recyparc_quotas_follow_replaced_dropouts():
+    recyparc = make_recyparc([Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (1.00 m³)")])
+    before = recyparc.remaining_quotas(2023)["BOIS"]
+    recyparc.dropout[0] = Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (2.00 m³)")
+    replaced = recyparc.remaining_quotas(2023)["BOIS"]
+    recyparc.merge(make_recyparc([]), datetime(2023, 1, 1))
+    assert (
+        before == 2.0
+        and replaced == 1.0
+        and recyparc._quota_usage is None
+        and recyparc.remaining_quotas(2023)["BOIS"] == 3.0
+    )
+
+
+def test_quota_tracker_same_as_consumption(mocked_container):
+    recyparc: Recyparc = mocked_container().recyparc
+    tracker = QuotaTracker(recyparc.dropout)
+    assert all(
+        tracker.used(int(year)) == used
+        for year, used in recyparc.quota_consumption_per_year().items()
+    )
+
+
+def test_quota_tracker_from_recyparc():
+    recyparc = make_recyparc([Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (1.00 m³)")])
+    tracker = QuotaTracker.from_recyparc(recyparc)
+    tracker.add(Dropout(datetime(2023, 6, 3), "ENGIS", "Bois (1.50 m³)"))
+    assert (
+        tracker.used(2023)["BOIS"] == 2.5
+        and tracker.remaining(2023)["BOIS"] == 0.5
+        and tracker.alerts(year=2023) == ["BOIS"]
+        and recyparc.remaining_quotas(2023)["BOIS"] == 2.0
+    )
+
+
+def test_quota_tracker_year_rollover():
+    tracker = QuotaTracker(
+        [Dropout(datetime(2023, 12, 30), "ENGIS", "Déchets verts (7.00 m³)")]
+    )
+    tracker.add(Dropout(datetime(2024, 1, 2), "ENGIS", "Déchets verts (1.00 m³)"))
+    assert (
+        tracker.used(2023)["VERTS"] == 7.0
+        and tracker.used(2024)["VERTS"] == 1.0
+        and tracker.alerts(year=2024) == []
+        and tracker.remaining(1990) == remaining(None)
+    )
+
+
+def test_quota_tracker_current_year():
+    tracker = QuotaTracker([Dropout(datetime(1990, 1, 2), "ENGIS", "Bois (3.00 m³)")])
+    assert tracker.used() == dict.fromkeys(const.INTRADEL_QUOTAS, 0.0)
+    tracker.add(Dropout(datetime.today(), "ENGIS", "Bois (3.00 m³)"))
+    assert tracker.remaining()["BOIS"] == 0.0
+
+
+def test_quota_tracker_snapshot_restore():
+    tracker = QuotaTracker(
+        [
+            Dropout(datetime(2022, 3, 3), "ENGIS", "Bois (1.00 m³)"),
+            Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (1.00 m³)"),
+        ]
+    )
+    first = tracker.snapshot()
+    tracker.add(Dropout(datetime(2023, 3, 4), "ENGIS", "Frigolite (0.50 m³)"))
+    second = tracker.snapshot()
+    tracker.add(Dropout(datetime(2024, 3, 4), "ENGIS", "Bois (2.00 m³)"))
+    tracker.restore(first)
+    restored = tracker.used(2023)
+    tracker.add(Dropout(datetime(2023, 3, 5), "ENGIS", "Bois (1.00 m³)"))
+    assert (
+        restored["FRIGOLITE"] == 0.0
+        and tracker.used(2023)["BOIS"] == 2.0
+        and tracker.used(2024)["BOIS"] == 0.0
+        and second.consumption["2022"] is first.consumption["2022"]
+        and first.consumption["2023"][QUOTA_KEYS.index("BOIS")] == 1.0
+        and tracker.snapshot().consumption["2022"] is first.consumption["2022"]
+    )
@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import List, Tuple
+
+import pytest
+
+from intradel_my_container import IntradelMyContainer, Organic, Recyparc
+
+PICKUPS: List[Tuple[str, str]] = [
+    ("02-03-2023", "72.8"),
+    ("07-05-2023", "54.3"),
+    ("16-06-2023", "60.9"),
+]
+DROPOUTS: List[Tuple[str, str, str]] = [
+    ("03-03-2023", "ENGIS", "Bois (0.10 m³)"),
+    ("22-03-2023", "HUY", "Encombrants (0.15 m³)"),
+]
+
+
+def page(pickups: List[Tuple[str, str]], dropouts: List[Tuple[str, str, str]]) -> bytes:
+    pickup_rows = "".join(
+        f"<tr><td>{date}</td><td>1</td><td>{kilograms}</td></tr>"
+        for date, kilograms in pickups
+    )
+    dropout_rows = "".join(
+        f"<tr><td>{date}</td><td>{parc}</td><td>{materials}</td></tr>"
+        for date, parc, materials in dropouts
+    )
+    return f"""<html><body>
+<div class="post__content">
+<h3 class="post__title">Mes informations</h3>
+<p><strong>Nom</strong> : John Doe</p>
+<p><strong>Catégorie</strong> : Ménages</p>
+<p><strong>Adresse</strong> : RUE DES CHEVREUILS 10 C, 4540 Amay</p>
+<p><strong>Actif</strong> : Depuis le 01-02-2013</p>
+</div>
+<div class="post__content">
+<h3 class="post__title">ORGANIQUE</h3>
+<p><strong>Volume</strong> : 240 L</p>
+<p><strong>Nr. Puce</strong> : 8573214986</p>
+<p><strong>Statut</strong> : ACTIVE</p>
+<p><strong>Depuis</strong> : 01-02-2013</p>
+<table id="table_results"><tbody>{pickup_rows}</tbody></table>
+</div>
+<div class="post__content">
+<h3 class="post__title">RECYPARC</h3>
+<p><strong>Depuis</strong> : 01-02-2013</p>
+<table id="table_results"><tbody>{dropout_rows}</tbody></table>
+</div>
+</body></html>""".encode(
+        "utf-8"
+    )
+
+
+class FakeIntradel:
+    def __init__(self) -> None:
+        self.pickups: List[Tuple[str, str]] = list(PICKUPS)
+        self.dropouts: List[Tuple[str, str, str]] = list(DROPOUTS)
+        self.requested: List[datetime] = []
+        self.whole_history: bool = False
+
+    def get_page_content(self, container, start_date=None, end_date=None) -> bytes:
+        container.start_date = start_date or datetime(2023, 1, 1)
+        container._start_date_str = container.start_date.strftime("%d-%m-%Y")
+        container.end_date = end_date or datetime(2023, 12, 31)
+        container._end_date_str = container.end_date.strftime("%d-%m-%Y")
+        self.requested.append(container.start_date)
+        since: datetime = datetime.min if self.whole_history else container.start_date
+        return page(
+            [
+                row
+                for row in self.pickups
+                if datetime.strptime(row[0], "%d-%m-%Y") >= since
+            ],
+            [
+                row
+                for row in self.dropouts
+                if datetime.strptime(row[0], "%d-%m-%Y") >= since
+            ],
+        )
+
+
+@pytest.fixture
+def intradel(monkeypatch) -> FakeIntradel:
+    fake_intradel = FakeIntradel()
+    monkeypatch.setattr(
+        IntradelMyContainer,
+        "_get_page_content",
+        lambda container, *args, **kwargs: fake_intradel.get_page_content(
+            container, *args, **kwargs
+        ),
+    )
+    return fake_intradel
+
+
+def test_refresh_requests_since_last_known_date(intradel):
+    data = IntradelMyContainer("login", "password", "26", parser="stream")
+    data.refresh()
+    assert intradel.requested[-1] == datetime(2023, 6, 16)
+
+
+def test_refresh_without_events_requests_since_end_date(intradel):
+    intradel.pickups.clear()
+    intradel.dropouts.clear()
+    data = IntradelMyContainer("login", "password", "26")
+    data.refresh()
+    assert intradel.requested[-1] == datetime(2023, 12, 31)
+
+
+def test_refresh_merges_without_duplicates(intradel):
+    data = IntradelMyContainer("login", "password", "26")
+    organic: Organic = data.organic
+    recyparc: Recyparc = data.recyparc
+    intradel.pickups.append(("01-08-2023", "40.1"))
+    intradel.dropouts.append(("02-08-2023", "LIÈGE", "Bois (0.20 m³)"))
+    data.refresh()
+    assert (
+        data.organic is organic
+        and data.recyparc is recyparc
+        and [pickup.kilograms for pickup in organic.pickups] == [72.8, 54.3, 60.9, 40.1]
+        and [dropout.parc for dropout in recyparc.dropout] == ["ENGIS", "HUY", "LIÈGE"]
+        and data.start_date == datetime(2023, 1, 1)
+    )
+
+
+def test_refresh_same_day_rows(intradel):
+    data = IntradelMyContainer("login", "password", "26")
+    intradel.pickups.append(("16-06-2023", "12.4"))
+    data.refresh()
+    assert [pickup.kilograms for pickup in data.organic.pickups] == [
+        72.8,
+        54.3,
+        60.9,
+        12.4,
+    ]
+
+
+def test_refresh_whole_history_returned(intradel):
+    data = IntradelMyContainer("login", "password", "26")
+    intradel.whole_history = True
+    intradel.pickups.append(("01-08-2023", "40.1"))
+    data.refresh()
+    data.refresh()
+    assert [pickup.kilograms for pickup in data.organic.pickups] == [
+        72.8,
+        54.3,
+        60.9,
+        40.1,
+    ] and [dropout.parc for dropout in data.recyparc.dropout] == ["ENGIS", "HUY"]
+
+
+def test_refresh_updates_status(intradel, monkeypatch):
+    data = IntradelMyContainer("login", "password", "26")
+    monkeypatch.setattr(
+        IntradelMyContainer,
+        "_get_page_content",
+        lambda container, *args, **kwargs: intradel.get_page_content(
+            container, *args, **kwargs
+        ).replace(b"ACTIVE", b"INACTIVE"),
+    )
+    data.refresh()
+    assert data.organic.status == "INACTIVE" and len(data.organic.pickups) == 3
@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Dict, List
+
+from intradel_my_container import Pickup, PickupSeries
+
+PICKUPS: List[Pickup] = [
+    Pickup(datetime(2022, 12, 31), 10.5),
+    Pickup(datetime(2023, 1, 1), 20.25),
+    Pickup(datetime(2023, 6, 16), 30.0),
+    Pickup(datetime(2024, 2, 29), 40.0),
+    Pickup(datetime(2024, 12, 31), 50.0),
+]
+
+
+def test_series_items():
+    series = PickupSeries(PICKUPS)
+    assert (
+        len(series) == 5
+        and series[0] == PICKUPS[0]
+        and series[-1] == PICKUPS[-1]
+        and list(series) == PICKUPS
+        and series == PICKUPS
+        and series[1:3] == PICKUPS[1:3]
+        and isinstance(series[1:3], PickupSeries)
+    )
+
+
+def test_series_columns():
+    series = PickupSeries(PICKUPS)
+    assert (
+        series.ordinals.typecode == "i"
+        and series.kilograms.typecode == "d"
+        and PickupSeries.from_columns(series.ordinals, series.kilograms) == series
+    )
+
+
+def test_series_columns_copied():
+    series = PickupSeries(PICKUPS)
+    total: float = series.total_kilograms()
+    series.kilograms[0] = 1000.0
+    series.ordinals[0] = 1
+    assert series.total_kilograms() == total and list(series) == PICKUPS
+
+
+def test_series_per_year():
+    series = PickupSeries(PICKUPS)
+    kilograms: Dict[str, float] = {}
+    collects: Dict[str, int] = {}
+    for pickup in PICKUPS:
+        year = str(pickup.date.year)
+        kilograms[year] = kilograms.get(year, 0) + pickup.kilograms
+        collects[year] = collects.get(year, 0) + 1
+    assert (
+        series.kilograms_per_year() == kilograms
+        and series.count_per_year() == collects
+        and series.total_kilograms() == sum(pickup.kilograms for pickup in PICKUPS)
+    )
+
+
+def test_series_unsorted_per_year():
+    series = PickupSeries(reversed(PICKUPS))
+    assert series.count_per_year() == {"2024": 2, "2023": 2, "2022": 1}
+
+
+def test_series_before():
+    series = PickupSeries(PICKUPS)
+    assert (
+        series.before(datetime(2023, 6, 16)) == PICKUPS[:2]
+        and series.before(datetime(2023, 6, 16, 8)) == PICKUPS[:3]
+        and series.before(datetime(2000, 1, 1)) == []
+    )
+
+
+def test_series_extend():
+    series = PickupSeries(PICKUPS[:2])
+    series.extend(PickupSeries(PICKUPS[2:4]))
+    series.append(PICKUPS[4])
+    assert series == PICKUPS
+
+
+def test_series_memoized_totals(monkeypatch):
+    series = PickupSeries(PICKUPS)
+    first = series.kilograms_per_year()
+    monkeypatch.setattr(PickupSeries, "_kilograms_per_year", lambda self: {})
+    assert series.kilograms_per_year() == first
+
+
+def test_series_memoized_copies():
+    series = PickupSeries(PICKUPS)
+    series.count_per_year()["2022"] = 100
+    assert series.count_per_year()["2022"] == 1
+
+
+def test_series_memoized_invalidation():
+    series = PickupSeries(PICKUPS[:3])
+    totals = (series.total_kilograms(), series.count_per_year())
+    series.append(PICKUPS[3])
+    after_append = (series.total_kilograms(), series.count_per_year())
+    series.extend(PICKUPS[4:])
+    assert (
+        totals == (60.75, {"2022": 1, "2023": 2})
+        and after_append == (100.75, {"2022": 1, "2023": 2, "2024": 1})
+        and series.count_per_year() == {"2022": 1, "2023": 2, "2024": 2}
+    )
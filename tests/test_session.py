@@ -0,0 +1,73 @@
+from typing import List
+
+import pytest
+import requests
+
+from intradel_my_container import ConnectionPool, IntradelMyContainer
+
+
+class FakeResponse:
+    content: bytes = b"<html></html>"
+
+
+@pytest.fixture
+def posted_sessions(monkeypatch) -> List[requests.Session]:
+    sessions: List[requests.Session] = []
+
+    def fake_post(self, url, data=None, **kwargs):
+        sessions.append(self)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    monkeypatch.setattr(
+        IntradelMyContainer, "_parse_soup", lambda self, page_content: None
+    )
+    return sessions
+
+
+def test_pool_sessions_share_adapter():
+    with ConnectionPool() as pool:
+        first: requests.Session = pool.session()
+        second: requests.Session = pool.session()
+        assert first is not second and first.get_adapter(
+            "https://www.intradel.be"
+        ) is second.get_adapter("https://www.intradel.be")
+
+
+def test_pool_sessions_own_cookies():
+    with ConnectionPool() as pool:
+        first: requests.Session = pool.session()
+        first.cookies.set("PHPSESSID", "first")
+        assert "PHPSESSID" not in pool.session().cookies
+
+
+def test_pool_bounded():
+    with ConnectionPool(pool_maxsize=3) as pool:
+        adapter = pool.session().get_adapter("https://www.intradel.be")
+        assert adapter._pool_maxsize == 3 and adapter._pool_block
+
+
+def test_pool_closed():
+    pool: ConnectionPool = ConnectionPool()
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.session()
+    assert pool.closed
+
+
+def test_container_uses_pool(posted_sessions):
+    with ConnectionPool() as pool:
+        IntradelMyContainer("login", "password", "26", pool=pool)
+        IntradelMyContainer("login", "password", "26", pool=pool)
+        adapters = {
+            id(session.get_adapter("https://www.intradel.be"))
+            for session in posted_sessions
+        }
+        assert len(posted_sessions) == 4 and len(adapters) == 1 and not pool.closed
+
+
+def test_container_closes_own_session(posted_sessions, monkeypatch):
+    closed: List[requests.Session] = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+    IntradelMyContainer("login", "password", "26")
+    assert closed == [posted_sessions[0]]
@@ -0,0 +1,113 @@
+from datetime import datetime
+
+import pytest
+
+from intradel_my_container import Dropout, IntradelMyContainer, Pickup
+from intradel_my_container.storage import HistoryStore
+
+CHIP_NUMBER: str = "8573214986"
+
+
+@pytest.fixture
+def store():
+    with HistoryStore() as history_store:
+        yield history_store
+
+
+def test_storage_totals_match_trash_bin(store, mocked_container):
+    data: IntradelMyContainer = mocked_container()
+    store.save_container(data)
+    organic_chip: str = data.organic.chip_number
+    assert (
+        store.total_collects(organic_chip) == data.organic.total_collects()
+        and store.total_collects_per_year(organic_chip)
+        == data.organic.total_collects_per_year()
+        and store.total_kilograms(organic_chip)
+        == pytest.approx(data.organic.total_kilograms())
+        and store.total_kilograms_per_year(organic_chip)
+        == pytest.approx(data.organic.total_kilograms_per_year())
+    )
+
+
+def test_storage_upsert(store):
+    store.save_pickups(
+        CHIP_NUMBER,
+        [Pickup(datetime(2022, 5, 2), 10.0), Pickup(datetime(2023, 5, 2), 20.0)],
+    )
+    store.save_pickups(
+        CHIP_NUMBER,
+        [Pickup(datetime(2023, 5, 2), 25.0), Pickup(datetime(2023, 6, 2), 5.0)],
+    )
+    assert store.total_kilograms_per_year(CHIP_NUMBER) == {
+        "2022": 10.0,
+        "2023": 30.0,
+    } and store.total_collects_per_year(CHIP_NUMBER) == {"2022": 1, "2023": 2}
+
+
+def test_storage_pickups_range(store):
+    store.save_pickups(
+        CHIP_NUMBER,
+        [Pickup(datetime(2022, 5, day), float(day)) for day in range(1, 11)],
+    )
+    assert [
+        pickup.kilograms
+        for pickup in store.pickups(
+            CHIP_NUMBER, datetime(2022, 5, 3), datetime(2022, 5, 5)
+        )
+    ] == [3.0, 4.0, 5.0] and store.pickups("unknown") == []
+
+
+def test_storage_dropouts(store):
+    dropouts = [
+        Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (0.10 m³), Inertes (0.20 m³)"),
+        Dropout(datetime(2024, 3, 22), "HUY", "Encombrants (0.15 m³)"),
+    ]
+    store.save_dropouts("login", dropouts)
+    store.save_dropouts("login", dropouts)
+    assert (
+        [(d.date, d.parc, d.materials) for d in store.dropouts("login")]
+        == [(d.date, d.parc, d.materials) for d in dropouts]
+        and store.total_quantity_per_year("login", "m³")
+        == pytest.approx({"2023": 0.3, "2024": 0.15})
+        and store.total_quantity_per_year("login", "m³", "Bois")
+        == pytest.approx({"2023": 0.1})
+    )
+
+
+def test_storage_persists(tmp_path):
+    path: str = str(tmp_path / "history.sqlite")
+    with HistoryStore(path) as first_store:
+        first_store.save_pickups(CHIP_NUMBER, [Pickup(datetime(2022, 5, 2), 10.0)])
+    with HistoryStore(path) as second_store:
+        assert second_store.total_collects(CHIP_NUMBER) == 1
+
+
+def test_storage_same_day_records(store):
+    pickups = [Pickup(datetime(2023, 5, 2), 5.0), Pickup(datetime(2023, 5, 2), 10.0)]
+    dropouts = [
+        Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (0.50 m³)"),
+        Dropout(datetime(2023, 3, 3), "ENGIS", "Bois (0.50 m³)"),
+    ]
+    store.save_pickups(CHIP_NUMBER, pickups)
+    store.save_pickups(CHIP_NUMBER, pickups)
+    store.save_dropouts("login", dropouts)
+    store.save_dropouts("login", dropouts)
+    assert (
+        store.total_collects(CHIP_NUMBER) == 2
+        and store.total_kilograms(CHIP_NUMBER) == 15.0
+        and store.pickups(CHIP_NUMBER) == pickups
+        and len(store.dropouts("login")) == 2
+        and store.total_quantity_per_year("login", "m³") == {"2023": 1.0}
+    )
+
+
+def test_storage_replaces_covered_dates(store):
+    store.save_pickups(
+        CHIP_NUMBER,
+        [Pickup(datetime(2023, 5, day), 1.0) for day in (2, 3, 4, 20)],
+    )
+    store.save_pickups(
+        CHIP_NUMBER,
+        [Pickup(datetime(2023, 5, 3), 2.0), Pickup(datetime(2023, 5, 10), 2.0)],
+    )
+    assert [pickup.date.day for pickup in store.pickups(CHIP_NUMBER)] == [2, 3, 10, 20]
@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from intradel_my_container import Dropout, Pickup
+from intradel_my_container.stream import (
+    Record,
+    StreamSection,
+    iter_records,
+    parse_page,
+)
+
+PAGE = """<html><body>
+<nav><div class="post__content"><p>Not a section</p></div></nav>
+<div class="column"><div class="post__content">
+<h3 class="post__title">ORGANIQUE</h3>
+<p><strong>Volume</strong> : 240 L</p>
+<p><strong>Nr. Puce</strong> : 8573214986</p>
+<div class="nested"><p><strong>Statut</strong> : ACTIVE</p></div>
+<p><strong>Depuis</strong> : 01-02-2013</p>
+<table id="table_results">
+<thead><tr><th>Date</th><th>Vidanges</th><th>Kilos</th></tr></thead>
+<tbody>
+<tr><td>02-03-2013</td><td>1</td><td>72.8</td></tr>
+<tr><td>07-05-2013</td><td>1</td><td>54.3</td></tr>
+</tbody>
+<tfoot><tr><td>TOTAL</td><td>2</td><td>127.1 Kg</td></tr></tfoot>
+</table>
+</div></div>
+<div class="post__content">
+<h3 class="post__title">RECYPARC</h3>
+<p><strong>Depuis</strong> : 01-02-2013</p>
+<table id="table_results">
+<tbody>
+<tr><td>03-03-2018</td><td>ENGIS</td><td>
+DSM (Autre) (1.00 pi&egrave;ce), <br/>Petits Bruns (5.00 pièce)</td></tr>
+</tbody>
+</table>
+</div>
+</body></html>
+""".encode(
+    "utf-8"
+)
+
+
+def test_parse_page_sections():
+    sections: Dict[str, StreamSection] = parse_page(PAGE)
+    assert list(sections) == ["ORGANIQUE", "RECYPARC"]
+
+
+def test_parse_page_dictionary():
+    organic: StreamSection = parse_page(PAGE)["ORGANIQUE"]
+    assert organic.dictionary == {
+        "Volume": "240 L",
+        "Nr. Puce": "8573214986",
+        "Statut": "ACTIVE",
+        "Depuis": "01-02-2013",
+    }
+
+
+def test_parse_page_pickups():
+    organic: StreamSection = parse_page(PAGE)["ORGANIQUE"]
+    assert organic.pickups == [
+        Pickup(datetime(2013, 3, 2), 72.8),
+        Pickup(datetime(2013, 5, 7), 54.3),
+    ]
+
+
+def test_parse_page_dropouts():
+    dropouts: List[Dropout] = parse_page(PAGE)["RECYPARC"].dropouts
+    assert (
+        len(dropouts) == 1
+        and dropouts[0].date == datetime(2018, 3, 3)
+        and dropouts[0].parc == "ENGIS"
+        and dropouts[0].materials[0].name == "DSM (Autre)"
+        and dropouts[0].materials[0].unit == "pièce"
+        and dropouts[0].materials[1].quantity == 5.0
+    )
+
+
+def test_iter_records_small_chunks():
+    records: List[Tuple[str, Record]] = list(iter_records(PAGE, chunk_size=7))
+    assert [title for title, _ in records] == ["ORGANIQUE", "ORGANIQUE", "RECYPARC"]
+
+
+def test_iter_records_same_as_parse_page(page_content):
+    sections: Dict[str, StreamSection] = parse_page(page_content)
+    pickups: List[Record] = [
+        record
+        for _, record in iter_records(page_content, chunk_size=1000)
+        if isinstance(record, Pickup)
+    ]
+    assert pickups == sections["ORGANIQUE"].pickups + sections["RESIDUEL"].pickups
@@ -0,0 +1,51 @@
+import random
+from datetime import date
+from typing import List
+
+import pytest
+
+from intradel_my_container import PickupSeries, vectorized
+
+pytest.importorskip("numpy")
+
+
+def random_series(size: int, sort: bool) -> PickupSeries:
+    generator = random.Random(size)
+    first: int = date(1960, 1, 1).toordinal()
+    ordinals: List[int] = [
+        generator.randrange(first, first + 80 * 365) for _ in range(size)
+    ]
+    if sort:
+        ordinals.sort()
+    kilograms: List[float] = [round(generator.uniform(0, 100), 1) for _ in range(size)]
+    return PickupSeries.from_columns(ordinals, kilograms)
+
+
+@pytest.mark.parametrize("sort", [True, False])
+def test_vectorized_identical(monkeypatch, sort):
+    series = random_series(5_000, sort)
+    assert vectorized.use_numpy(series.ordinals)
+    results = (
+        series.total_kilograms(),
+        series.count_per_year(),
+        series.kilograms_per_year(),
+    )
+    monkeypatch.setattr(vectorized, "NUMPY_AVAILABLE", False)
+    python_series = PickupSeries(series)
+    expected = (
+        python_series.total_kilograms(),
+        python_series.count_per_year(),
+        python_series.kilograms_per_year(),
+    )
+    assert results == expected and [list(result) for result in results[1:]] == [
+        list(result) for result in expected[1:]
+    ]
+
+
+def test_vectorized_small_series():
+    series = random_series(vectorized.NUMPY_MIN_PICKUPS - 1, True)
+    assert not vectorized.use_numpy(series.ordinals)
+
+
+def test_vectorized_empty():
+    assert vectorized.total_kilograms(PickupSeries().kilograms) == 0.0